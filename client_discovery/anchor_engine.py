@@ -0,0 +1,265 @@
+"""
+앵커 매칭 엔진
+템플릿을 한 번만 로드해 회색조/배율 피라미드로 보관하고,
+축소한 회색조 프레임에서 cv2.matchTemplate로 후보를 찾은 뒤 원본 해상도로 검증한다.
+직전에 찾은 위치 주변(ROI 힌트)을 먼저 탐색하고 실패 시 전체 화면으로 넓힌다.
+후보는 템플릿 절반 크기 안의 국소 최대점만, 점수 순으로 최대 max_candidates개까지 검증한다.
+"""
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from .utils import logger, grab_screen
+
+Region = Tuple[int, int, int, int]
+
+
+class AnchorMatch(NamedTuple):
+    """매칭 결과 (pyscreeze Box와 같은 left/top/width/height 순서)"""
+    left: int
+    top: int
+    width: int
+    height: int
+    score: float
+
+
+@dataclass
+class _Template:
+    gray: np.ndarray
+    mtime: float
+    # 배율 → (원본 해상도 템플릿, 축소 프레임용 템플릿)
+    pyramid: Dict[float, Tuple[np.ndarray, Optional[np.ndarray]]] = field(default_factory=dict)
+
+
+class AnchorEngine:
+    """OpenCV 기반 앵커 탐색기 (템플릿 피라미드 캐시 + 최근 위치 힌트)"""
+
+    def __init__(self, config: Optional[dict] = None):
+        engine_cfg = (config or {}).get("anchor_engine", {}) if isinstance(config, dict) else {}
+        self.downscale = float(engine_cfg.get("downscale", 0.5))
+        self.scales: Sequence[float] = tuple(float(s) for s in engine_cfg.get("scales", [1.0])) or (1.0,)
+        self.hint_margin = int(engine_cfg.get("hint_margin", 80))
+        self.coarse_slack = float(engine_cfg.get("coarse_slack", 0.1))
+        self.min_template_px = int(engine_cfg.get("min_template_px", 8))
+        self.max_candidates = max(1, int(engine_cfg.get("max_candidates", 64)))
+
+        self._templates: Dict[str, _Template] = {}
+        self._last_hits: Dict[str, Region] = {}
+        self._frame_ref = None
+        self._frame_gray: Optional[np.ndarray] = None
+        self._frame_small: Optional[np.ndarray] = None
+
+    # === 템플릿/프레임 준비 ===
+
+    def _load_template(self, path: str) -> Optional[_Template]:
+        """템플릿을 회색조 + 배율 피라미드로 캐시 (파일이 바뀌면 다시 로드)"""
+        file_path = Path(path)
+        if not file_path.exists():
+            logger.warning(f"앵커 이미지가 없습니다: {path}")
+            return None
+
+        mtime = file_path.stat().st_mtime
+        cached = self._templates.get(path)
+        if cached is not None and cached.mtime == mtime:
+            return cached
+
+        gray = cv2.imread(str(file_path), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            logger.warning(f"앵커 이미지를 읽을 수 없습니다: {path}")
+            return None
+
+        template = _Template(gray=gray, mtime=mtime)
+        for scale in self.scales:
+            full = gray if scale == 1.0 else cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            small_factor = scale * self.downscale
+            small = None
+            if min(gray.shape[:2]) * small_factor >= self.min_template_px and self.downscale < 1.0:
+                small = cv2.resize(gray, None, fx=small_factor, fy=small_factor, interpolation=cv2.INTER_AREA)
+            template.pyramid[scale] = (full, small)
+
+        self._templates[path] = template
+        return template
+
+    def _prepare_frame(self, frame: Optional[np.ndarray]) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """프레임의 회색조/축소본을 프레임 단위로 한 번만 계산"""
+        if frame is None:
+            frame = grab_screen()
+            if frame is None:
+                return None, None
+
+        if self._frame_ref is not None and self._frame_ref() is frame:
+            return self._frame_gray, self._frame_small
+
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        small = None
+        if self.downscale < 1.0:
+            small = cv2.resize(gray, None, fx=self.downscale, fy=self.downscale, interpolation=cv2.INTER_AREA)
+
+        try:
+            self._frame_ref = weakref.ref(frame)
+        except TypeError:
+            self._frame_ref = None
+        self._frame_gray, self._frame_small = gray, small
+        return gray, small
+
+    # === 매칭 ===
+
+    def _candidates(self, gray: np.ndarray, small: Optional[np.ndarray], template: _Template,
+                    region: Optional[Region], threshold: float) -> List[Tuple[float, int, int, float]]:
+        """(점수, x, y, 배율) 후보 목록 - 축소 프레임에서 1차 탐색"""
+        x0, y0, x1, y1 = _clip_region(region, gray.shape)
+        candidates = []
+
+        for scale, (full, small_tmpl) in template.pyramid.items():
+            if small is not None and small_tmpl is not None:
+                f = self.downscale
+                area = small[int(y0 * f):int(y1 * f), int(x0 * f):int(x1 * f)]
+                if area.shape[0] < small_tmpl.shape[0] or area.shape[1] < small_tmpl.shape[1]:
+                    continue
+                result = cv2.matchTemplate(area, small_tmpl, cv2.TM_CCOEFF_NORMED)
+                ys, xs = _peaks(result, threshold - self.coarse_slack, small_tmpl.shape, self.max_candidates)
+                for y, x in zip(ys, xs):
+                    candidates.append((float(result[y, x]), int(x / f) + x0, int(y / f) + y0, scale))
+            else:
+                area = gray[y0:y1, x0:x1]
+                if area.shape[0] < full.shape[0] or area.shape[1] < full.shape[1]:
+                    continue
+                result = cv2.matchTemplate(area, full, cv2.TM_CCOEFF_NORMED)
+                ys, xs = _peaks(result, threshold, full.shape, self.max_candidates)
+                for y, x in zip(ys, xs):
+                    candidates.append((float(result[y, x]), int(x) + x0, int(y) + y0, scale))
+
+        candidates.sort(key=lambda c: c[0], reverse=True)
+        return candidates[:self.max_candidates]
+
+    def _refine(self, gray: np.ndarray, template: _Template, x: int, y: int, scale: float) -> AnchorMatch:
+        """축소 탐색 후보를 원본 해상도 주변에서 재매칭"""
+        full = template.pyramid[scale][0]
+        height, width = full.shape[:2]
+        pad = max(2, int(round(1 / self.downscale)) + 1) if self.downscale < 1.0 else 0
+        x0, y0 = max(0, x - pad), max(0, y - pad)
+        x1, y1 = min(gray.shape[1], x + width + pad), min(gray.shape[0], y + height + pad)
+        area = gray[y0:y1, x0:x1]
+        if area.shape[0] < height or area.shape[1] < width:
+            return AnchorMatch(x, y, width, height, 0.0)
+
+        result = cv2.matchTemplate(area, full, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (dx, dy) = cv2.minMaxLoc(result)
+        return AnchorMatch(x0 + dx, y0 + dy, width, height, float(score))
+
+    def _search(self, gray, small, template, region, confidence, limit) -> List[AnchorMatch]:
+        matches: List[AnchorMatch] = []
+        tried: List[AnchorMatch] = []
+        for _, x, y, scale in self._candidates(gray, small, template, region, confidence):
+            if any(_overlaps(x, y, m) for m in tried):
+                continue
+            match = self._refine(gray, template, x, y, scale)
+            tried.append(match._replace(left=x, top=y))
+            if match.score < confidence or any(_overlaps(match.left, match.top, m) for m in matches):
+                continue
+            matches.append(match)
+            if limit and len(matches) >= limit:
+                break
+        return matches
+
+    def locate(self, image_path: str, frame: Optional[np.ndarray] = None, confidence: float = 0.8,
+               region: Optional[Region] = None) -> Optional[AnchorMatch]:
+        """앵커 한 개 탐색 (직전 위치 주변 → 지정 영역/전체 순)"""
+        template = self._load_template(image_path)
+        if template is None:
+            return None
+        gray, small = self._prepare_frame(frame)
+        if gray is None:
+            return None
+
+        # 힌트는 지정 영역과 겹치는 부분만 (겹치지 않으면 건너뜀)
+        hint = _intersect(self._hint_region(image_path), region)
+        for search_region in ([hint] if hint else []) + [region]:
+            found = self._search(gray, small, template, search_region, confidence, limit=1)
+            if found:
+                self._last_hits[image_path] = found[0][:4]
+                return found[0]
+        return None
+
+    def locate_all(self, image_path: str, frame: Optional[np.ndarray] = None, confidence: float = 0.8,
+                   region: Optional[Region] = None) -> List[AnchorMatch]:
+        """앵커 전체 탐색 (비최대 억제로 겹치는 후보 제거)"""
+        template = self._load_template(image_path)
+        if template is None:
+            return []
+        gray, small = self._prepare_frame(frame)
+        if gray is None:
+            return []
+
+        matches = self._search(gray, small, template, region, confidence, limit=0)
+        if matches:
+            self._last_hits[image_path] = matches[0][:4]
+        return sorted(matches, key=lambda m: (m.top, m.left))
+
+    def _hint_region(self, image_path: str) -> Optional[Region]:
+        last = self._last_hits.get(image_path)
+        if not last:
+            return None
+        x, y, width, height = last
+        margin = self.hint_margin
+        return x - margin, y - margin, width + margin * 2, height + margin * 2
+
+    def forget(self, image_path: Optional[str] = None):
+        """ROI 힌트 초기화 (레이아웃이 바뀌었을 때)"""
+        if image_path is None:
+            self._last_hits.clear()
+        else:
+            self._last_hits.pop(image_path, None)
+
+
+def _clip_region(region: Optional[Region], shape: Tuple[int, ...]) -> Tuple[int, int, int, int]:
+    height, width = shape[:2]
+    if not region:
+        return 0, 0, width, height
+    x, y, w, h = region
+    return max(0, int(x)), max(0, int(y)), min(width, int(x + w)), min(height, int(y + h))
+
+
+def _intersect(hint: Optional[Region], region: Optional[Region]) -> Optional[Region]:
+    """힌트 영역과 지정 영역의 교집합 (지정 영역이 없으면 힌트 그대로, 겹치지 않으면 None)"""
+    if not hint or not region:
+        return hint
+    x0, y0 = max(hint[0], region[0]), max(hint[1], region[1])
+    x1 = min(hint[0] + hint[2], region[0] + region[2])
+    y1 = min(hint[1] + hint[3], region[1] + region[3])
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return x0, y0, x1 - x0, y1 - y0
+
+
+def _peaks(result: np.ndarray, threshold: float, template_shape: Tuple[int, ...],
+           limit: int) -> Tuple[np.ndarray, np.ndarray]:
+    """임계값 이상인 국소 최대점 좌표를 점수 높은 순으로 최대 limit개 (평탄한 화면의 후보 폭증 방지)"""
+    height, width = template_shape[:2]
+    kernel = np.ones((max(1, height // 2), max(1, width // 2)), np.uint8)
+    mask = (result >= threshold) & (result >= cv2.dilate(result, kernel))
+    ys, xs = np.nonzero(mask)
+    if len(ys) > limit:
+        top = np.argsort(-result[ys, xs], kind="stable")[:limit]
+        ys, xs = ys[top], xs[top]
+    return ys, xs
+
+
+def _overlaps(x: int, y: int, match: AnchorMatch) -> bool:
+    """후보 좌상단이 기존 매칭 박스의 절반 크기 이내이면 같은 앵커로 간주"""
+    return abs(x - match.left) < match.width / 2 and abs(y - match.top) < match.height / 2
+
+
+_default_engine: Optional[AnchorEngine] = None
+
+
+def get_anchor_engine(config: Optional[dict] = None) -> AnchorEngine:
+    """프로세스 전역 앵커 엔진 (템플릿 캐시와 ROI 힌트 공유)"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = AnchorEngine(config)
+    return _default_engine
@@ -0,0 +1,106 @@
+"""
+리뷰 많은순 목록에서 리뷰 범위 구간 찾기
+정렬된 목록은 리뷰 수가 단조 감소하므로,
+화면 전체가 review_max 초과이면 스크롤 폭을 두 배씩 늘려 건너뛰고(갤럽),
+review_min 미만으로 넘어가면 마지막 두 위치 사이를 이분 탐색하며,
+범위 구간을 지나 review_min 아래로 내려가면 키워드를 종료한다.
+"""
+from typing import List, Optional
+
+from .utils import logger
+
+ABOVE = "above"
+BELOW = "below"
+IN_BAND = "in_band"
+UNKNOWN = "unknown"
+
+
+class ReviewBandSeeker:
+    """화면별 리뷰 수로 다음 스크롤 이동량(스텝 단위)을 결정"""
+
+    def __init__(self, config):
+        search_cfg = config.get("search", {}) if isinstance(config, dict) else {}
+        seek_cfg = search_cfg.get("band_seek", {})
+        self.review_min = int(search_cfg.get("review_min", 0))
+        self.review_max = int(search_cfg.get("review_max", 0))
+        self.enabled = bool(seek_cfg.get("enabled", True))
+        self.max_gallop_steps = int(seek_cfg.get("max_gallop_steps", 8))
+        self.reset()
+
+    def reset(self):
+        """키워드 시작 시 초기화"""
+        self.position = 0
+        self.step = 1
+        self.above_at: Optional[int] = None
+        self.below_at: Optional[int] = None
+        self.band_at: Optional[int] = None
+        self.band_reached = False
+        self._last_counts: Optional[List[int]] = None
+        self._last_move = 0
+
+    def classify(self, counts: List[int]) -> str:
+        """화면의 리뷰 수 목록 → 범위 위/안/아래 판정"""
+        if not counts:
+            return UNKNOWN
+        if any(self.review_min <= count <= self.review_max for count in counts):
+            return IN_BAND
+        if all(count > self.review_max for count in counts):
+            return ABOVE
+        # 모두 review_min 미만이거나, 범위를 건너뛰어 위/아래가 섞인 경우 (범위 구간이 비어 있음)
+        return BELOW
+
+    def moved(self, steps: int):
+        """일반 스크롤 등 외부 이동 반영"""
+        self.position += steps
+
+    def next_move(self, counts: List[int]) -> Optional[int]:
+        """이동할 스텝 수 (0=이 화면 처리, 양수=아래, 음수=위, None=키워드 종료)"""
+        state = self.classify(counts)
+
+        if self._last_move and counts and counts == self._last_counts:
+            logger.info("스크롤해도 화면이 바뀌지 않아 목록 끝으로 판단합니다.")
+            return None
+        self._last_counts = list(counts)
+
+        if state == IN_BAND:
+            # 건너뛰다 범위 안에 떨어졌으면 그 위에 범위 카드가 더 있을 수 있으므로 첫 위치를 이분 탐색
+            if not self.band_reached and self.above_at is not None and self.position - self.above_at > 1:
+                self.band_at = self.position
+                return self._bisect()
+            self.band_reached = True
+            return self._move(0)
+
+        if state == UNKNOWN or (state == ABOVE and self.band_reached):
+            return self._move(0)
+
+        if state == BELOW:
+            if self.band_reached or self.above_at is None:
+                logger.info(f"리뷰 {self.review_min} 미만 구간 도달 - 키워드 종료")
+                return None
+            self.below_at = self.position
+            return self._bisect()
+
+        # ABOVE: 범위보다 위 - 아래 경계를 모르면 갤럽, 알면 이분 탐색
+        self.above_at = self.position
+        if self.below_at is None and self.band_at is None:
+            move = self.step
+            self.step = min(self.step * 2, self.max_gallop_steps)
+            logger.info(f"리뷰 {self.review_max} 초과 구간 건너뛰기: {move}스텝")
+            return self._move(move)
+        return self._bisect()
+
+    def _bisect(self) -> Optional[int]:
+        """above_at(범위 위)과 첫 범위/아래 위치 사이를 반으로 좁힘"""
+        upper = min(p for p in (self.band_at, self.below_at) if p is not None)
+        if upper - self.above_at <= 1:
+            if upper == self.band_at:
+                return self._move(self.band_at - self.position)
+            logger.info("리뷰 범위에 해당하는 카드가 없어 키워드 종료")
+            return None
+        middle = (self.above_at + upper) // 2
+        return self._move(middle - self.position)
+
+    def _move(self, steps: int) -> int:
+        self.position += steps
+        self._last_move = steps
+        return steps
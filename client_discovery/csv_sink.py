@@ -0,0 +1,143 @@
+"""
+버퍼링 CSV 기록기
+결과 CSV를 열어 둔 채로 행을 모아 두었다가 행 수/시간 간격/종료 시점에 한꺼번에 기록한다.
+  - 날짜 경로는 자정을 넘을 때만 다시 계산 (자정 이후 행은 다음 날짜 파일로)
+  - 파일의 행 수는 처음 한 번만 세고 이후에는 누적 값으로 유지
+  - durability "row": 행마다 flush + fsync, "batch": 모아서 쓰고 한 번에 fsync
+  - 행별 on_flushed 콜백은 그 행이 디스크에 기록(fsync)된 뒤에 호출 (중복 색인 저장 등)
+(config.json "output": {"flush_rows", "flush_interval_sec", "durability"})
+"""
+import csv
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+from .utils import logger
+
+DURABILITY_MODES = ("row", "batch")
+
+
+class BufferedCsvSink:
+    """날짜별 결과 CSV 버퍼링 기록기 (백그라운드 스레드가 주기적으로 flush)"""
+
+    def __init__(self, output_dir, csv_pattern: str, headers: Sequence[str], flush_rows: int = 20,
+                 flush_interval: float = 5.0, durability: str = "batch",
+                 clock: Callable[[], datetime] = datetime.now):
+        self.output_dir = Path(output_dir)
+        self.csv_pattern = csv_pattern
+        self.headers = list(headers)
+        self.flush_rows = max(1, int(flush_rows))
+        self.flush_interval = float(flush_interval)
+        if durability not in DURABILITY_MODES:
+            logger.warning(f"알 수 없는 durability '{durability}' - batch 사용")
+            durability = "batch"
+        self.durability = durability
+        self._clock = clock
+
+        self._lock = threading.RLock()
+        self._buffer: List[Sequence] = []
+        self._callbacks: List[Callable[[], None]] = []
+        self._file = None
+        self._writer = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._switch_date(self._clock())
+
+    # === 날짜 경로 ===
+
+    def _switch_date(self, now: datetime):
+        """현재 날짜 파일로 전환하고 다음 자정 시각/기존 행 수 갱신"""
+        self.path = self.output_dir / self.csv_pattern.format(date=now.strftime("%Y%m%d"))
+        self._next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        self.row_count = self._count_rows(self.path)
+
+    @staticmethod
+    def _count_rows(path: Path) -> int:
+        """기존 파일의 데이터 행 수 (헤더 제외) - 파일 전환 시 한 번만"""
+        if not path.exists():
+            return 0
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+        except Exception as e:
+            logger.error(f"기존 스토어 수 계산 실패: {e}")
+            return 0
+
+    # === 기록 ===
+
+    def append(self, row: Sequence, on_flushed: Optional[Callable[[], None]] = None):
+        """행 추가 (row 모드는 즉시 기록, batch 모드는 버퍼에 모음)"""
+        with self._lock:
+            now = self._clock()
+            if now >= self._next_midnight:
+                # 자정 이전 행은 이전 날짜 파일에 마저 쓰고 새 파일로 전환
+                self._flush_locked()
+                self._close_file()
+                self._switch_date(now)
+            self._buffer.append(row)
+            if on_flushed is not None:
+                self._callbacks.append(on_flushed)
+            self.row_count += 1
+            if self.durability == "row" or len(self._buffer) >= self.flush_rows:
+                self._flush_locked()
+            else:
+                self._ensure_flusher()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._file)
+            if self._file.tell() == 0:
+                self._writer.writerow(self.headers)
+        self._writer.writerows(self._buffer)
+        self._buffer = []
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"CSV 기록 후 처리 실패: {e}")
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    # === 백그라운드 flush ===
+
+    def _ensure_flusher(self):
+        if self._thread is None and self.flush_interval > 0:
+            self._thread = threading.Thread(target=self._flush_loop, name="csv-sink-flush", daemon=True)
+            self._thread.start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"CSV 주기 기록 실패: {e}")
+
+    def close(self):
+        """남은 행 기록 후 파일 닫기"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 1)
+            self._thread = None
+        with self._lock:
+            try:
+                self._flush_locked()
+            finally:
+                self._close_file()
@@ -0,0 +1,298 @@
+"""
+날짜/실행을 넘는 중복 제거 색인
+저장한 스토어의 정규화 URL/이름 키를 SQLite 파일(키 유일 색인)에 보관하고,
+메모리 Bloom 필터를 앞에 두어 처음 보는 스토어(대부분의 조회)는 디스크를 읽지 않고 바로 판정한다.
+  - Bloom 비트는 종료 시 파일로 저장하고, 다음 실행에서는 저장 이후 추가된 행만 다시 넣는다
+  - 결과 CSV는 파일별로 읽은 크기를 기록해 새로 생긴/늘어난 파일만 가져온다
+  - 스토어명 키의 LSH 밴드 키도 같은 파일(name_bands)에 두어 유사 이름 후보를 디스크에서 바로 조회한다
+(config.json "dedupe": {"index_file", "bloom_capacity", "bloom_error_rate"})
+"""
+import csv
+import hashlib
+import math
+import sqlite3
+import struct
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from .models import is_unreadable_store_name
+from .utils import logger
+
+# 스토어 ID가 경로 첫 부분인 네이버 스토어 호스트
+STORE_HOSTS = {"smartstore.naver.com", "brand.naver.com"}
+TRACKING_PARAMS = {"napm", "nacn", "nl-query", "nl-ts-pid", "nl-au", "fbclid", "gclid", "src", "ref", "tr"}
+TRACKING_PREFIXES = ("utm_", "n_", "nt_")
+
+BLOOM_MAGIC = b"CDBF"
+BLOOM_HEADER = struct.Struct("<4sQIq")  # magic, 비트 수, 해시 수, 반영한 마지막 rowid
+
+
+def canonical_store_url(url: Optional[str]) -> Optional[str]:
+    """스토어 URL 정규화 (스킴/모바일 접두어/추적 파라미터 제거, 호스트/스토어 ID 소문자)"""
+    if not url or not isinstance(url, str):
+        return None
+    text = url.strip()
+    if "://" not in text:
+        text = "https://" + text
+    try:
+        parts = urlsplit(text)
+    except ValueError:
+        return None
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    if not host:
+        return None
+
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if host in STORE_HOSTS and segments:
+        # 상품/카테고리 페이지도 같은 스토어로 취급
+        return f"{host}/{segments[0].lower()}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=False)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    path = "/".join(segments)
+    return f"{host}/{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def canonical_store_name(name: Optional[str]) -> Optional[str]:
+    """스토어명 정규화 (전각/호환 문자 통일, 공백 제거, 소문자) - 임시/판독 불가 이름은 None"""
+    if is_unreadable_store_name(name):
+        return None
+    normalized = "".join(unicodedata.normalize("NFKC", name).split()).lower()
+    return normalized or None
+
+
+def dedupe_keys(store_url: Optional[str] = None, store_name: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+    url = canonical_store_url(store_url)
+    name = canonical_store_name(store_name)
+    return (f"u:{url}" if url else None), (f"n:{name}" if name else None)
+
+
+class BloomFilter:
+    """비트 배열 Bloom 필터 (blake2b 이중 해싱)"""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001,
+                 size: Optional[int] = None, hashes: Optional[int] = None):
+        capacity = max(1, int(capacity))
+        self.size = size or max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = hashes or max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first, second = struct.unpack("<QQ", digest)
+        second |= 1
+        for i in range(self.hashes):
+            yield (first + i * second) % self.size
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class DedupeIndex:
+    """SQLite 키 저장소 + Bloom 필터 앞단"""
+
+    def __init__(self, path, capacity: int = 2_000_000, error_rate: float = 0.001):
+        self.path = str(path)
+        self.in_memory = self.path == ":memory:"
+        self.bloom_path = None if self.in_memory else Path(self.path).with_suffix(".bloom")
+        self.capacity = int(capacity)
+        self.error_rate = float(error_rate)
+        self._lock = threading.Lock()
+
+        if not self.in_memory:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS seen (id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS imported (file TEXT PRIMARY KEY, size INTEGER NOT NULL)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS name_bands (band INTEGER NOT NULL, bucket BLOB NOT NULL, "
+                         "seen_id INTEGER NOT NULL, PRIMARY KEY (band, bucket, seen_id)) WITHOUT ROWID")
+        self._db.commit()
+        self.bloom, self._bloom_rowid = self._load_bloom()
+
+    # === Bloom 필터 ===
+
+    def _last_rowid(self) -> int:
+        return self._db.execute("SELECT COALESCE(MAX(id), 0) FROM seen").fetchone()[0]
+
+    def _load_bloom(self) -> Tuple[BloomFilter, int]:
+        """저장해 둔 비트를 읽고, 그 이후 추가된 행만 반영 (용량을 넘었으면 새로 구성)"""
+        rows = self._last_rowid()
+        capacity = max(self.capacity, rows * 2)
+        bloom, last_rowid = None, 0
+        if self.bloom_path is not None and self.bloom_path.exists():
+            try:
+                with open(self.bloom_path, 'rb') as f:
+                    magic, size, hashes, last_rowid = BLOOM_HEADER.unpack(f.read(BLOOM_HEADER.size))
+                    bits = f.read()
+                # 색인 파일을 새로 만든 경우(rowid가 줄어듦)에는 비트를 버리고 다시 구성
+                if (magic == BLOOM_MAGIC and len(bits) == (size + 7) // 8 and last_rowid <= rows
+                        and rows <= self.capacity_of(size)):
+                    bloom = BloomFilter(size=size, hashes=hashes)
+                    bloom.bits = bytearray(bits)
+            except Exception as e:
+                logger.warning(f"중복 색인 Bloom 파일 읽기 실패: {e}")
+                bloom = None
+        if bloom is None:
+            bloom, last_rowid = BloomFilter(capacity, self.error_rate), 0
+
+        added = 0
+        for rowid, key in self._db.execute("SELECT id, key FROM seen WHERE id > ? ORDER BY id", (last_rowid,)):
+            bloom.add(key)
+            last_rowid = rowid
+            added += 1
+        if added:
+            logger.info(f"중복 색인 Bloom 필터 갱신: {added}개 반영")
+        return bloom, last_rowid
+
+    def capacity_of(self, size: int) -> int:
+        """비트 수로 오탐률을 지킬 수 있는 최대 항목 수"""
+        return int(size * (math.log(2) ** 2) / -math.log(self.error_rate))
+
+    # === 조회/추가 ===
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def __contains__(self, key: Optional[str]) -> bool:
+        if not key or key not in self.bloom:
+            return False
+        # Bloom 필터 양성은 오탐일 수 있으므로 디스크 색인으로 확인
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM seen WHERE key = ?", (key,)).fetchone() is not None
+
+    def add_many(self, keys: Iterable[Optional[str]]) -> int:
+        new_keys = [key for key in dict.fromkeys(keys) if key]
+        if not new_keys:
+            return 0
+        with self._lock:
+            before = self._db.total_changes
+            self._db.executemany("INSERT OR IGNORE INTO seen (key) VALUES (?)", [(key,) for key in new_keys])
+            self._db.commit()
+            added = self._db.total_changes - before
+        for key in new_keys:
+            self.bloom.add(key)
+        return added
+
+    def add(self, key: Optional[str]) -> bool:
+        return self.add_many([key]) > 0
+
+    def keys_with_prefix(self, prefix: str) -> List[str]:
+        """접두어("u:"/"n:")로 시작하는 키 전체 (키 색인 범위 조회)"""
+        return [key for _, key in self.rows_with_prefix(prefix)]
+
+    def rows_with_prefix(self, prefix: str, after_id: int = 0) -> List[Tuple[int, str]]:
+        """접두어로 시작하고 rowid가 after_id보다 큰 (rowid, 키) 목록"""
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with self._lock:
+            return self._db.execute("SELECT id, key FROM seen WHERE key >= ? AND key < ? AND id > ? ORDER BY id",
+                                    (prefix, upper, after_id)).fetchall()
+
+    # === 스토어명 LSH 밴드 ===
+
+    def _meta(self, name: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def sync_name_bands(self, params: str, band_keys: Callable[[str], List[bytes]]) -> int:
+        """지난번 이후 추가된 스토어명 키의 밴드 키만 저장 (MinHash 파라미터가 바뀌었으면 전부 다시 계산)"""
+        with self._lock:
+            last_id = int(self._meta("name_bands_rowid") or 0)
+            if self._meta("name_bands_params") != params:
+                self._db.execute("DELETE FROM name_bands")
+                last_id = 0
+        rows = self.rows_with_prefix("n:", last_id)
+        if not rows and last_id:
+            return 0
+        bands = [(band, bucket, rowid) for rowid, key in rows for band, bucket in enumerate(band_keys(key[2:]))]
+        with self._lock:
+            self._db.executemany("INSERT OR IGNORE INTO name_bands (band, bucket, seen_id) VALUES (?, ?, ?)", bands)
+            self._db.executemany("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", [
+                ("name_bands_params", params),
+                ("name_bands_rowid", str(rows[-1][0] if rows else last_id)),
+            ])
+            self._db.commit()
+        return len(rows)
+
+    def name_band_candidates(self, band_keys: List[bytes]) -> List[str]:
+        """밴드 키가 하나라도 같은 저장된 스토어명 (필요한 버킷만 디스크에서 조회)"""
+        if not band_keys:
+            return []
+        where = " OR ".join(["(b.band = ? AND b.bucket = ?)"] * len(band_keys))
+        params = [value for band, bucket in enumerate(band_keys) for value in (band, bucket)]
+        with self._lock:
+            rows = self._db.execute(f"SELECT DISTINCT s.key FROM name_bands b JOIN seen s ON s.id = b.seen_id "
+                                    f"WHERE {where}", params).fetchall()
+        return [row[0][2:] for row in rows]
+
+    # === 결과 CSV 가져오기 ===
+
+    def import_csv_files(self, paths: Iterable[Path]) -> int:
+        """새로 생겼거나 커진 결과 CSV만 읽어 URL/이름 키 추가"""
+        added = 0
+        for csv_path in sorted(Path(p) for p in paths):
+            try:
+                size = csv_path.stat().st_size
+                row = self._db.execute("SELECT size FROM imported WHERE file = ?", (csv_path.name,)).fetchone()
+                if row and row[0] == size:
+                    continue
+                keys = []
+                with open(csv_path, 'r', encoding='utf-8') as f:
+                    for record in csv.DictReader(f):
+                        keys.extend(dedupe_keys(record.get("store_url"), record.get("store_name")))
+                added += self.add_many(keys)
+                with self._lock:
+                    self._db.execute("INSERT OR REPLACE INTO imported (file, size) VALUES (?, ?)", (csv_path.name, size))
+                    self._db.commit()
+            except Exception as e:
+                logger.warning(f"결과 CSV 색인 실패 ({csv_path}): {e}")
+        return added
+
+    # === 저장/종료 ===
+
+    def save(self):
+        """Bloom 비트 저장 (임시 파일에 쓴 뒤 교체)"""
+        if self.bloom_path is None:
+            return
+        with self._lock:
+            last_rowid = self._last_rowid()
+        if last_rowid == self._bloom_rowid and self.bloom_path.exists():
+            return
+        try:
+            temp_path = self.bloom_path.with_suffix(".bloom.tmp")
+            with open(temp_path, 'wb') as f:
+                f.write(BLOOM_HEADER.pack(BLOOM_MAGIC, self.bloom.size, self.bloom.hashes, last_rowid))
+                f.write(self.bloom.bits)
+            temp_path.replace(self.bloom_path)
+            self._bloom_rowid = last_rowid
+        except Exception as e:
+            logger.warning(f"중복 색인 Bloom 저장 실패: {e}")
+
+    def clear(self):
+        """색인 비우기 (벤치마크 반복용)"""
+        with self._lock:
+            self._db.execute("DELETE FROM seen")
+            self._db.execute("DELETE FROM imported")
+            self._db.execute("DELETE FROM name_bands")
+            self._db.execute("DELETE FROM meta")
+            self._db.commit()
+        self.bloom = BloomFilter(self.capacity, self.error_rate)
+        self._bloom_rowid = 0
+
+    def close(self):
+        self.save()
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,383 @@
+"""
+Playwright DOM 백엔드
+UINavigator / ListScanner / DetailReader와 같은 인터페이스로
+스토어명·리뷰 수·관심고객 수·URL을 화면 OCR 대신 페이지 DOM에서 바로 읽는다.
+(config.json "backend": {"mode": "playwright"} 로 선택)
+"""
+import re
+import urllib.parse
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+from .models import StoreCard
+from .ocr_pipeline import DetailOcrJob, completed
+from .utils import logger
+
+DEFAULT_SELECTORS = {
+    "card": "div[class*='basicList_item__'], div[class*='product_item__'], li[class*='mall_item']",
+    "card_link": "a[class*='basicList_mall__'], a[class*='product_mall__'], a[class*='mall_link']",
+    "store_name": "a[class*='basicList_mall__'], a[class*='product_mall__'], [class*='mall_name']",
+    "review_count": "[class*='basicList_etc__'], [class*='product_etc__'], [class*='review']",
+    "detail_store_name": "meta[property='og:title'], [class*='store_name'], h1",
+    "interest_count": "[class*='interest'], [class*='follower'], [class*='zzim']",
+    "block_page": "div.content_error",
+}
+
+REVIEW_PATTERN = re.compile(r'리뷰\s*([0-9][0-9,.]*\s*만?)')
+INTEREST_PATTERN = re.compile(r'(?:관심고객수?|찜)\s*([0-9][0-9,.]*\s*만?)')
+
+# 화면에 보이는 카드만 (outerHTML + 화면 좌표) 수집 - RPA 스캐너의 '가시 카드'와 같은 의미
+VISIBLE_CARDS_JS = """
+(selector) => Array.from(document.querySelectorAll(selector))
+    .map((el) => { const r = el.getBoundingClientRect();
+                   return {html: el.outerHTML, x: r.left, y: r.top, width: r.width, height: r.height}; })
+    .filter((c) => c.height > 0 && c.y + c.height > 0 && c.y < window.innerHeight)
+"""
+
+# 목록 상태 (전체 카드 수, 스크롤 위치) - 스크롤 전후 비교용
+LIST_STATE_JS = "(selector) => [document.querySelectorAll(selector).length, window.scrollY]"
+
+# 스크롤 뒤 지연 로딩 완료: 카드가 늘었거나, 스크롤이 반영됐고 아직 목록 바닥이 아니라 더 불러올 필요가 없음
+MORE_CARDS_JS = """
+([selector, count, scrollY]) => document.querySelectorAll(selector).length > count
+    || (window.scrollY !== scrollY
+        && window.scrollY + window.innerHeight < document.documentElement.scrollHeight - 200)
+"""
+
+
+def backend_config(config: dict) -> dict:
+    return config.get("backend", {}) if isinstance(config, dict) else {}
+
+
+def get_selectors(config: dict) -> Dict[str, str]:
+    """기본 셀렉터에 config.json backend.selectors 덮어쓰기"""
+    selectors = dict(DEFAULT_SELECTORS)
+    selectors.update({k: v for k, v in backend_config(config).get("selectors", {}).items() if v})
+    return selectors
+
+
+# === HTML 파싱 (브라우저 없이 테스트 가능) ===
+
+def parse_count(text: Optional[str]) -> Optional[int]:
+    """'1,234' / '1.2만' / '리뷰 987' 형태의 숫자 파싱"""
+    if not text:
+        return None
+    match = re.search(r'([0-9][0-9,.]*)\s*(만)?', text)
+    if not match:
+        return None
+    number = match.group(1).replace(',', '').rstrip('.')
+    try:
+        value = float(number) if match.group(2) else int(number)
+    except ValueError:
+        return None
+    return int(round(value * 10000)) if match.group(2) else value
+
+
+def _labelled_count(element, selector: str, pattern: re.Pattern) -> Optional[int]:
+    """셀렉터로 찾은 요소들 → 카드 전체 텍스트 순으로 '라벨 + 숫자' 검색"""
+    texts = [node.get_text(" ", strip=True) for node in element.select(selector)] if selector else []
+    texts.append(element.get_text(" ", strip=True))
+    for text in texts:
+        match = pattern.search(text)
+        if match:
+            return parse_count(match.group(1))
+    return None
+
+
+def parse_card(element, selectors: Dict[str, str], base_url: str = "") -> Optional[StoreCard]:
+    """카드 요소 하나 → StoreCard (좌표는 호출 측에서 채움)"""
+    name_node = element.select_one(selectors["store_name"])
+    store_name = name_node.get_text(" ", strip=True) if name_node else None
+
+    link = element.select_one(selectors["card_link"]) or element.find("a", href=True)
+    url = urllib.parse.urljoin(base_url, link["href"]) if link and link.get("href") else None
+
+    review_count = _labelled_count(element, selectors["review_count"], REVIEW_PATTERN)
+    if not store_name and review_count is None:
+        return None
+    return StoreCard(x=0, y=0, width=0, height=0, store_name=store_name, review_count=review_count, url=url)
+
+
+def parse_list_html(html: str, selectors: Optional[Dict[str, str]] = None, base_url: str = "") -> List[StoreCard]:
+    """검색 결과 HTML의 모든 카드 파싱"""
+    selectors = selectors or DEFAULT_SELECTORS
+    soup = BeautifulSoup(html, "html.parser")
+    cards = [parse_card(element, selectors, base_url) for element in soup.select(selectors["card"])]
+    return [card for card in cards if card is not None]
+
+
+def parse_detail_html(html: str, selectors: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """스토어 상세 HTML → {"store_name", "interest_count"}"""
+    selectors = selectors or DEFAULT_SELECTORS
+    soup = BeautifulSoup(html, "html.parser")
+
+    store_name = None
+    for node in soup.select(selectors["detail_store_name"]):
+        text = node.get("content") if node.name == "meta" else node.get_text(" ", strip=True)
+        if text and text.strip():
+            store_name = text.split(":")[0].strip()
+            break
+
+    body = soup.body or soup
+    return {
+        "store_name": store_name,
+        "interest_count": _labelled_count(body, selectors["interest_count"], INTEREST_PATTERN),
+    }
+
+
+def scroll_load_timeout(config: dict) -> int:
+    """스크롤 후 지연 로딩 카드를 기다리는 최대 시간(ms)"""
+    return int(backend_config(config).get("scroll_load_timeout_ms", 3000))
+
+
+def is_blocked_html(html: str, selectors: Optional[Dict[str, str]] = None) -> bool:
+    selectors = selectors or DEFAULT_SELECTORS
+    return BeautifulSoup(html, "html.parser").select_one(selectors["block_page"]) is not None
+
+
+# === Playwright 세션/백엔드 ===
+
+class PlaywrightSession:
+    """목록 페이지 + 상세용 페이지 하나를 유지하는 브라우저 세션 (처음 사용할 때 실행)"""
+
+    def __init__(self, config):
+        self.config = config
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._list_page = None
+        self._detail_page = None
+
+    def _start(self):
+        from playwright.sync_api import sync_playwright
+
+        backend_cfg = backend_config(self.config)
+        self._playwright = sync_playwright().start()
+        try:
+            self._browser = self._playwright.chromium.launch(headless=bool(backend_cfg.get("headless", True)))
+        except Exception:
+            self.close()
+            raise
+
+        storage_state = backend_cfg.get("storage_state", "playwright/storage_state.json")
+        context_kwargs = {"storage_state": storage_state} if storage_state and Path(storage_state).exists() else {}
+        self._context = self._browser.new_context(**context_kwargs)
+        self._context.set_default_timeout(int(backend_cfg.get("timeout_ms", 15000)))
+        logger.info("Playwright 세션 시작")
+
+    @property
+    def list_page(self):
+        if self._list_page is None:
+            if self._context is None:
+                self._start()
+            self._list_page = self._context.new_page()
+        return self._list_page
+
+    @property
+    def detail_page(self):
+        if self._detail_page is None:
+            if self._context is None:
+                self._start()
+            self._detail_page = self._context.new_page()
+        return self._detail_page
+
+    def close(self):
+        try:
+            if self._context is not None:
+                self._context.close()
+            if self._browser is not None:
+                self._browser.close()
+            if self._playwright is not None:
+                self._playwright.stop()
+        except Exception as e:
+            logger.debug(f"Playwright 세션 종료 실패(무시): {e}")
+        finally:
+            self._playwright = self._browser = self._context = None
+            self._list_page = self._detail_page = None
+
+
+class DomNavigator:
+    """UINavigator 대응 - 검색 URL 이동과 스크롤"""
+
+    def __init__(self, config, session: PlaywrightSession):
+        self.config = config
+        self.session = session
+        self.review_sorted = False
+
+    @property
+    def selectors(self) -> Dict[str, str]:
+        return get_selectors(self.config)
+
+    def prepare_keyword_run(self, keyword: str) -> bool:
+        """키워드 검색 결과(리뷰 많은순)로 이동하고 카드가 뜰 때까지 대기"""
+        backend_cfg = backend_config(self.config)
+        template = backend_cfg.get("search_url", "https://search.shopping.naver.com/search/all?query={query}&sort=review")
+        url = template.format(query=urllib.parse.quote(keyword))
+        self.review_sorted = False
+        try:
+            logger.info(f"[DOM] 검색 이동: {url}")
+            page = self.session.list_page
+            page.goto(url, wait_until="domcontentloaded")
+            page.wait_for_selector(self.selectors["card"])
+            self.review_sorted = "sort=review" in url
+            return True
+        except Exception as e:
+            logger.error(f"[DOM] 키워드 준비 실패: {e}")
+            return False
+
+    def ensure_browser_focus(self) -> bool:
+        return True
+
+    def is_blocked_page(self) -> bool:
+        """봇 감지/캡챠 페이지 여부 (화면 OCR 대신 DOM 확인)"""
+        try:
+            pages = [self.session.list_page]
+            if self.session._detail_page is not None:
+                pages.append(self.session._detail_page)
+            return any(page.locator(self.selectors["block_page"]).count() > 0 for page in pages)
+        except Exception as e:
+            logger.debug(f"[DOM] 차단 페이지 확인 실패: {e}")
+            return False
+
+    def scroll_steps(self, steps: int) -> bool:
+        if not steps:
+            return True
+        try:
+            step_amount = int(self.config.get("timing", {}).get("scroll_step", 400))
+            page = self.session.list_page
+            selector = self.selectors["card"]
+            count, scroll_y = page.evaluate(LIST_STATE_JS, selector)
+            page.mouse.wheel(0, step_amount * steps)
+            if steps > 0:
+                try:
+                    page.wait_for_function(MORE_CARDS_JS, arg=[selector, count, scroll_y],
+                                           timeout=scroll_load_timeout(self.config))
+                except Exception:
+                    # 목록 끝이면 카드가 더 늘지 않음 - 판단은 다음 스캔에서
+                    logger.debug(f"[DOM] 스크롤 후 새 카드 없음 (카드 {count}개)")
+            return True
+        except Exception as e:
+            logger.error(f"[DOM] 스크롤 실패: {e}")
+            return False
+
+    def scroll_down_once(self) -> bool:
+        return self.scroll_steps(1)
+
+    def scroll_to_top(self):
+        try:
+            self.session.list_page.evaluate("window.scrollTo(0, 0)")
+        except Exception as e:
+            logger.debug(f"[DOM] 최상단 이동 실패(무시): {e}")
+
+
+class DomListScanner:
+    """ListScanner 대응 - 화면에 보이는 카드의 DOM을 파싱"""
+
+    def __init__(self, config, session: PlaywrightSession):
+        self.config = config
+        self.session = session
+        self.last_scan_review_counts: List[int] = []
+        # 목록 끝은 스크롤 전후 전체 카드 수/스크롤 위치 변화로 판단 (ListScanner의 스크롤 추적과 같은 인터페이스)
+        self.at_list_end = False
+        self._scroll_expected = False
+        self._last_state: Optional[tuple] = None
+
+    def expect_scroll(self):
+        self._scroll_expected = True
+
+    def reset_tracking(self):
+        self.at_list_end = False
+        self._scroll_expected = False
+        self._last_state = None
+
+    def _update_list_end(self, page, selector: str):
+        """아래로 스크롤했는데 카드 수도 스크롤 위치도 그대로면 목록 끝"""
+        state = tuple(page.evaluate(LIST_STATE_JS, selector))
+        self.at_list_end = self._scroll_expected and state == self._last_state
+        self._scroll_expected = False
+        self._last_state = state
+
+    def scan_visible_cards(self) -> List[StoreCard]:
+        """가시 영역 카드 중 리뷰 범위 안의 카드 반환"""
+        self.last_scan_review_counts = []
+        try:
+            page = self.session.list_page
+            selectors = get_selectors(self.config)
+            raw_cards = page.evaluate(VISIBLE_CARDS_JS, selectors["card"])
+            self._update_list_end(page, selectors["card"])
+        except Exception as e:
+            logger.error(f"[DOM] 카드 스캔 실패: {e}")
+            return []
+
+        review_min = self.config["search"]["review_min"]
+        review_max = self.config["search"]["review_max"]
+        cards = []
+        for raw in raw_cards:
+            soup = BeautifulSoup(raw["html"], "html.parser")
+            element = soup.select_one(selectors["card"]) or soup
+            card = parse_card(element, selectors, page.url)
+            if card is None or card.review_count is None:
+                continue
+
+            card.x, card.y = int(raw["x"]), int(raw["y"])
+            card.width, card.height = int(raw["width"]), int(raw["height"])
+            self.last_scan_review_counts.append(card.review_count)
+            if review_min <= card.review_count <= review_max:
+                cards.append(card)
+
+        logger.info(f"[DOM] 유효한 카드 {len(cards)}개 / 가시 카드 {len(raw_cards)}개")
+        return cards
+
+
+class DomDetailReader:
+    """DetailReader 대응 - 상세 페이지를 별도 탭에서 열고 DOM에서 읽기"""
+
+    def __init__(self, config, session: PlaywrightSession):
+        self.config = config
+        self.session = session
+        self._detail: Dict[str, Any] = {}
+
+    def open_card(self, card: StoreCard) -> bool:
+        if not card.url:
+            logger.warning(f"[DOM] 카드 URL 없음: {card.store_name}")
+            return False
+        try:
+            logger.info(f"[DOM] 상세 열기: {card.store_name} ({card.url})")
+            page = self.session.detail_page
+            page.goto(card.url, wait_until="domcontentloaded")
+            selectors = get_selectors(self.config)
+            try:
+                page.wait_for_selector(selectors["interest_count"])
+            except Exception:
+                logger.debug("[DOM] 관심고객 요소 대기 시간 초과 - 현재 DOM으로 진행")
+            self._detail = parse_detail_html(page.content(), selectors)
+            return True
+        except Exception as e:
+            logger.error(f"[DOM] 상세 열기 실패: {e}")
+            self._detail = {}
+            return False
+
+    def get_current_url(self, store_name: Optional[str] = None) -> Optional[str]:
+        try:
+            url = self.session.detail_page.url
+            return url if url and url.startswith('http') else None
+        except Exception as e:
+            logger.error(f"[DOM] 상세 URL 확인 실패: {e}")
+            return None
+
+    def read_store_name_from_detail(self) -> Optional[str]:
+        return self._detail.get("store_name")
+
+    def read_interest_count(self) -> Optional[int]:
+        return self._detail.get("interest_count")
+
+    def submit_detail_ocr(self) -> DetailOcrJob:
+        # DOM에서 이미 파싱한 값이므로 기다릴 작업 없음
+        return DetailOcrJob(completed(self.read_store_name_from_detail()), completed(self.read_interest_count()))
+
+    def back_to_list(self) -> bool:
+        # 목록 페이지는 별도 탭에 그대로 남아 있으므로 이동할 필요 없음
+        self._detail = {}
+        return True
@@ -0,0 +1,324 @@
+"""
+화면/입력 백엔드
+pyautogui / pygetwindow / pyperclip 호출을 한 곳으로 모아 실행 환경을 바꿀 수 있게 한다.
+  - live   : 실제 데스크톱 (pyautogui/pygetwindow는 처음 사용할 때 import)
+  - record : live로 실행하면서 화면 프레임/입력/클립보드/창 제목을 세션 폴더에 기록
+  - replay : 기록한 세션을 그대로 재생 (디스플레이 없는 리눅스/CI에서 벤치마크)
+(config.json "io": {"mode": "live" | "record" | "replay", "session_dir": ...})
+
+세션은 입력 동작 단위의 구간(step)으로 나뉜다. 재생 시 화면 캡처는 현재 구간의 프레임을
+차례로 돌려주고(마지막 프레임 유지), 입력 동작이 들어오면 다음 구간으로 넘어간다.
+"""
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from .utils import logger
+
+SESSION_FILE = "session.jsonl"
+Region = Tuple[int, int, int, int]
+
+
+def _crop(image: Image.Image, region: Optional[Region]) -> Image.Image:
+    if not region:
+        return image
+    x, y, width, height = (int(v) for v in region)
+    return image.crop((x, y, x + width, y + height))
+
+
+class LiveBackend:
+    """실제 데스크톱 입출력"""
+
+    finished = False
+
+    def __init__(self):
+        self._gui = None
+
+    @property
+    def gui(self):
+        if self._gui is None:
+            import pyautogui
+            pyautogui.FAILSAFE = True
+            self._gui = pyautogui
+        return self._gui
+
+    def configure(self, pause: float = 0.1):
+        self.gui.PAUSE = pause
+
+    # === 화면 ===
+
+    def screenshot(self, region: Optional[Region] = None) -> Image.Image:
+        return self.gui.screenshot(region=tuple(region)) if region else self.gui.screenshot()
+
+    def size(self) -> Tuple[int, int]:
+        width, height = self.gui.size()
+        return int(width), int(height)
+
+    def active_window_title(self) -> Optional[str]:
+        try:
+            import pygetwindow as gw
+            window = gw.getActiveWindow()
+            return window.title if window else None
+        except Exception:
+            return None
+
+    # === 입력 ===
+
+    def click(self, x: int, y: int):
+        self.gui.click(x, y)
+
+    def hotkey(self, *keys: str):
+        self.gui.hotkey(*keys)
+
+    def press(self, key: str):
+        self.gui.press(key)
+
+    def scroll(self, clicks: int):
+        self.gui.scroll(clicks)
+
+    def key_down(self, key: str):
+        self.gui.keyDown(key)
+
+    def key_up(self, key: str):
+        self.gui.keyUp(key)
+
+    # === 클립보드 ===
+
+    def clipboard_copy(self, text: str):
+        import pyperclip
+        pyperclip.copy(text)
+
+    def clipboard_paste(self) -> str:
+        import pyperclip
+        return pyperclip.paste()
+
+    def close(self):
+        pass
+
+
+class RecordingBackend:
+    """다른 백엔드를 감싸 실행 내용을 세션 폴더에 기록"""
+
+    def __init__(self, session_dir, inner=None):
+        self.inner = inner or LiveBackend()
+        self.session_dir = Path(session_dir)
+        (self.session_dir / "frames").mkdir(parents=True, exist_ok=True)
+        self._log = open(self.session_dir / SESSION_FILE, 'w', encoding='utf-8')
+        self._frame_files: Dict[str, str] = {}
+        self._last_frame: Optional[str] = None
+        self.finished = False
+        logger.info(f"입출력 기록 시작: {self.session_dir}")
+
+    def _write(self, event: Dict[str, Any]):
+        event["t"] = round(time.perf_counter(), 4)
+        self._log.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self._log.flush()
+
+    def _action(self, name: str, *args):
+        self._write({"kind": "action", "name": name, "args": list(args)})
+
+    def configure(self, pause: float = 0.1):
+        self.inner.configure(pause)
+
+    def screenshot(self, region: Optional[Region] = None) -> Image.Image:
+        # 영역 캡처도 전체 화면을 기록해 재생 시 같은 영역을 잘라낼 수 있게 함
+        image = self.inner.screenshot()
+        digest = hashlib.sha1(image.tobytes()).hexdigest()
+        file_name = self._frame_files.get(digest)
+        if file_name is None:
+            file_name = f"frames/{len(self._frame_files):05d}.png"
+            image.save(self.session_dir / file_name)
+            self._frame_files[digest] = file_name
+        if file_name != self._last_frame:
+            self._write({"kind": "frame", "file": file_name})
+            self._last_frame = file_name
+        return _crop(image, region)
+
+    def size(self) -> Tuple[int, int]:
+        return self.inner.size()
+
+    def active_window_title(self) -> Optional[str]:
+        title = self.inner.active_window_title()
+        self._write({"kind": "title", "value": title})
+        return title
+
+    def click(self, x: int, y: int):
+        self._action("click", x, y)
+        self.inner.click(x, y)
+
+    def hotkey(self, *keys: str):
+        self._action("hotkey", *keys)
+        self.inner.hotkey(*keys)
+
+    def press(self, key: str):
+        self._action("press", key)
+        self.inner.press(key)
+
+    def scroll(self, clicks: int):
+        self._action("scroll", clicks)
+        self.inner.scroll(clicks)
+
+    def key_down(self, key: str):
+        self._action("key_down", key)
+        self.inner.key_down(key)
+
+    def key_up(self, key: str):
+        self._action("key_up", key)
+        self.inner.key_up(key)
+
+    def clipboard_copy(self, text: str):
+        self.inner.clipboard_copy(text)
+
+    def clipboard_paste(self) -> str:
+        value = self.inner.clipboard_paste()
+        self._write({"kind": "clipboard", "value": value})
+        return value
+
+    def close(self):
+        if not self._log.closed:
+            self._log.close()
+            logger.info(f"입출력 기록 저장: {self.session_dir} (프레임 {len(self._frame_files)}장)")
+        self.inner.close()
+
+
+class ReplayBackend:
+    """기록한 세션 재생 (입력은 기록과 비교만 하고 화면은 기록된 프레임을 돌려줌)"""
+
+    def __init__(self, session_dir):
+        self.session_dir = Path(session_dir)
+        self.steps: List[Dict[str, Any]] = [self._new_step(None)]
+        with open(self.session_dir / SESSION_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if event["kind"] == "action":
+                    self.steps.append(self._new_step((event["name"], event["args"])))
+                else:
+                    self.steps[-1][event["kind"]].append(event.get("file", event.get("value")))
+
+        self._step = 0
+        self._cursor: Dict[str, int] = {}
+        self._images: Dict[str, Image.Image] = {}
+        self._last: Dict[str, Any] = {}
+        self._clipboard = ""
+        self.actions = 0
+        self.divergences = 0
+        self.finished = False
+        logger.info(f"입출력 재생: {self.session_dir} (입력 {len(self.steps) - 1}개)")
+
+    @staticmethod
+    def _new_step(action) -> Dict[str, Any]:
+        return {"action": action, "frame": [], "title": [], "clipboard": []}
+
+    def _next_value(self, kind: str) -> Any:
+        """현재 구간의 기록 값을 차례로 반환 (다 쓰면 마지막 값 유지)"""
+        values = self.steps[self._step][kind]
+        if values:
+            index = self._cursor.get(kind, 0)
+            self._cursor[kind] = index + 1
+            self._last[kind] = values[min(index, len(values) - 1)]
+        return self._last.get(kind)
+
+    def _action(self, name: str, *args):
+        self.actions += 1
+        if self._step + 1 >= len(self.steps):
+            if not self.finished:
+                logger.info("재생 세션의 입력을 모두 소진했습니다.")
+            self.finished = True
+            return
+        self._step += 1
+        self._cursor = {}
+        expected = self.steps[self._step]["action"]
+        if expected != (name, list(args)):
+            self.divergences += 1
+            logger.debug(f"재생 입력 불일치: 기록 {expected} / 실제 {(name, list(args))}")
+
+    def configure(self, pause: float = 0.1):
+        pass
+
+    def _frame(self) -> Image.Image:
+        file_name = self._next_value("frame")
+        if file_name is None:
+            raise RuntimeError("재생할 프레임이 없습니다")
+        if file_name not in self._images:
+            self._images[file_name] = Image.open(self.session_dir / file_name).convert("RGB")
+        return self._images[file_name]
+
+    def screenshot(self, region: Optional[Region] = None) -> Image.Image:
+        return _crop(self._frame(), region)
+
+    def size(self) -> Tuple[int, int]:
+        frame = self._images.get(self._last.get("frame")) or self._frame()
+        return frame.size
+
+    def active_window_title(self) -> Optional[str]:
+        return self._next_value("title")
+
+    def click(self, x: int, y: int):
+        self._action("click", x, y)
+
+    def hotkey(self, *keys: str):
+        self._action("hotkey", *keys)
+
+    def press(self, key: str):
+        self._action("press", key)
+
+    def scroll(self, clicks: int):
+        self._action("scroll", clicks)
+
+    def key_down(self, key: str):
+        self._action("key_down", key)
+
+    def key_up(self, key: str):
+        self._action("key_up", key)
+
+    def clipboard_copy(self, text: str):
+        self._clipboard = text
+
+    def clipboard_paste(self) -> str:
+        if self.steps[self._step]["clipboard"]:
+            return self._next_value("clipboard")
+        return self._clipboard
+
+    def close(self):
+        if self.divergences:
+            logger.warning(f"재생 입력 불일치 {self.divergences}건 / 전체 {self.actions}건")
+
+
+_backend = None
+
+
+def create_io_backend(config: Optional[dict] = None):
+    io_cfg = (config or {}).get("io", {}) if isinstance(config, dict) else {}
+    mode = io_cfg.get("mode", "live")
+    session_dir = io_cfg.get("session_dir", "client_discovery/replays/latest")
+    if mode == "record":
+        return RecordingBackend(session_dir)
+    if mode == "replay":
+        return ReplayBackend(session_dir)
+    return LiveBackend()
+
+
+def configure_io_backend(config: Optional[dict] = None):
+    """크롤러 설정으로 전역 입출력 백엔드 교체"""
+    set_io_backend(create_io_backend(config))
+    return _backend
+
+
+def set_io_backend(backend):
+    global _backend
+    if _backend is not None and _backend is not backend:
+        _backend.close()
+    _backend = backend
+
+
+def get_io_backend():
+    global _backend
+    if _backend is None:
+        _backend = LiveBackend()
+    return _backend
@@ -0,0 +1,191 @@
+"""
+키워드 예산 스케줄러
+지난 실행의 키워드별 방문/저장/소요시간(결과 DB keywords 테이블, 없으면 run.log)과
+targets_*.csv(키워드별 저장 건수)를 읽어
+키워드마다 저장률(저장/방문)과 분당 저장 수를 계산하고, UCB 방식으로 키워드 순서와
+방문 예산을 정해 max_visits_per_run 안에서 시간당 저장 건수를 최대화한다.
+  - 기록이 적은 키워드는 탐색 보너스를 받아 일정 예산(min_visits)은 항상 배정
+  - 실행 기록이 전혀 없으면 기존처럼 설정 순서 + max_results_per_keyword
+(config.json "scheduler": {"enabled", "exploration", "prior_visits", "min_visits", "max_budget_factor"})
+"""
+import csv
+import math
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .utils import logger
+
+# RunStats.keyword_summary() 형식: "  - 텀블러: 방문 40, 저장 5, 12.3분"
+KEYWORD_LINE = re.compile(r"^\s+- (.+): 방문 (\d+), 저장 (\d+), ([\d.]+)분\s*$")
+
+
+@dataclass
+class KeywordYield:
+    """키워드 누적 성과"""
+    keyword: str
+    visited: int = 0
+    saved: int = 0
+    minutes: float = 0.0
+
+    @property
+    def lead_rate(self) -> float:
+        return self.saved / self.visited if self.visited else 0.0
+
+
+def parse_run_log(path) -> Dict[str, KeywordYield]:
+    """run.log의 키워드별 성과 줄을 모두 합산"""
+    yields: Dict[str, KeywordYield] = {}
+    log_path = Path(path)
+    if not log_path.exists():
+        return yields
+    try:
+        with open(log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                match = KEYWORD_LINE.match(line)
+                if not match:
+                    continue
+                keyword = match.group(1)
+                entry = yields.setdefault(keyword, KeywordYield(keyword))
+                entry.visited += int(match.group(2))
+                entry.saved += int(match.group(3))
+                entry.minutes += float(match.group(4))
+    except Exception as e:
+        logger.warning(f"실행 로그 읽기 실패: {e}")
+    return yields
+
+
+def count_csv_leads(output_dir, csv_pattern: str = "targets_{date}.csv") -> Dict[str, int]:
+    """지난 결과 CSV의 키워드(note 열)별 저장 건수"""
+    counts: Dict[str, int] = {}
+    for csv_path in sorted(Path(output_dir).glob(csv_pattern.format(date="*"))):
+        try:
+            with open(csv_path, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    keyword = (row.get("note") or "").strip()
+                    if keyword:
+                        counts[keyword] = counts.get(keyword, 0) + 1
+        except Exception as e:
+            logger.warning(f"결과 CSV 읽기 실패 ({csv_path}): {e}")
+    return counts
+
+
+class KeywordScheduler:
+    """키워드 순서/방문 예산 결정"""
+
+    def __init__(self, config, output_dir="client_discovery", results=None):
+        scheduler_cfg = config.get("scheduler", {})
+        output_cfg = config.get("output", {})
+        self.enabled = bool(scheduler_cfg.get("enabled", True))
+        self.exploration = float(scheduler_cfg.get("exploration", 0.5))
+        self.prior_visits = float(scheduler_cfg.get("prior_visits", 20))
+        self.min_visits = int(scheduler_cfg.get("min_visits", 10))
+        self.max_budget_factor = float(scheduler_cfg.get("max_budget_factor", 2.0))
+        self.output_dir = Path(output_dir)
+        self.log_file = self.output_dir / output_cfg.get("log_file", "run.log")
+        self.csv_pattern = output_cfg.get("csv_file", "targets_{date}.csv")
+        # ResultStore (storage.backend = "sqlite")면 로그 파싱 대신 키워드 집계 조회
+        self.results = results
+
+    def _logged_yields(self) -> Dict[str, KeywordYield]:
+        if self.results is not None:
+            try:
+                yields = {
+                    keyword: KeywordYield(keyword, visited, saved, seconds / 60)
+                    for keyword, (visited, saved, seconds) in self.results.keyword_yields().items()
+                }
+                if yields:
+                    return yields
+            except Exception as e:
+                logger.warning(f"결과 DB 키워드 성과 조회 실패: {e}")
+        return parse_run_log(self.log_file)
+
+    def load_history(self) -> Dict[str, KeywordYield]:
+        """실행 기록(DB/run.log)을 우선 사용하고, 기록에 없는 키워드는 CSV 저장 건수로 보완"""
+        history = self._logged_yields()
+        logged_visits = sum(entry.visited for entry in history.values())
+        logged_minutes = sum(entry.minutes for entry in history.values())
+        if not logged_visits:
+            return history
+
+        # 로그 이전 실행의 키워드는 방문/시간을 전체 평균 비율로 추정
+        global_rate = sum(entry.saved for entry in history.values()) / logged_visits
+        for keyword, saved in count_csv_leads(self.output_dir, self.csv_pattern).items():
+            if keyword in history or not global_rate:
+                continue
+            visited = int(round(saved / global_rate))
+            minutes = visited * logged_minutes / logged_visits
+            history[keyword] = KeywordYield(keyword, visited, saved, minutes)
+        return history
+
+    def scores(self, keywords: List[str], history: Dict[str, KeywordYield]) -> Dict[str, float]:
+        """키워드별 시간당 예상 저장 건수의 UCB"""
+        known = [history[k] for k in keywords if k in history and history[k].visited > 0]
+        total_visits = sum(entry.visited for entry in known)
+        total_minutes = sum(entry.minutes for entry in known)
+        global_rate = sum(entry.saved for entry in known) / total_visits if total_visits else 0.0
+        global_speed = total_visits / total_minutes if total_minutes else 1.0
+
+        scores: Dict[str, float] = {}
+        for keyword in keywords:
+            entry = history.get(keyword)
+            visited = entry.visited if entry else 0
+            if visited:
+                # 전체 평균을 사전값으로 한 저장률 (방문이 적을수록 평균 쪽으로)
+                rate = (entry.saved + self.prior_visits * global_rate) / (visited + self.prior_visits)
+                speed = visited / entry.minutes if entry.minutes else global_speed
+            else:
+                rate, speed = global_rate, global_speed
+            # 저장률이 작은 베르누이 보상이므로 분산(≈평균 저장률)에 맞춘 탐색 보너스
+            variance = max(global_rate, 1 / (total_visits + 1))
+            bonus = self.exploration * math.sqrt(2 * variance * math.log(total_visits + 1) / (visited + 1))
+            scores[keyword] = (rate + bonus) * speed * 60
+        return scores
+
+    def plan(self, keywords: List[str], max_overall: int = 0, max_per_keyword: int = 0) -> List[Tuple[str, int]]:
+        """(키워드, 방문 예산) 목록 - 예산 0은 제한 없음"""
+        history = self.load_history() if self.enabled else {}
+        if not any(history.get(k) and history[k].visited for k in keywords):
+            return [(keyword, max_per_keyword) for keyword in keywords]
+
+        scores = self.scores(keywords, history)
+        order = sorted(keywords, key=lambda k: -scores[k])
+        budget = max_overall or max_per_keyword * len(keywords)
+        budgets = self._allocate(order, scores, budget, max_per_keyword) if budget else {k: 0 for k in order}
+
+        for keyword in order:
+            entry = history.get(keyword)
+            rate = f"{entry.lead_rate * 100:.1f}%" if entry and entry.visited else "기록 없음"
+            logger.info(f"키워드 예산: {keyword} {budgets[keyword] or '제한 없음'}회 "
+                        f"(저장률 {rate}, 시간당 예상 {scores[keyword]:.1f}건)")
+        # 유한 예산에서 한 번도 배정받지 못한 키워드는 이번 실행에서 제외
+        return [(keyword, budgets[keyword]) for keyword in order if budgets[keyword] or not budget]
+
+    def _allocate(self, order: List[str], scores: Dict[str, float], budget: int,
+                  max_per_keyword: int) -> Dict[str, int]:
+        """최소 예산을 나눈 뒤 나머지를 점수 비례로 배분 (키워드당 상한 적용)"""
+        floor = min(self.min_visits, budget // len(order))
+        cap = int(max_per_keyword * self.max_budget_factor) if max_per_keyword else budget
+        cap = max(cap, floor)
+        budgets = {keyword: floor for keyword in order}
+        remaining = budget - floor * len(order)
+
+        while remaining > 0:
+            active = [k for k in order if budgets[k] < cap]
+            if not active:
+                break
+            total = sum(scores[k] for k in active)
+            given = 0
+            for keyword in active:
+                weight = scores[keyword] / total if total else 1 / len(active)
+                share = min(int(remaining * weight), cap - budgets[keyword])
+                budgets[keyword] += share
+                given += share
+            if not given:
+                # 비례 배분으로 나누어지지 않는 나머지는 점수 순으로 1회씩
+                for keyword in active[:remaining]:
+                    budgets[keyword] += 1
+                    given += 1
+            remaining -= given
+        return budgets
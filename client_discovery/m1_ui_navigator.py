@@ -4,10 +4,9 @@ M1. UI 진입 & 정렬 모듈
 """
 import time
 import random
-import pyautogui
-import pyperclip
 from typing import Optional, Tuple
 
+from .io_backend import get_io_backend
 from .utils import find_image_on_screen, wait_for_load, logger, is_browser_focused
 
 
@@ -16,14 +15,16 @@ class UINavigator:
 
     def __init__(self, config):
         self.config = config
-        pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.1
+        get_io_backend().configure(pause=0.1)
+        # 마지막 키워드 준비에서 리뷰 많은순 정렬이 확인되었는지 (구간 탐색 사용 조건)
+        self.review_sorted = False
 
     # === 공개 API ===
 
     def prepare_keyword_run(self, keyword: str) -> bool:
         """키워드별 검색 준비 (브라우저 활성화 → 쇼핑 홈 이동 → 검색/정렬)"""
         logger.info(f"[네비게이터] 키워드 준비: {keyword}")
+        self.review_sorted = False
 
         if not self.ensure_browser_focus():
             logger.warning("브라우저 창이 포커스 되어 있지 않습니다. 직접 활성화해 주세요.")
@@ -39,7 +40,8 @@ class UINavigator:
             logger.warning("쇼핑몰 탭을 찾지 못했습니다. 현재 탭 구성을 확인해 주세요.")
             return False
 
-        if not self.set_sort_by_review_desc():
+        self.review_sorted = self.set_sort_by_review_desc()
+        if not self.review_sorted:
             logger.warning("리뷰 많은순 정렬을 설정하지 못했습니다. 수동으로 정렬 상태를 확인해 주세요.")
 
         self.set_items_per_page(80)
@@ -58,10 +60,10 @@ class UINavigator:
                 return True
 
             logger.info(f"네이버 쇼핑 이동: {url}")
-            pyautogui.hotkey('ctrl', 'l')
+            get_io_backend().hotkey('ctrl', 'l')
             wait_for_load(0.2, 0.4)
             self._type_with_clipboard(url)
-            pyautogui.press('enter')
+            get_io_backend().press('enter')
 
             wait_min, wait_max = self._get_load_wait()
             wait_for_load(wait_min, wait_max)
@@ -80,12 +82,12 @@ class UINavigator:
                 logger.error("검색창을 찾지 못했습니다. 좌표나 앵커 설정을 확인해 주세요.")
                 return False
 
-            pyautogui.click(search_box_coords[0], search_box_coords[1])
+            get_io_backend().click(search_box_coords[0], search_box_coords[1])
             wait_for_load(0.3, 0.6)
-            pyautogui.hotkey('ctrl', 'a')
+            get_io_backend().hotkey('ctrl', 'a')
             time.sleep(0.2)
             self._type_with_clipboard(keyword)
-            pyautogui.press('enter')
+            get_io_backend().press('enter')
 
             wait_min, wait_max = self._get_load_wait()
             wait_for_load(wait_min, wait_max)
@@ -183,10 +185,27 @@ class UINavigator:
         try:
             logger.info("스크롤 다운")
             scroll_amount = random.randint(300, 500)
-            pyautogui.scroll(-scroll_amount)
+            get_io_backend().scroll(-scroll_amount)
             wait_min = self.config.get("timing", {}).get("scroll_wait_min", 0.5)
             wait_max = self.config.get("timing", {}).get("scroll_wait_max", 1.0)
-            wait_for_load(wait_min, wait_max)
+            wait_for_load(wait_min, wait_max, label="scroll")
+            return True
+
+        except Exception as e:
+            logger.error(f"스크롤 실패: {e}")
+            return False
+
+    def scroll_steps(self, steps: int) -> bool:
+        """고정 폭 스텝 단위 스크롤 (양수=아래, 음수=위) - 리뷰 구간 탐색용"""
+        if not steps:
+            return True
+        try:
+            step_amount = int(self.config.get("timing", {}).get("scroll_step", 400))
+            logger.info(f"스크롤 {steps:+d}스텝")
+            get_io_backend().scroll(-step_amount * steps)
+            wait_min = self.config.get("timing", {}).get("scroll_wait_min", 0.5)
+            wait_max = self.config.get("timing", {}).get("scroll_wait_max", 1.0)
+            wait_for_load(wait_min, wait_max, label="scroll")
             return True
 
         except Exception as e:
@@ -196,7 +215,7 @@ class UINavigator:
     def scroll_to_top(self):
         """검색 결과 페이지 최상단으로 이동"""
         try:
-            pyautogui.press('home')
+            get_io_backend().press('home')
             wait_for_load(0.2, 0.5)
         except Exception as e:
             logger.debug(f"스크롤 최상단 이동 실패(무시): {e}")
@@ -224,11 +243,11 @@ class UINavigator:
             offset = self.config.get("timing", {}).get("click_offset_range", 5)
         x = coords[0] + random.randint(-offset, offset)
         y = coords[1] + random.randint(-offset, offset)
-        pyautogui.click(x, y)
+        get_io_backend().click(x, y)
 
     def _type_with_clipboard(self, text: str):
-        pyperclip.copy(text)
-        pyautogui.hotkey('ctrl', 'v')
+        get_io_backend().clipboard_copy(text)
+        get_io_backend().hotkey('ctrl', 'v')
         time.sleep(0.3)
 
     def _get_point(self, value) -> Optional[Tuple[int, int]]:
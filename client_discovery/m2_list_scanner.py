@@ -2,11 +2,18 @@
 M2. 리스트 스캐너 모듈
 현재 화면의 스토어 카드들을 스캔하고 정보 추출
 """
-import pyautogui
+import re
+import numpy as np
 from pathlib import Path
 from typing import List, Optional
-from .models import StoreCard
-from .utils import logger, find_image_on_screen, capture_screen_region
+from ocr.service import get_ocr_service
+from .anchor_engine import get_anchor_engine
+from .io_backend import get_io_backend
+from .models import StoreCard, placeholder_store_name
+from .numeric_reader import NumericReader
+from .ocr_cache import get_ocr_cache
+from .scroll_tracker import ScrollTracker
+from .utils import logger, find_image_on_screen, capture_screen_region, grab_screen, crop_region
 
 
 class ListScanner:
@@ -16,6 +23,24 @@ class ListScanner:
         self.config = config
         self.layout = self.config.get("layout", {})
         self.ocr_lang = self.config.get("ocr", {}).get("lang", "kor+eng")
+        self.ocr = get_ocr_service()
+        self.numeric = NumericReader(config, self.ocr)
+        self.anchors = get_anchor_engine(config)
+        # 마지막 스캔에서 읽은 모든 카드의 리뷰 수 (범위 외 포함, 화면 순서)
+        self.last_scan_review_counts: List[int] = []
+        self.scroll_tracker = ScrollTracker(config)
+
+    @property
+    def at_list_end(self) -> bool:
+        """직전 스크롤 후 화면이 움직이지 않았는지 (목록 끝)"""
+        return self.scroll_tracker.at_list_end
+
+    def expect_scroll(self):
+        self.scroll_tracker.expect_scroll()
+
+    def reset_tracking(self):
+        """키워드 전환 시 스크롤 위치/OCR 캐시 초기화"""
+        self.scroll_tracker.reset()
 
     def _get_relative_region(self, key: str, fallback: tuple) -> tuple:
         region = self.layout.get(key, {}) if isinstance(self.layout, dict) else {}
@@ -25,71 +50,64 @@ class ListScanner:
         height = int(region.get('height', fallback[3]))
         return x, y, width, height
 
-    def _configure_tesseract(self):
-        try:
-            import pytesseract  # type: ignore
-            import yaml  # type: ignore
-            import os
-        except ImportError:
-            logger.warning('pytesseract가 설치되지 않아 OCR을 사용할 수 없습니다.')
-            return None, None
-
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-        tesseract_cmd = None
-
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config_data = yaml.safe_load(f) or {}
-                tesseract_cmd = config_data.get('ocr', {}).get('tesseract_cmd')
-            except Exception as e:
-                logger.warning(f"config.yaml 로드 실패: {e}")
-                tesseract_cmd = None
-
-        if not tesseract_cmd or '${' in str(tesseract_cmd):
-            tesseract_cmd = os.getenv('TESSERACT_CMD')
-
-        if not tesseract_cmd:
-            logger.warning('tesseract_cmd가 설정되지 않아 OCR 기능을 비활성화합니다.')
-            return None, None
-
-        tesseract_cmd = os.path.expanduser(os.path.expandvars(str(tesseract_cmd)))
-        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-        return pytesseract, self.ocr_lang
-
+    def _cut_region(self, frame: Optional[np.ndarray], x: int, y: int, width: int, height: int) -> Optional[np.ndarray]:
+        """스캔 프레임이 있으면 뷰로 잘라내고, 없으면 해당 영역만 새로 캡처"""
+        if frame is not None:
+            return crop_region(frame, x, y, width, height)
+        return capture_screen_region(x, y, width, height)
 
     def scan_visible_cards(self) -> List[StoreCard]:
         """현재 가시 영역의 스토어 카드들 스캔 (OCR 기반)"""
         try:
             logger.info("화면 전체 OCR 스캔 시작...")
             cards = []
+            self.last_scan_review_counts = []
 
-            # 전체 화면 캡처 후 실제 카드 영역 감지
-            screenshot = pyautogui.screenshot()
-            card_areas = self._detect_card_areas()
+            # 화면을 한 번만 캡처하고 모든 카드/이름/리뷰 영역은 이 프레임의 뷰로 잘라서 사용
+            frame = grab_screen()
+            self.scroll_tracker.observe(frame)
+            card_areas = self._detect_card_areas(frame)
+
+            candidates = [
+                StoreCard(store_name="", review_count=0, x=x, y=y, width=width, height=height)
+                for (x, y, width, height) in card_areas
+            ]
+
+            # 직전 스캔에서 이미 읽은 카드(스크롤 후에도 화면에 남은 카드)는 OCR 결과 재사용
+            cached = [
+                self.scroll_tracker.lookup(card, frame, self._name_region(card)) if frame is not None else None
+                for card in candidates
+            ]
+            fresh = [card for card, hit in zip(candidates, cached) if hit is None]
+            if len(fresh) < len(candidates):
+                logger.debug(f"OCR 재사용 {len(candidates) - len(fresh)}개, 새로 읽을 카드 {len(fresh)}개")
+
+            # 모자이크 배치 OCR로 새로 드러난 카드의 이름/리뷰 라벨을 한 번에 읽기
+            batch_values = iter(self._read_cards_batch(fresh, frame) or [])
 
             # 각 카드 영역에서 실제 정보 추출
-            for i, (x, y, width, height) in enumerate(card_areas):
-                # 임시 카드 객체 생성 (나중에 실제 데이터로 업데이트)
-                card = StoreCard(
-                    store_name="",
-                    review_count=0,
-                    x=x,
-                    y=y,
-                    width=width,
-                    height=height
-                )
-
-                # 실제 스토어명 추출
-                store_name = self.read_store_name_from_list(card)
-                if not store_name:
-                    store_name = f"상점_{i+1}"
+            for i, card in enumerate(candidates):
+                if cached[i] is not None:
+                    store_name, review_count = cached[i]
+                else:
+                    store_name, review_count = next(batch_values, (None, None))
+
+                    # 실제 스토어명 추출 (배치에서 못 읽은 카드만 개별 OCR)
+                    if not store_name:
+                        store_name = self.read_store_name_from_list(card, frame)
+
+                    # 실제 리뷰 수 추출
+                    if review_count is None:
+                        review_count = self.read_review_count(card, frame)
+                    if frame is not None and review_count is not None:
+                        self.scroll_tracker.remember(card, frame, self._name_region(card), store_name, review_count)
 
-                # 실제 리뷰 수 추출
-                review_count = self.read_review_count(card)
+                if not store_name:
+                    store_name = placeholder_store_name(i + 1)
                 if review_count is None:
                     logger.warning(f"리뷰 수 추출 실패: {store_name}")
                     continue
+                self.last_scan_review_counts.append(review_count)
 
                 # 설정 범위 체크
                 review_min = self.config["search"]["review_min"]
@@ -117,11 +135,14 @@ class ListScanner:
             logger.error(traceback.format_exc())
             return []
 
-    def _detect_card_areas(self) -> List[tuple]:
+    def _detect_card_areas(self, frame: Optional[np.ndarray] = None) -> List[tuple]:
         """스토어 카드 영역 감지 (앵커 기반 추론)"""
         anchors = self.config.get("anchors", {})
         layout_cfg = self.config.get("layout", {})
-        screen_width, screen_height = pyautogui.size()
+        if frame is not None:
+            screen_height, screen_width = frame.shape[:2]
+        else:
+            screen_width, screen_height = get_io_backend().size()
 
         card_width = int(layout_cfg.get("card_width", 320))
         card_height = int(layout_cfg.get("card_height", 420))
@@ -135,7 +156,7 @@ class ListScanner:
 
         if review_anchor and Path(review_anchor).exists():
             try:
-                matches = list(pyautogui.locateAllOnScreen(review_anchor, confidence=confidence))
+                matches = self.anchors.locate_all(review_anchor, frame, confidence=confidence)
 
                 for match in matches:
                     card_x = max(0, match.left - offset_x)
@@ -184,77 +205,143 @@ class ListScanner:
 
         return cards
 
-    def read_review_count(self, card: StoreCard) -> Optional[int]:
-        """카드에서 리뷰 수 읽기 (OCR 기반)"""
+    def _name_region(self, card: StoreCard) -> tuple:
+        """카드 기준 스토어명 영역의 화면 좌표"""
+        rel_x, rel_y, width, height = self._get_relative_region(
+            'list_name_region', (10, 10, card.width - 20, 40)
+        )
+        return card.x + rel_x, card.y + rel_y, width, height
+
+    def _review_region(self, card: StoreCard) -> tuple:
+        """카드 기준 리뷰 라벨 영역의 화면 좌표"""
+        rel_x, rel_y, width, height = self._get_relative_region(
+            'list_review_region', (10, card.height - 80, card.width - 20, 60)
+        )
+        return card.x + rel_x, card.y + rel_y, width, height
+
+    def _parse_review_text(self, text: str) -> Optional[int]:
+        """OCR 텍스트에서 리뷰 수 추출"""
+        patterns = [
+            r'\(([0-9,]+)\)\s*·\s*구매',
+            r'구매\s*([0-9,]+)',
+            r'리뷰\s*([0-9,]+)',
+            r'([0-9,]+)\s*구매',
+            r'([0-9,]+)\s*리뷰',
+        ]
+        for pattern in patterns:
+            match = re.search(pattern, text)
+            if match:
+                try:
+                    review_count = int(match.group(1).replace(',', ''))
+                except ValueError:
+                    continue
+                logger.debug(f"리뷰 수 추출: {review_count} (패턴: {pattern})")
+                return review_count
+
+        for number in re.findall(r'([0-9,]+)', text):
+            try:
+                review_count = int(number.replace(',', ''))
+            except ValueError:
+                continue
+            logger.debug(f"리뷰 숫자 추론: {review_count}")
+            return review_count
+
+        return None
+
+    def _parse_store_name(self, text: str) -> Optional[str]:
+        """OCR 텍스트에서 스토어명(첫 줄) 추출"""
+        candidates = [line.strip() for line in text.split('\n') if line.strip()]
+        return candidates[0] if candidates else None
+
+    def _read_cards_batch(self, cards: List[StoreCard], frame: Optional[np.ndarray]) -> Optional[List[tuple]]:
+        """한 프레임의 이름/리뷰 ROI를 모자이크로 OCR해 카드별 (스토어명, 리뷰 수) 반환
+
+        리뷰 수는 먼저 '리뷰' 앵커 옆 숫자 구간만 숫자 전용 모자이크로 읽고,
+        실패한 카드의 리뷰 ROI만 스토어명과 함께 전체 OCR 모자이크에 넣는다.
+        """
+        ocr_cfg = self.config.get("ocr", {})
+        if frame is None or not cards or not ocr_cfg.get("batch_mode", True) or not self.ocr.available:
+            return None
+
         try:
-            rel_x, rel_y, text_width, text_height = self._get_relative_region(
-                'list_review_region', (10, card.height - 80, card.width - 20, 60)
-            )
-            text_x = card.x + rel_x
-            text_y = card.y + rel_y
+            cache = get_ocr_cache()
+            review_rois = [crop_region(frame, *self._review_region(card)) for card in cards]
+            name_rois = [crop_region(frame, *self._name_region(card)) for card in cards]
+
+            # 다른 키워드/이전 실행에서 읽은 라벨은 OCR 캐시에서 바로 가져옴
+            counts = [cache.get("list_review", roi) for roi in review_rois]
+            names = [cache.get("list_name", roi) for roi in name_rois]
+
+            numeric_todo = [i for i, count in enumerate(counts) if count is None]
+            if numeric_todo:
+                numeric_counts = self.numeric.read_batch([review_rois[i] for i in numeric_todo], "label_review")
+                for i, count in zip(numeric_todo, numeric_counts):
+                    counts[i] = count
+            fallback = [i for i in numeric_todo if counts[i] is None]
+            name_todo = [i for i, name in enumerate(names) if name is None]
+
+            rois = [name_rois[i] for i in name_todo] + [review_rois[i] for i in fallback]
+            results = self.ocr.image_to_string_batch(
+                rois, lang=self.ocr_lang, psm=int(ocr_cfg.get("batch_psm", 4))
+            ) if rois else []
+
+            for i, name_result in zip(name_todo, results[:len(name_todo)]):
+                names[i] = self._parse_store_name(name_result.text)
+                cache.store("list_name", name_rois[i], names[i])
+            for i, review_result in zip(fallback, results[len(name_todo):]):
+                counts[i] = self._parse_review_text(review_result.text)
+            for i in numeric_todo:
+                cache.store("list_review", review_rois[i], counts[i])
+            logger.debug(f"배치 OCR: 캐시 {len(cards) - len(numeric_todo)}개, "
+                         f"숫자 전용 {len(numeric_todo) - len(fallback)}개, 전체 OCR 폴백 {len(fallback)}개")
+
+            return list(zip(names, counts))
+
+        except Exception as e:
+            logger.warning(f"배치 OCR 실패, 카드별 OCR로 진행합니다: {e}")
+            return None
 
-            pytesseract, lang = self._configure_tesseract()
-            if pytesseract is None:
+    def read_review_count(self, card: StoreCard, frame: Optional[np.ndarray] = None) -> Optional[int]:
+        """카드에서 리뷰 수 읽기 (OCR 기반, frame이 주어지면 재캡처 없이 잘라서 사용)"""
+        try:
+            if not self.ocr.available:
                 logger.warning('Tesseract 설정을 찾지 못해 리뷰 수를 건너뜁니다.')
                 return None
 
-            region_image = capture_screen_region(text_x, text_y, text_width, text_height)
+            region_image = self._cut_region(frame, *self._review_region(card))
             if region_image is None:
                 return None
 
-            import re
-            text = pytesseract.image_to_string(region_image, lang=lang)
-            patterns = [
-                r'\(([0-9,]+)\)\s*·\s*구매',
-                r'구매\s*([0-9,]+)',
-                r'리뷰\s*([0-9,]+)',
-                r'([0-9,]+)\s*구매',
-                r'([0-9,]+)\s*리뷰',
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, text)
-                if match:
-                    review_count = int(match.group(1).replace(',', ''))
-                    logger.debug(f"리뷰 수 추출: {review_count} (패턴: {pattern})")
+            def _read() -> Optional[int]:
+                # 숫자 전용 빠른 경로 (앵커 옆 숫자만 인식, 저신뢰 시 전체 OCR)
+                review_count = self.numeric.read_after_anchor(region_image, "label_review")
+                if review_count is not None:
                     return review_count
 
-            numbers = re.findall(r'([0-9,]+)', text)
-            if numbers:
-                review_count = int(numbers[0].replace(',', ''))
-                logger.debug(f"리뷰 숫자 추론: {review_count}")
-                return review_count
+                text = self.ocr.image_to_string(region_image, lang=self.ocr_lang)
+                return self._parse_review_text(text)
 
-            return None
+            return get_ocr_cache().get_or_compute("list_review", region_image, _read)
 
         except Exception as e:
             logger.error(f"리뷰 수 읽기 실패: {e}")
             return None
 
-    def read_store_name_from_list(self, card: StoreCard) -> Optional[str]:
-        """카드에서 스토어명 읽기"""
+    def read_store_name_from_list(self, card: StoreCard, frame: Optional[np.ndarray] = None) -> Optional[str]:
+        """카드에서 스토어명 읽기 (frame이 주어지면 재캡처 없이 잘라서 사용)"""
         try:
-            rel_x, rel_y, name_width, name_height = self._get_relative_region(
-                'list_name_region', (10, 10, card.width - 20, 40)
-            )
-            name_x = card.x + rel_x
-            name_y = card.y + rel_y
-
-            pytesseract, lang = self._configure_tesseract()
-            if pytesseract is None:
+            if not self.ocr.available:
                 return None
 
-            region_image = capture_screen_region(name_x, name_y, name_width, name_height)
+            region_image = self._cut_region(frame, *self._name_region(card))
             if region_image is None:
                 return None
 
-            text = pytesseract.image_to_string(region_image, lang=lang)
-            candidates = [line.strip() for line in text.split('\n') if line.strip()]
-            if candidates:
-                return candidates[0]
-
-            return None
+            return get_ocr_cache().get_or_compute(
+                "list_name", region_image,
+                lambda: self._parse_store_name(self.ocr.image_to_string(region_image, lang=self.ocr_lang)),
+            )
 
         except Exception as e:
             logger.error(f"스토어명 읽기 실패: {e}")
             return None
-
@@ -1,56 +1,66 @@
 """
 M3. 상세 리더 모듈
 스토어 상세 페이지에서 정보 추출
+상세 페이지는 한 번만 캡처해 스토어명/관심고객 영역을 잘라 두고, 인식은 OCR 파이프라인
+(프로세스 풀)에 넘겨 크롤러가 목록으로 돌아가는 동안 진행한다.
 """
-import pyautogui
-import time
-from typing import Optional
-from .models import StoreCard
-from .utils import logger, get_current_url, wait_for_load
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple, Optional, Tuple
 
+import numpy as np
 
-class DetailReader:
-    """상세 페이지 리더"""
+from ocr.service import get_ocr_service
+from .anchor_engine import get_anchor_engine
+from .io_backend import get_io_backend
+from .models import StoreCard
+from .numeric_reader import NumericReader
+from .ocr_cache import get_ocr_cache
+from .ocr_pipeline import DetailOcrJob, completed, get_ocr_pipeline, worker_object
+from .readiness import get_readiness_waiter
+from .roi_calibration import Region, get_roi_calibration, ink_box
+from .url_resolver import UrlResolver
+from .utils import logger, wait_for_load, capture_screen_region, grab_screen, crop_region
+
+
+class InterestReading(NamedTuple):
+    """관심고객수 인식 결과 (성공 단계, OCR한 총 면적, 숫자 글자 박스 - ROI 보정용)"""
+    count: Optional[int]
+    stage: Optional[str] = None
+    area: int = 0
+    number_box: Optional[Region] = None
+
+
+@dataclass
+class DetailCapture:
+    """상세 페이지 한 프레임에서 잘라낸 OCR 영역 (워커 프로세스로 보낼 사본)"""
+    name_roi: Optional[np.ndarray] = None      # 스토어명 영역
+    tight_roi: Optional[np.ndarray] = None     # 보정 모델이 예측한 좁은 숫자 박스
+    span_roi: Optional[np.ndarray] = None      # 관심고객 앵커 바로 옆 숫자 구간
+    anchor_roi: Optional[np.ndarray] = None    # 앵커 기준 관심고객 영역
+    fallback_roi: Optional[np.ndarray] = None  # 고정 폴백 영역
+    tight_origin: Optional[Tuple[int, int]] = None
+    span_origin: Optional[Tuple[int, int]] = None
+    layout: str = ""
+    anchor_box: Optional[Region] = None
+
+    @property
+    def interest_key(self) -> Optional[np.ndarray]:
+        """OCR 캐시 키로 쓸 영역 (숫자 구간이 있으면 숫자 구간)"""
+        return self.span_roi if self.span_roi is not None else self.fallback_roi
+
+
+class DetailRecognizer:
+    """잘라낸 영역의 인식만 담당 (화면/입력 접근 없음 - 워커 프로세스에서도 사용)"""
 
     def __init__(self, config):
-        self.config = config
-        self.layout = self.config.get("layout", {})
+        self.config = config or {}
         self.ocr_lang = self.config.get("ocr", {}).get("lang", "kor+eng")
-
-    def _configure_tesseract(self):
-        try:
-            import pytesseract  # type: ignore
-            import yaml  # type: ignore
-            import os
-        except ImportError:
-            logger.warning('pytesseract가 없어 OCR 기능을 사용할 수 없습니다.')
-            return None, None
-
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-        tesseract_cmd = None
-
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config_data = yaml.safe_load(f) or {}
-                tesseract_cmd = config_data.get('ocr', {}).get('tesseract_cmd')
-            except Exception as e:
-                logger.warning(f"config.yaml 로드 실패: {e}")
-                tesseract_cmd = None
-
-        if not tesseract_cmd or '${' in str(tesseract_cmd):
-            tesseract_cmd = os.getenv('TESSERACT_CMD')
-
-        if not tesseract_cmd:
-            logger.warning('tesseract_cmd가 설정되지 않아 OCR 기능을 비활성화합니다.')
-            return None, None
-
-        tesseract_cmd = os.path.expanduser(os.path.expandvars(str(tesseract_cmd)))
-        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-        return pytesseract, self.ocr_lang
+        self.ocr = get_ocr_service()
+        self.numeric = NumericReader(self.config, self.ocr)
 
     def _extract_number_from_text(self, text: str) -> Optional[int]:
-        import re
         patterns = [
             r'관심고객수?\s*([0-9,]+)',
             r'관심고객\s*([0-9,]+)',
@@ -74,15 +84,100 @@ class DetailReader:
                 return num
         return None
 
-    def _read_interest_from_region(self, pytesseract, lang: str, x: int, y: int, width: int, height: int) -> Optional[int]:
+    def _interest_from_region(self, region_image: Optional[np.ndarray]) -> Optional[int]:
+        if region_image is None:
+            return None
         try:
-            screenshot = pyautogui.screenshot(region=(x, y, width, height))
-            text = pytesseract.image_to_string(screenshot, lang=lang)
+            # 영역 안에 '관심고객' 앵커가 보이면 옆 숫자만 숫자 전용 OCR로 읽기
+            count = self.numeric.read_after_anchor(region_image, "label_interest")
+            if count is not None:
+                return count
+
+            text = self.ocr.image_to_string(region_image, lang=self.ocr_lang)
             return self._extract_number_from_text(text)
         except Exception as exc:
             logger.debug(f"관심고객 영역 OCR 실패: {exc}")
             return None
 
+    def interest_reading(self, capture: DetailCapture) -> InterestReading:
+        """예측 박스 → 숫자 구간 → 앵커 영역 → 폴백 영역 순으로 넓혀 가며 관심고객수 인식"""
+        attempts = (
+            ("predicted", capture.tight_roi, capture.tight_origin, self.numeric.read_span),
+            ("span", capture.span_roi, capture.span_origin, self.numeric.read_span),
+            ("anchor", capture.anchor_roi, None, self._interest_from_region),
+            ("fallback", capture.fallback_roi, None, self._interest_from_region),
+        )
+        area = 0
+        try:
+            for stage, roi, origin, read in attempts:
+                if roi is None:
+                    continue
+                box = ink_box(roi) if origin is not None else None
+                if stage == "predicted" and box is not None and box[0] + box[2] >= roi.shape[1]:
+                    # 숫자가 기록보다 길면 오른쪽이 잘려 앞자리만 읽힘 (1,250 → 125) → 숫자 구간으로
+                    logger.debug("예측 숫자 박스 오른쪽 끝에 글자가 닿아 숫자 구간으로 다시 읽습니다.")
+                    continue
+                area += roi.shape[0] * roi.shape[1]
+                count = read(roi)
+                if count is None:
+                    continue
+                logger.debug(f"관심고객수({stage}): {count}")
+                number_box = None
+                if box is not None:
+                    number_box = (origin[0] + box[0], origin[1] + box[1], box[2], box[3])
+                return InterestReading(count, stage, area, number_box)
+
+            logger.warning("관심고객수를 찾지 못했습니다.")
+            return InterestReading(None, None, area)
+
+        except ImportError:
+            logger.warning("pytesseract 없음. 관심고객수를 기본값으로 반환합니다.")
+            return InterestReading(100)
+        except Exception as e:
+            logger.error(f"관심고객수 읽기 실패: {e}")
+            return InterestReading(None, None, area)
+
+    def interest_count(self, capture: DetailCapture) -> Optional[int]:
+        return self.interest_reading(capture).count
+
+    def store_name(self, name_image) -> Optional[str]:
+        """스토어명 영역에서 가장 긴 줄"""
+        if name_image is None:
+            return None
+        try:
+            text = self.ocr.image_to_string(name_image, lang=self.ocr_lang)
+            lines = [line.strip() for line in text.split('\n') if line.strip()]
+            return max(lines, key=len) if lines else None
+        except Exception as e:
+            logger.error(f"상세 스토어명 읽기 실패: {e}")
+            return None
+
+
+def _worker_recognizer() -> DetailRecognizer:
+    return worker_object("detail_recognizer", DetailRecognizer)
+
+
+def recognize_detail_name(name_image) -> Optional[str]:
+    """OCR 워커 작업: 상세 스토어명"""
+    return _worker_recognizer().store_name(name_image)
+
+
+def recognize_detail_interest(capture: DetailCapture) -> InterestReading:
+    """OCR 워커 작업: 관심고객수"""
+    return _worker_recognizer().interest_reading(capture)
+
+
+class DetailReader:
+    """상세 페이지 리더"""
+
+    def __init__(self, config, stats=None):
+        self.config = config
+        self.layout = self.config.get("layout", {})
+        self.recognizer = DetailRecognizer(config)
+        self.ocr = self.recognizer.ocr
+        self.numeric = self.recognizer.numeric
+        self.anchors = get_anchor_engine(config)
+        self.url_resolver = UrlResolver(config, stats)
 
     def open_card(self, card: StoreCard) -> bool:
         """카드 클릭하여 상세 페이지 열기"""
@@ -92,12 +187,13 @@ class DetailReader:
             center_y = card.y + card.height // 2
 
             logger.info(f"카드 클릭: {card.store_name} at ({center_x}, {center_y})")
-            pyautogui.click(center_x, center_y)
+            before = get_readiness_waiter().snapshot()
+            get_io_backend().click(center_x, center_y)
 
-            # 페이지 로딩 대기
+            # 페이지 로딩 대기 (목록 화면이 바뀐 뒤부터 안정 판단)
             wait_min = self.config["timing"]["load_wait_min"]
             wait_max = self.config["timing"]["load_wait_max"]
-            wait_for_load(wait_min, wait_max)
+            wait_for_load(wait_min, wait_max, label="detail_open", before=before)
 
             return True
 
@@ -105,65 +201,134 @@ class DetailReader:
             logger.error(f"카드 클릭 실패: {e}")
             return False
 
-    def read_interest_count(self) -> Optional[int]:
-        """관심고객수 읽기 (OCR 기반)"""
-        try:
-            pytesseract, lang = self._configure_tesseract()
-            if pytesseract is None:
-                logger.warning('Tesseract 설정을 찾지 못해 관심고객수를 건너뜁니다.')
-                return None
+    def _name_region(self, screen_width: int) -> tuple:
+        layout_cfg = self.layout if isinstance(self.layout, dict) else {}
+        region_cfg = layout_cfg.get("detail_name_region", {})
+        return (
+            int(region_cfg.get("x", 200)),
+            int(region_cfg.get("y", 150)),
+            int(region_cfg.get("width", screen_width - 400)),
+            int(region_cfg.get("height", 100)),
+        )
+
+    def capture_detail(self) -> Optional[DetailCapture]:
+        """상세 페이지를 한 번 캡처해 스토어명/관심고객 영역(숫자 구간/앵커 영역/폴백 영역)을 잘라냄"""
+        frame = grab_screen()
+        if frame is None:
+            return None
 
-            anchors = self.config.get("anchors", {})
-            layout_cfg = self.layout if isinstance(self.layout, dict) else {}
-            anchor_path = anchors.get("label_interest")
-            confidence = float(layout_cfg.get("anchor_confidence", 0.75))
-            region_cfg = layout_cfg.get("detail_interest_region", {})
-
-            def _get_region_from_anchor(location):
-                x_offset = int(region_cfg.get("x_offset", 120))
-                y_offset = int(region_cfg.get("y_offset", -10))
-                width = int(region_cfg.get("width", 220))
-                height = int(region_cfg.get("height", 80))
-                return (
-                    location.left + x_offset,
-                    location.top + y_offset,
-                    width,
-                    height,
-                )
-
-            if anchor_path:
-                from pathlib import Path as _Path
-                if _Path(anchor_path).exists():
-                    try:
-                        location = pyautogui.locateOnScreen(anchor_path, confidence=confidence)
-                        if location:
-                            region = _get_region_from_anchor(location)
-                            count = self._read_interest_from_region(pytesseract, lang, *region)
-                            if count is not None:
-                                logger.debug(f"관심고객수(OCR-앵커): {count}")
-                                return count
-                    except Exception as e:
-                        logger.debug(f"관심 앵커 감지 실패: {e}")
-
-            fallback_cfg = layout_cfg.get("detail_interest_fallback_region", {})
-            screen_width, screen_height = pyautogui.size()
-            fallback_region = (
-                int(fallback_cfg.get("x", screen_width // 4)),
-                int(fallback_cfg.get("y", screen_height // 3)),
-                int(fallback_cfg.get("width", screen_width // 2)),
-                int(fallback_cfg.get("height", screen_height // 3)),
-            )
-            count = self._read_interest_from_region(pytesseract, lang, *fallback_region)
-            if count is not None:
-                logger.debug(f"관심고객수(OCR-폴백): {count}")
-                return count
+        def _cut(region) -> Optional[np.ndarray]:
+            # 프레임 뷰 대신 사본을 넘겨 워커로 보낼 때 필요한 픽셀만 직렬화
+            roi = crop_region(frame, *region)
+            return None if roi is None else roi.copy()
 
-            logger.warning("관심고객수를 찾지 못했습니다.")
+        def _origin(region) -> Tuple[int, int]:
+            return max(0, int(region[0])), max(0, int(region[1]))
+
+        screen_height, screen_width = frame.shape[:2]
+        layout_cfg = self.layout if isinstance(self.layout, dict) else {}
+        anchor_path = self.config.get("anchors", {}).get("label_interest")
+        confidence = float(layout_cfg.get("anchor_confidence", 0.75))
+        region_cfg = layout_cfg.get("detail_interest_region", {})
+        calibration = get_roi_calibration()
+        capture = DetailCapture(name_roi=_cut(self._name_region(screen_width)),
+                                layout=calibration.layout_key(frame.shape))
+
+        if anchor_path and Path(anchor_path).exists():
+            try:
+                # 보정 모델이 예측한 좁은 영역에서 먼저 찾고, 없을 때만 전체 화면으로 넓힘
+                location = None
+                predicted = calibration.predict_anchor_region(capture.layout)
+                if predicted:
+                    location = self.anchors.locate(anchor_path, frame, confidence=confidence, region=predicted)
+                if not location:
+                    location = self.anchors.locate(anchor_path, frame, confidence=confidence)
+                if location:
+                    capture.anchor_box = tuple(int(v) for v in location[:4])
+                    tight = calibration.predict_number_box(capture.layout, capture.anchor_box)
+                    if tight:
+                        capture.tight_roi, capture.tight_origin = _cut(tight), _origin(tight)
+                    span = (location.left + location.width + 2, location.top - 4,
+                            self.numeric.span_width, location.height + 8)
+                    capture.span_roi, capture.span_origin = _cut(span), _origin(span)
+                    capture.anchor_roi = _cut((
+                        location.left + int(region_cfg.get("x_offset", 120)),
+                        location.top + int(region_cfg.get("y_offset", -10)),
+                        int(region_cfg.get("width", 220)),
+                        int(region_cfg.get("height", 80)),
+                    ))
+            except Exception as e:
+                logger.debug(f"관심 앵커 감지 실패: {e}")
+
+        fallback_cfg = layout_cfg.get("detail_interest_fallback_region", {})
+        capture.fallback_roi = _cut((
+            int(fallback_cfg.get("x", screen_width // 4)),
+            int(fallback_cfg.get("y", screen_height // 3)),
+            int(fallback_cfg.get("width", screen_width // 2)),
+            int(fallback_cfg.get("height", screen_height // 3)),
+        ))
+        return capture
+
+    def submit_detail_ocr(self) -> DetailOcrJob:
+        """상세 페이지 캡처 후 스토어명/관심고객 OCR 제출 (결과는 job에서 필요할 때 대기)"""
+        if not self.ocr.available:
+            logger.warning('Tesseract 설정을 찾지 못해 관심고객수를 건너뜁니다.')
+            return DetailOcrJob(completed(None), completed(None))
+
+        capture = self.capture_detail()
+        if capture is None:
+            return DetailOcrJob(completed(None), completed(None))
+
+        cache = get_ocr_cache()
+        pipeline = get_ocr_pipeline()
+        keys = {"store_name": ("detail_name", capture.name_roi), "interest_count": ("detail_interest", capture.interest_key)}
+        cached_kinds = set()
+
+        def _submit(kind: str, job, local, arg):
+            cache_kind, roi = keys[kind]
+            value = cache.get(cache_kind, roi)
+            if value is not None:
+                cached_kinds.add(kind)
+                return completed(value)
+            return pipeline.submit(job, arg, local=local)
+
+        def _remember(kind: str, value):
+            if kind in cached_kinds:
+                return value
+            if kind == "interest_count":
+                value = self._settle_interest(capture, value)
+            cache_kind, roi = keys[kind]
+            cache.store(cache_kind, roi, value)
+            return value
+
+        return DetailOcrJob(
+            _submit("store_name", recognize_detail_name, self.recognizer.store_name, capture.name_roi),
+            _submit("interest_count", recognize_detail_interest, self.recognizer.interest_reading, capture),
+            on_result=_remember,
+        )
+
+    def _settle_interest(self, capture: DetailCapture, reading: Optional[InterestReading]) -> Optional[int]:
+        """인식 결과를 ROI 보정 모델/통계에 반영하고 관심고객수 반환"""
+        if reading is None:
             return None
+        calibration = get_roi_calibration()
+        calibration.observe(capture.tight_roi is not None, reading.stage, reading.area)
+        if reading.count is not None and capture.anchor_box is not None:
+            calibration.record(capture.layout, capture.anchor_box, reading.number_box)
+        return reading.count
 
-        except ImportError:
-            logger.warning("pytesseract 없음. 관심고객수를 기본값으로 반환합니다.")
-            return 100
+    def read_interest_count(self) -> Optional[int]:
+        """관심고객수 읽기 (OCR 기반, 제어 스레드에서 바로 인식)"""
+        try:
+            if not self.ocr.available:
+                logger.warning('Tesseract 설정을 찾지 못해 관심고객수를 건너뜁니다.')
+                return None
+            capture = self.capture_detail()
+            if capture is None:
+                return None
+            return get_ocr_cache().get_or_compute(
+                "detail_interest", capture.interest_key,
+                lambda: self._settle_interest(capture, self.recognizer.interest_reading(capture)))
         except Exception as e:
             logger.error(f"관심고객수 읽기 실패: {e}")
             return None
@@ -171,35 +336,26 @@ class DetailReader:
     def read_store_name_from_detail(self) -> Optional[str]:
         """상세 페이지에서 스토어명 읽기"""
         try:
-            pytesseract, lang = self._configure_tesseract()
-            if pytesseract is None:
+            if not self.ocr.available:
                 return None
 
-            layout_cfg = self.layout if isinstance(self.layout, dict) else {}
-            region_cfg = layout_cfg.get("detail_name_region", {})
-            screen_width, screen_height = pyautogui.size()
-            name_x = int(region_cfg.get("x", 200))
-            name_y = int(region_cfg.get("y", 150))
-            name_width = int(region_cfg.get("width", screen_width - 400))
-            name_height = int(region_cfg.get("height", 100))
-
-            screenshot = pyautogui.screenshot(region=(name_x, name_y, name_width, name_height))
-            text = pytesseract.image_to_string(screenshot, lang=lang)
-            lines = [line.strip() for line in text.split('\n') if line.strip()]
-            if lines:
-                return max(lines, key=len)
-            return None
+            screen_width, _ = get_io_backend().size()
+            screenshot = capture_screen_region(*self._name_region(screen_width))
+            return get_ocr_cache().get_or_compute(
+                "detail_name", screenshot, lambda: self.recognizer.store_name(screenshot))
 
         except Exception as e:
             logger.error(f"상세 스토어명 읽기 실패: {e}")
             return None
 
-    def get_current_url(self) -> Optional[str]:
-        """현재 페이지 URL을 클립보드로부터 읽어오기"""
+    def get_current_url(self, store_name: Optional[str] = None) -> Optional[str]:
+        """현재 페이지 URL (CDP → 창 제목 매핑 → 클립보드 순)"""
         try:
-            url = get_current_url()
+            url = self.url_resolver.resolve(store_name)
             if url:
                 logger.debug(f"상세 URL 추출: {url}")
+                # 같은 스토어를 다시 만나면 창 제목만으로 URL을 찾을 수 있도록
+                self.url_resolver.remember(store_name, url)
             else:
                 logger.warning("상세 URL을 읽어오지 못했습니다")
             return url
@@ -212,12 +368,13 @@ class DetailReader:
         try:
             logger.info("목록으로 돌아가기")
             # 브라우저 뒤로가기
-            pyautogui.hotkey('alt', 'left')
+            before = get_readiness_waiter().snapshot()
+            get_io_backend().hotkey('alt', 'left')
 
-            # 페이지 로딩 대기
+            # 페이지 로딩 대기 (상세 화면이 바뀐 뒤부터 안정 판단)
             wait_min = self.config["timing"]["load_wait_min"]
             wait_max = self.config["timing"]["load_wait_max"]
-            wait_for_load(wait_min, wait_max)
+            wait_for_load(wait_min, wait_max, label="back_to_list", before=before)
 
             return True
 
@@ -2,39 +2,105 @@
 M4. 필터 & 디둡 모듈
 리뷰/관심고객 범위 필터링 및 중복 제거
 """
-import csv
 import re
 from pathlib import Path
-from typing import Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
+from .dedupe_index import DedupeIndex, dedupe_keys
+from .models import StoreCard
+from .near_duplicate import NearDuplicateIndex
+from .text_matcher import TextMatcher
 from .utils import logger
 
+MULTI_STORE_SEPARATORS = ['/', '|', '·', 'ㆍ', '+', ',']
+
 
 class FilterManager:
     """필터링 및 중복 제거 관리"""
 
     def __init__(self, config):
         self.config = config
-        self.processed_urls: Set[str] = set()
-        self.processed_names: Set[str] = set()
-        filters_cfg = self.config.get("filters", {}) if isinstance(self.config, dict) else {}
-        self.multi_store_keywords = [kw.lower() for kw in filters_cfg.get("multi_store_keywords", ["가격비교", "외"]) if isinstance(kw, str)]
-        self.multi_store_separators = ['/', '|', '·', 'ㆍ', '+', ',']
+        # 이번 실행에서만 기억할 키 (저장 전 확인 대기 카드 등)
+        self._session_keys: Set[str] = set()
+        self.index = self._open_index()
         self._load_existing_data()
+        self.near_names = self._open_near_index()
+
+    @property
+    def config(self):
+        return self._config
+
+    @config.setter
+    def config(self, config):
+        """설정 교체 시(apply_config_updates 포함) 이름 규칙 매처도 다시 컴파일"""
+        self._config = config
+        self._build_name_matcher()
+
+    def _build_name_matcher(self):
+        """차단 목록/다중 입점 키워드/구분자를 한 오토마톤으로 컴파일"""
+        config = self._config if isinstance(self._config, dict) else {}
+        filters_cfg = config.get("filters", {}) or {}
+        self.blocklist = [kw for kw in config.get("blocklist", []) or [] if isinstance(kw, str)]
+        self.multi_store_keywords = [
+            kw.lower() for kw in filters_cfg.get("multi_store_keywords", ["가격비교", "외"]) if isinstance(kw, str)
+        ]
+        self.multi_store_separators = list(MULTI_STORE_SEPARATORS)
+        self.name_matcher = TextMatcher({
+            "blocklist": self.blocklist,
+            "multi_store": self.multi_store_keywords,
+            "separator": self.multi_store_separators,
+        })
+        self._last_name_match: Tuple[Optional[str], Dict[str, List[str]]] = (None, {})
+
+    def match_name_rules(self, store_name: Optional[str]) -> Dict[str, List[str]]:
+        """스토어명에 걸리는 규칙 전체 (한 번 훑기, 같은 이름 연속 조회는 재사용)"""
+        if not store_name:
+            return {}
+        name, found = self._last_name_match
+        if name != store_name:
+            found = self.name_matcher.matches(store_name)
+            self._last_name_match = (store_name, found)
+        return found
+
+    def _open_index(self) -> DedupeIndex:
+        """결과 CSV와 같은 폴더의 중복 색인 열기"""
+        dedupe_cfg = self.config.get("dedupe", {}) if isinstance(self.config, dict) else {}
+        index_file = dedupe_cfg.get("index_file", "dedupe_index.sqlite3")
+        path = index_file if index_file == ":memory:" else self._get_output_file().parent / index_file
+        return DedupeIndex(
+            path,
+            capacity=int(dedupe_cfg.get("bloom_capacity", 2_000_000)),
+            error_rate=float(dedupe_cfg.get("bloom_error_rate", 0.001)),
+        )
+
+    def _open_near_index(self) -> Optional[NearDuplicateIndex]:
+        """중복 색인에 밴드 키를 둔 유사 이름 색인 열기 (name_similarity 0이면 사용 안 함)"""
+        dedupe_cfg = self.config.get("dedupe", {}) if isinstance(self.config, dict) else {}
+        threshold = float(dedupe_cfg.get("name_similarity", 0.9))
+        if threshold <= 0:
+            return None
+        try:
+            near_names = NearDuplicateIndex(
+                threshold=threshold,
+                num_perm=int(dedupe_cfg.get("minhash_permutations", 64)),
+                bands=int(dedupe_cfg.get("lsh_bands", 16)),
+                min_length=int(dedupe_cfg.get("name_min_length", 16)),
+                store=self.index,
+            )
+            logger.info(f"유사 이름 색인: 새 이름 {near_names.synced}개 반영 (유사도 {threshold})")
+            return near_names
+        except Exception as e:
+            logger.error(f"유사 이름 색인 구성 실패: {e}")
+            return None
 
     def _load_existing_data(self):
-        """기존 CSV에서 중복 체크용 데이터 로드"""
+        """지난 결과 CSV 중 색인에 아직 반영하지 않은 파일만 가져오기"""
         try:
             output_file = self._get_output_file()
-            if output_file.exists():
-                with open(output_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if 'store_url' in row and row['store_url']:
-                            self.processed_urls.add(row['store_url'])
-                        if 'store_name' in row and row['store_name']:
-                            self.processed_names.add(row['store_name'])
-
-                logger.info(f"기존 데이터 로드: URL {len(self.processed_urls)}개, 이름 {len(self.processed_names)}개")
+            pattern = self.config["output"]["csv_file"].format(date="*")
+            added = self.index.import_csv_files(output_file.parent.glob(pattern))
+            if added:
+                logger.info(f"기존 결과 CSV 색인 반영: {added}개")
+            logger.info(f"중복 색인: {len(self.index)}개")
 
         except Exception as e:
             logger.error(f"기존 데이터 로드 실패: {e}")
@@ -68,16 +134,10 @@ class FilterManager:
 
     def is_blocklisted(self, store_name: Optional[str]) -> bool:
         """차단 목록 체크"""
-        if not store_name:
-            return False
-
-        store_name_lower = store_name.lower()
-        blocklist = self.config["blocklist"]
-
-        for blocked_keyword in blocklist:
-            if blocked_keyword.lower() in store_name_lower:
-                logger.debug(f"차단됨: {store_name} (키워드: {blocked_keyword})")
-                return True
+        blocked = self.match_name_rules(store_name).get("blocklist")
+        if blocked:
+            logger.debug(f"차단됨: {store_name} (키워드: {blocked[0]})")
+            return True
 
         return False
 
@@ -90,40 +150,52 @@ class FilterManager:
         if not name:
             return False
 
-        lowered = name.lower()
-
-        if any(sep in name for sep in self.multi_store_separators):
+        found = self.match_name_rules(store_name)
+        if found.get("separator") or found.get("multi_store"):
             return True
 
         if re.search(r'\uc678\s*\d', name):
             return True
 
-        for keyword in self.multi_store_keywords:
-            if keyword and keyword in lowered:
-                return True
-
         return False
 
     def is_duplicate(self, store_url: Optional[str] = None, store_name: Optional[str] = None) -> bool:
-        """중복 체크"""
+        """중복 체크 (정규화 URL 우선, 이름/유사 이름 보조 - 지난 실행 포함)"""
+        url_key, name_key = dedupe_keys(store_url, store_name)
+
         # URL 중복 체크 (우선순위)
-        if store_url and store_url in self.processed_urls:
+        if url_key and (url_key in self._session_keys or url_key in self.index):
             logger.debug(f"URL 중복: {store_url}")
             return True
 
         # 이름 중복 체크 (보조)
-        if store_name and store_name in self.processed_names:
+        if name_key and (name_key in self._session_keys or name_key in self.index):
             logger.debug(f"이름 중복: {store_name}")
             return True
 
+        # OCR 잡음으로 조금 다르게 읽힌 같은 스토어명
+        if name_key and self.near_names is not None:
+            similar = self.near_names.find(store_name)
+            if similar:
+                logger.debug(f"유사 이름 중복: {store_name} ≈ {similar[0]} ({similar[1]:.2f})")
+                return True
+
         return False
 
-    def add_to_processed(self, store_url: Optional[str] = None, store_name: Optional[str] = None):
-        """처리된 항목으로 추가"""
-        if store_url:
-            self.processed_urls.add(store_url)
-        if store_name:
-            self.processed_names.add(store_name)
+    def add_to_processed(self, store_url: Optional[str] = None, store_name: Optional[str] = None,
+                         persist: bool = True):
+        """처리된 항목으로 추가 (persist=False면 이번 실행에서만 기억)"""
+        keys = [key for key in dedupe_keys(store_url, store_name) if key]
+        if persist:
+            self.index.add_many(keys)
+        else:
+            self._session_keys.update(keys)
+        if store_name and self.near_names is not None:
+            self.near_names.add(store_name)
+
+    def close(self):
+        """Bloom 필터 저장 후 색인 닫기"""
+        self.index.close()
 
     def get_filter_reason(self, review_count: Optional[int], interest_count: Optional[int],
                          store_name: Optional[str], store_url: Optional[str]) -> Optional[str]:
@@ -143,3 +215,55 @@ class FilterManager:
             return "중복"
 
         return None  # 통과
+
+
+class VisibleCardMemory:
+    """현재 스크롤 위치에서 이미 처리/거절한 카드 기억 (화면 위치 + 상호명 + 리뷰 수)"""
+
+    def __init__(self, config):
+        layout_cfg = config.get("layout", {}) if isinstance(config, dict) else {}
+        self.tolerance_px = int(layout_cfg.get("dedupe_threshold_px", 40))
+        self._handled: List[Tuple[int, int, str, Optional[int]]] = []
+        self._previous: List[Tuple[int, int, str, Optional[int]]] = []
+
+    @staticmethod
+    def _key(card: StoreCard) -> Tuple[int, int, str, Optional[int]]:
+        return card.x, card.y, (card.store_name or "").strip(), card.review_count
+
+    def _matches(self, key, entries) -> bool:
+        x, y, name, review = key
+        return any(
+            abs(x - ex) < self.tolerance_px and abs(y - ey) < self.tolerance_px
+            and name == ename and review == ereview
+            for ex, ey, ename, ereview in entries
+        )
+
+    def is_handled(self, card: StoreCard) -> bool:
+        """이 화면에서 이미 처리한 카드인지"""
+        return self._matches(self._key(card), self._handled)
+
+    def mark(self, card: StoreCard):
+        """처리(저장/스킵 포함) 완료로 기록"""
+        key = self._key(card)
+        if not self._matches(key, self._handled):
+            self._handled.append(key)
+
+    def pending(self, cards: List[StoreCard]) -> List[StoreCard]:
+        """아직 처리하지 않은 카드만 반환"""
+        return [card for card in cards if not self.is_handled(card)]
+
+    def is_unmoved(self, cards: List[StoreCard]) -> bool:
+        """스크롤 후에도 직전 화면과 같은 카드들이면 True (목록 끝)"""
+        return bool(cards) and bool(self._previous) and all(
+            self._matches(self._key(card), self._previous) for card in cards
+        )
+
+    def next_screen(self):
+        """스크롤 직후 호출 - 현재 화면 기록을 직전 화면으로 넘김"""
+        self._previous = self._handled
+        self._handled = []
+
+    def reset(self):
+        """키워드 전환 시 전체 초기화"""
+        self._handled = []
+        self._previous = []
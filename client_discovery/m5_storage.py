@@ -1,12 +1,14 @@
 """
 M5. 저장 & 체크포인트 모듈
-CSV 저장 및 체크포인트 관리
+결과/체크포인트/실행 기록 저장 (storage.backend = "sqlite"면 SQLite가 원본, CSV는 내보내기 사본)
 """
-import csv
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from typing import Callable, List, Optional
+from .csv_sink import BufferedCsvSink
+from .keyword_scheduler import parse_run_log
 from .models import StoreDetail, Checkpoint
+from .result_store import ResultStore
 from .utils import logger
 
 
@@ -17,6 +19,60 @@ class StorageManager:
         self.config = config
         self.output_dir = Path("client_discovery")
         self.output_dir.mkdir(exist_ok=True)
+        self._sink: Optional[BufferedCsvSink] = None
+        storage_cfg = config.get("storage", {}) if isinstance(config, dict) else {}
+        self.backend = storage_cfg.get("backend", "csv")
+        self.db_file = storage_cfg.get("db_file", "discovery.sqlite3")
+        # sqlite 사용 시에도 날짜별 CSV 사본을 함께 기록 (기존 CSV 소비자용)
+        self.export_csv_enabled = bool(storage_cfg.get("export_csv", True))
+        self._results: Optional[ResultStore] = None
+        self.run_id: Optional[int] = None
+
+    @property
+    def results(self) -> Optional[ResultStore]:
+        """SQLite 결과 저장소 (backend가 sqlite일 때만, 처음 사용할 때 output_dir 기준으로 열기)"""
+        if self.backend != "sqlite":
+            return None
+        if self._results is None:
+            path = self.db_file if self.db_file == ":memory:" else self.output_dir / self.db_file
+            self._results = ResultStore(path)
+            self._import_run_log()
+        return self._results
+
+    def _import_run_log(self):
+        """새 결과 DB에는 기존 run.log의 키워드별 성과를 한 번 가져옴"""
+        try:
+            log_file = self.output_dir / self.config.get("output", {}).get("log_file", "run.log")
+            if self._results.has_runs() or not log_file.exists():
+                return
+            yields = {
+                keyword: (entry.visited, entry.saved, entry.minutes * 60)
+                for keyword, entry in parse_run_log(log_file).items()
+            }
+            if self._results.import_keyword_history(yields, f"{log_file.name} 가져오기"):
+                logger.info(f"기존 실행 로그 키워드 성과 가져오기: {len(yields)}개")
+        except Exception as e:
+            logger.error(f"기존 실행 로그 가져오기 실패: {e}")
+
+    @property
+    def checkpoint_interval(self) -> int:
+        """체크포인트 저장 간격(방문 수) - SQLite는 행 단위 갱신이라 매 방문"""
+        return 1 if self.backend == "sqlite" else 10
+
+    @property
+    def sink(self) -> BufferedCsvSink:
+        """결과 CSV 기록기 (처음 사용할 때 output_dir 기준으로 생성)"""
+        if self._sink is None:
+            output_cfg = self.config.get("output", {})
+            self._sink = BufferedCsvSink(
+                self.output_dir,
+                output_cfg.get("csv_file", "targets_{date}.csv"),
+                StoreDetail.csv_headers(),
+                flush_rows=int(output_cfg.get("flush_rows", 20)),
+                flush_interval=float(output_cfg.get("flush_interval_sec", 5.0)),
+                durability=output_cfg.get("durability", "batch"),
+            )
+        return self._sink
 
     def get_csv_filepath(self) -> Path:
         """CSV 파일 경로 생성"""
@@ -24,22 +80,22 @@ class StorageManager:
         filename = self.config["output"]["csv_file"].format(date=date_str)
         return self.output_dir / filename
 
-    def append_csv(self, store_detail: StoreDetail) -> bool:
-        """CSV에 스토어 정보 추가"""
+    def append_csv(self, store_detail: StoreDetail, on_saved: Optional[Callable[[], None]] = None) -> bool:
+        """스토어 정보 저장 (SQLite 사용 시 DB에 넣고 CSV 사본 추가)
+        on_saved는 행이 실제로 기록된 뒤 호출 (버퍼링 중인 CSV 행은 flush 이후)"""
         try:
-            csv_file = self.get_csv_filepath()
-
-            # 파일이 없으면 헤더 추가
-            write_header = not csv_file.exists()
-
-            with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-
-                if write_header:
-                    writer.writerow(StoreDetail.csv_headers())
-
-                writer.writerow(store_detail.to_csv_row())
+            results = self.results
+            if results is not None:
+                if not results.add_store(store_detail, self.run_id):
+                    logger.info(f"이미 저장된 스토어: {store_detail.store_name}")
+                    return False
+                if not self.export_csv_enabled:
+                    logger.info(f"저장 완료: {store_detail.store_name}")
+                    if on_saved is not None:
+                        on_saved()
+                    return True
 
+            self.sink.append(store_detail.to_csv_row(), on_flushed=on_saved)
             logger.info(f"저장 완료: {store_detail.store_name}")
             return True
 
@@ -47,11 +103,78 @@ class StorageManager:
             logger.error(f"CSV 저장 실패: {e}")
             return False
 
+    def flush(self):
+        """버퍼에 남은 행을 CSV에 기록"""
+        if self._sink is None:
+            return
+        try:
+            self._sink.flush()
+        except Exception as e:
+            logger.error(f"CSV 기록 실패: {e}")
+
+    def close(self):
+        """남은 행 기록 후 CSV/DB 닫기 (다음 저장 시 다시 열림)"""
+        if self._sink is not None:
+            try:
+                self._sink.close()
+            except Exception as e:
+                logger.error(f"CSV 닫기 실패: {e}")
+            finally:
+                self._sink = None
+        if self._results is not None:
+            try:
+                self._results.close()
+            except Exception as e:
+                logger.error(f"결과 DB 닫기 실패: {e}")
+            finally:
+                self._results = None
+                self.run_id = None
+
+    def start_run(self, started_at: Optional[datetime] = None):
+        """실행 시작 기록 (이후 저장/방문/스킵 행에 실행 ID 연결)"""
+        try:
+            if self.results is not None:
+                self.run_id = self.results.start_run(started_at)
+        except Exception as e:
+            logger.error(f"실행 시작 기록 실패: {e}")
+
+    def record_visit(self, keyword: str, store_name: Optional[str], store_url: Optional[str]):
+        """상세 페이지 방문 기록 (SQLite 사용 시)"""
+        try:
+            if self.results is not None:
+                self.results.record_visit(self.run_id, keyword, store_name, store_url)
+        except Exception as e:
+            logger.error(f"방문 기록 실패: {e}")
+
+    def record_skip(self, keyword: str, store_name: Optional[str], reason: str):
+        """필터 스킵 기록 (SQLite 사용 시)"""
+        try:
+            if self.results is not None:
+                self.results.record_skip(self.run_id, keyword, store_name, reason)
+        except Exception as e:
+            logger.error(f"스킵 기록 실패: {e}")
+
+    def export_csv(self, path=None, day: Optional[datetime] = None) -> int:
+        """SQLite 결과를 CSV로 내보내기 (기본: day 날짜의 targets 파일)"""
+        if self.results is None:
+            return 0
+        try:
+            if path is None:
+                date_str = (day or datetime.now()).strftime("%Y%m%d")
+                path = self.output_dir / self.config["output"]["csv_file"].format(date=date_str)
+            return self.results.export_csv(path, day)
+        except Exception as e:
+            logger.error(f"결과 CSV 내보내기 실패: {e}")
+            return 0
+
     def save_checkpoint(self, checkpoint: Checkpoint) -> bool:
         """체크포인트 저장"""
         try:
-            checkpoint_file = self.output_dir / "checkpoint.json"
-            checkpoint.save(str(checkpoint_file))
+            if self.results is not None:
+                self.results.save_checkpoint(checkpoint)
+            else:
+                checkpoint_file = self.output_dir / "checkpoint.json"
+                checkpoint.save(str(checkpoint_file))
             logger.debug("체크포인트 저장 완료")
             return True
 
@@ -62,8 +185,11 @@ class StorageManager:
     def load_checkpoint(self) -> Checkpoint:
         """체크포인트 로드"""
         try:
-            checkpoint_file = self.output_dir / "checkpoint.json"
-            checkpoint = Checkpoint.load(str(checkpoint_file))
+            checkpoint = self.results.load_checkpoint() if self.results is not None else None
+            if checkpoint is None:
+                # SQLite에 아직 없으면 기존 checkpoint.json에서 이어받음
+                checkpoint_file = self.output_dir / "checkpoint.json"
+                checkpoint = Checkpoint.load(str(checkpoint_file))
             logger.info(f"체크포인트 로드: 방문 {checkpoint.visited_count}, 저장 {checkpoint.saved_count}")
             return checkpoint
 
@@ -82,6 +208,9 @@ class StorageManager:
                 f.write(f"종료 사유: {end_reason}\n")
                 f.write("=" * 50 + "\n")
 
+            if self.results is not None:
+                self.run_id = self.results.finish_run(self.run_id, stats, end_reason)
+
             logger.info(f"실행 로그 저장: {log_file}")
             return True
 
@@ -124,15 +253,10 @@ class StorageManager:
     def get_existing_store_count(self) -> int:
         """기존 저장된 스토어 수 반환"""
         try:
-            csv_file = self.get_csv_filepath()
-            if not csv_file.exists():
-                return 0
-
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = sum(1 for _ in reader)
-                # 헤더 제외(0보다 작아지지 않도록 보호)
-                return max(rows - 1, 0)
+            if self.results is not None:
+                return self.results.count_stores()
+            # 파일은 기록기 생성/날짜 전환 때 한 번만 세고 이후에는 누적 값
+            return self.sink.row_count
 
         except Exception as e:
             logger.error(f"기존 스토어 수 계산 실패: {e}")
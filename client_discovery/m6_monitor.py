@@ -4,20 +4,28 @@ M6. 예외/중단 감시 모듈
 """
 import time
 import keyboard
-from typing import Callable, Any
-from .utils import logger, detect_suspicious_screen, is_browser_focused
+from typing import Callable, Any, Optional
+from .io_backend import get_io_backend
+from .screen_guard import ScreenGuard
+from .utils import logger, is_browser_focused
 
 
 class SafetyMonitor:
     """안전 감시 및 예외 처리"""
 
-    def __init__(self, config, storage_manager):
+    def __init__(self, config, storage_manager, stats=None):
         self.config = config
         self.storage_manager = storage_manager
         self.interrupt_requested = False
+        self.screen_guard = ScreenGuard(config, stats)
+        # DOM 백엔드처럼 화면 대신 페이지를 직접 확인할 수 있으면 그 함수를 사용
+        self.page_probe: Optional[Callable[[], bool]] = None
 
-        # ESC 키 감지 설정
-        keyboard.on_press_key('esc', self._on_escape_pressed)
+        # ESC 키 감지 설정 (입력 장치가 없는 재생 환경에서는 생략)
+        try:
+            keyboard.on_press_key('esc', self._on_escape_pressed)
+        except Exception as e:
+            logger.warning(f"ESC 키 감지 설정 실패: {e}")
 
     def _on_escape_pressed(self, event):
         """ESC 키 눌림 감지"""
@@ -25,8 +33,10 @@ class SafetyMonitor:
         logger.warning("ESC 키 감지 - 중단 요청됨")
 
     def is_suspicious_screen(self) -> bool:
-        """의심스러운 화면 감지"""
-        return detect_suspicious_screen()
+        """의심스러운 화면 감지 (화면이 바뀌었을 때만 정밀 검사)"""
+        if self.page_probe is not None:
+            return self.page_probe()
+        return self.screen_guard.check()
 
     def check_browser_focus(self) -> bool:
         """브라우저 포커스 확인 (임시로 항상 True 반환)"""
@@ -63,6 +73,10 @@ class SafetyMonitor:
         if self.interrupt_requested:
             return False, "사용자 중단 요청 (ESC)"
 
+        # 재생 모드에서 기록된 입력을 모두 소진
+        if get_io_backend().finished:
+            return False, "재생 세션 종료"
+
         # 의심 화면 체크
         if self.is_suspicious_screen():
             return False, "의심스러운 화면 감지"
@@ -5,16 +5,22 @@
 import json
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 
-from .models import StoreDetail, RunStats
-from .m1_ui_navigator import UINavigator
-from .m2_list_scanner import ListScanner
-from .m3_detail_reader import DetailReader
-from .m4_filter import FilterManager
+from .models import StoreDetail, RunStats, is_unreadable_store_name
+from .m4_filter import FilterManager, VisibleCardMemory
 from .m5_storage import StorageManager
 from .m6_monitor import SafetyMonitor
+from .band_seeker import ReviewBandSeeker
+from .io_backend import configure_io_backend, get_io_backend
+from .keyword_scheduler import KeywordScheduler
+from .ocr_cache import configure_ocr_cache, get_ocr_cache
+from .ocr_pipeline import configure_ocr_pipeline, get_ocr_pipeline
+from .readiness import configure_readiness
+from .roi_calibration import configure_roi_calibration, get_roi_calibration
+from .tab_prefetch import TabPrefetcher
 from .utils import logger
 
 
@@ -27,16 +33,29 @@ class NaverShoppingCrawler:
             self.config: Dict[str, Any] = json.load(f)
 
         # 모듈 초기화
+        self.stats = RunStats()
+        configure_io_backend(self.config)
+        configure_readiness(self.config, self.stats)
+        configure_ocr_cache(self.config, self.stats)
+        configure_ocr_pipeline(self.config)
+        configure_roi_calibration(self.config, self.stats)
         self.storage = StorageManager(self.config)
-        self.monitor = SafetyMonitor(self.config, self.storage)
-        self.navigator = UINavigator(self.config)
-        self.scanner = ListScanner(self.config)
-        self.reader = DetailReader(self.config)
+        self.monitor = SafetyMonitor(self.config, self.storage, self.stats)
+        self.session = None
+        self.navigator, self.scanner, self.reader = self._create_backend()
         self.filter = FilterManager(self.config)
+        self.card_memory = VisibleCardMemory(self.config)
+        self.band_seeker = ReviewBandSeeker(self.config)
+        self.prefetcher = TabPrefetcher(self.config)
+        self.scheduler = KeywordScheduler(self.config, self.storage.output_dir, self.storage.results)
 
         # 상태 변수
-        self.stats = RunStats()
         self.checkpoint = self.storage.load_checkpoint()
+        if self.checkpoint.processed_urls:
+            # 예전 체크포인트의 URL 목록은 중복 색인으로 옮기고 체크포인트에는 더 저장하지 않음
+            for url in self.checkpoint.processed_urls:
+                self.filter.add_to_processed(url)
+            self.checkpoint.processed_urls.clear()
         self.saved_details: List[StoreDetail] = []
         self.current_keyword: str = ""
 
@@ -49,6 +68,7 @@ class NaverShoppingCrawler:
 
         try:
             self.stats.start_time = datetime.now()
+            self.storage.start_run(self.stats.start_time)
             logger.info("크롤링 시작")
 
             # 1. 초기 설정
@@ -88,16 +108,48 @@ class NaverShoppingCrawler:
             self.stats.end_time = datetime.now()
             reason = result.get("message", "실행 완료")
             self.monitor.graceful_exit(self.checkpoint, self.stats, reason)
+            self.storage.close()
+            if self.session is not None:
+                self.session.close()
+            get_io_backend().close()
+            get_ocr_pipeline().close()
+            get_ocr_cache().save()
+            get_roi_calibration().save()
+            self.filter.close()
 
         return result
 
+    def _create_backend(self):
+        """config backend.mode에 따라 M1/M2/M3 구현 선택 (rpa: 화면 OCR, playwright: DOM)"""
+        mode = self.config.get("backend", {}).get("mode", "rpa")
+        if mode in ("playwright", "capture"):
+            from .dom_backend import PlaywrightSession, DomNavigator, DomListScanner, DomDetailReader
+
+            self.session = PlaywrightSession(self.config)
+            navigator = DomNavigator(self.config, self.session)
+            self.monitor.page_probe = navigator.is_blocked_page
+            logger.info("Playwright DOM 백엔드 사용")
+            return navigator, DomListScanner(self.config, self.session), DomDetailReader(self.config, self.session)
+
+        from .m1_ui_navigator import UINavigator
+        from .m2_list_scanner import ListScanner
+        from .m3_detail_reader import DetailReader
+
+        reader = DetailReader(self.config, self.stats)
+        reader.url_resolver.load_known_urls(self.storage.get_csv_filepath())
+        return UINavigator(self.config), ListScanner(self.config), reader
+
     def start_crawling(self) -> Dict[str, Any]:
         """구 버전 호환용 진입점"""
         return self.run()
 
-    def apply_config_updates(self, updates: Dict[str, Dict[str, Any]]):
+    def apply_config_updates(self, updates: Dict[str, Any]):
         """외부에서 전달된 설정값을 런타임에 반영"""
         for section, values in (updates or {}).items():
+            if isinstance(values, list):
+                # blocklist 같은 목록 설정은 통째로 교체
+                self.config[section] = list(values)
+                continue
             if not isinstance(values, dict):
                 continue
             current = self.config.get(section)
@@ -179,17 +231,28 @@ class NaverShoppingCrawler:
         max_overall = int(search_cfg.get("max_visits_per_run", 0) or 0)
         max_per_keyword = int(search_cfg.get("max_results_per_keyword", 0) or 0)
 
+        if self.config.get("backend", {}).get("mode") == "capture":
+            return self._capture_crawling(keywords)
+
+        if self.session is not None and int(self.config.get("backend", {}).get("parallel_contexts", 1)) > 1:
+            return self._parallel_crawling(keywords)
+
         logger.info(f"크롤링 시작: 키워드 {len(keywords)}개")
 
         total_visited = self.checkpoint.visited_count
+        # 지난 실행 성과로 키워드 순서/방문 예산 결정 (기록이 없으면 설정 순서 + 키워드 한도)
+        remaining_budget = max(0, max_overall - total_visited) if max_overall else 0
+        plan = self.scheduler.plan(keywords, remaining_budget, max_per_keyword)
 
-        for index, keyword in enumerate(keywords, 1):
+        for index, (keyword, keyword_budget) in enumerate(plan, 1):
             if max_overall and total_visited >= max_overall:
                 logger.info("전체 방문 한도에 도달했으므로 중단합니다.")
                 break
 
-            logger.info(f"=== 키워드 {index}/{len(keywords)}: {keyword} ===")
+            logger.info(f"=== 키워드 {index}/{len(plan)}: {keyword} ===")
             self.current_keyword = keyword
+            keyword_started = time.perf_counter()
+            saved_before = self.checkpoint.saved_count
 
             if not self.navigator.prepare_keyword_run(keyword):
                 logger.error(f"키워드 준비 실패: {keyword}")
@@ -197,9 +260,15 @@ class NaverShoppingCrawler:
 
             visited_for_keyword = 0
             keyword_stop = False
+            self.card_memory.reset()
+            self.band_seeker.reset()
+            self.scanner.reset_tracking()
+            self.monitor.screen_guard.reset()
+            # 리뷰 많은순 정렬이 확인된 경우에만 단조성을 이용한 건너뛰기/조기 종료
+            band_seek = self.band_seeker.enabled and self.navigator.review_sorted
 
             while True:
-                if max_per_keyword and visited_for_keyword >= max_per_keyword:
+                if keyword_budget and visited_for_keyword >= keyword_budget:
                     logger.info(f"키워드 방문 한도 도달 ({keyword})")
                     break
 
@@ -210,19 +279,50 @@ class NaverShoppingCrawler:
 
                 can_continue, reason = self.monitor.should_continue()
                 if not can_continue:
+                    self.stats.record_keyword(keyword, visited_for_keyword, self.checkpoint.saved_count - saved_before,
+                                              time.perf_counter() - keyword_started)
                     notice = self.monitor.abort_with_notice(reason)
                     self.current_keyword = ""
                     return {"status": "aborted", "message": notice}
 
-                cards = self.scanner.scan_visible_cards()
-                if not cards:
-                    if not self.navigator.scroll_down_once():
+                cards = self._timed("scan_cards", self.scanner.scan_visible_cards)
+                # 스크롤했는데 화면이 그대로면 목록 끝 (스크롤 추적 추정)
+                if self.scanner.at_list_end:
+                    logger.info("목록 끝에 도달해 다음 키워드로 이동합니다.")
+                    break
+
+                if band_seek:
+                    move = self.band_seeker.next_move(self.scanner.last_scan_review_counts)
+                    if move is None:
+                        break
+                    if move:
+                        if not self.navigator.scroll_steps(move):
+                            break
+                        self.card_memory.next_screen()
+                        if move > 0:
+                            self.scanner.expect_scroll()
+                        continue
+
+                if self.card_memory.is_unmoved(cards):
+                    logger.info("스크롤 후에도 같은 카드뿐이라 다음 키워드로 이동합니다.")
+                    break
+
+                pending = self.card_memory.pending(cards)
+                if not pending:
+                    if cards:
+                        logger.debug(f"현재 화면 카드 {len(cards)}개 모두 처리됨 - 스크롤")
+                    # 구간 탐색 중에는 위치 추적이 어긋나지 않도록 고정 폭 한 스텝만 이동
+                    scrolled = self.navigator.scroll_steps(1) if band_seek else self.navigator.scroll_down_once()
+                    if not scrolled:
                         logger.info("더 이상 스크롤할 카드가 없어 다음 키워드로 이동합니다.")
                         break
+                    self.card_memory.next_screen()
+                    self.scanner.expect_scroll()
+                    self.band_seeker.moved(1)
                     continue
 
-                for card in cards:
-                    if max_per_keyword and visited_for_keyword >= max_per_keyword:
+                for position, card in enumerate(pending):
+                    if keyword_budget and visited_for_keyword >= keyword_budget:
                         break
                     if max_overall and total_visited >= max_overall:
                         keyword_stop = True
@@ -230,19 +330,26 @@ class NaverShoppingCrawler:
 
                     self.storage.save_sample_screenshot(total_visited)
 
-                    if not self._process_card(card):
+                    processed = self._timed("card", self._process_card, card, pending[position + 1:])
+                    self.card_memory.mark(card)
+                    if not processed:
                         continue
 
                     visited_for_keyword += 1
                     total_visited += 1
                     self.checkpoint.visited_count = total_visited
 
-                    if total_visited % 10 == 0:
+                    if total_visited % self.storage.checkpoint_interval == 0:
                         self.storage.save_checkpoint(self.checkpoint)
 
+                # 한도 도달로 처리하지 못한 선로딩 탭 정리
+                self.prefetcher.discard_all()
+
                 if keyword_stop:
                     break
 
+            self.stats.record_keyword(keyword, visited_for_keyword, self.checkpoint.saved_count - saved_before,
+                                      time.perf_counter() - keyword_started)
             self.navigator.scroll_to_top()
 
         self.current_keyword = ""
@@ -259,32 +366,155 @@ class NaverShoppingCrawler:
             "details": [detail.to_dict() for detail in self.saved_details],
         }
 
-    def _process_card(self, card) -> bool:
-        """개별 카드 처리"""
+    def _capture_crawling(self, keywords: List[str]) -> Dict[str, Any]:
+        """검색 API 응답 캡처로 수집 (관심고객 수가 없는 카드만 상세 페이지 확인)"""
+        from .network_capture import CaptureProcessor, NetworkCapture
+
+        capture = NetworkCapture(self.config, self.session)
+        processor = CaptureProcessor(self.config, self.filter, self.stats)
+        visited = 0
+
+        for keyword in keywords:
+            self.current_keyword = keyword
+            keyword_started = time.perf_counter()
+            saved_before = self.checkpoint.saved_count
+            visited_before = visited
+            result = processor.process(capture.collect(keyword), keyword)
+            logger.info(f"[캡처] {keyword}: 스토어 {result.parsed}개 파싱, 저장 대상 {len(result.details)}개, "
+                        f"상세 확인 {len(result.pending_cards)}개")
+
+            details = list(result.details)
+            for card in result.pending_cards:
+                if not self.reader.open_card(card):
+                    self.stats.errors += 1
+                    continue
+                visited += 1
+                interest_count = self.reader.read_interest_count()
+                if not self.filter.passes_interest_range(interest_count):
+                    self.stats.skipped_interest_range += 1
+                    continue
+                details.append(StoreDetail(
+                    store_name=self.reader.read_store_name_from_detail() or card.store_name or "",
+                    store_url=self.reader.get_current_url(card.store_name) or card.url or "",
+                    review_count=card.review_count,
+                    interest_count=interest_count,
+                    collected_at=datetime.now(),
+                    note=keyword,
+                ))
+
+            for detail in details:
+                if self.storage.append_csv(detail, partial(self.filter.add_to_processed, detail.store_url, detail.store_name)):
+                    self.checkpoint.saved_count += 1
+                    self.filter.add_to_processed(detail.store_url, detail.store_name, persist=False)
+                    self.saved_details.append(detail)
+
+            self.stats.record_keyword(keyword, visited - visited_before, self.checkpoint.saved_count - saved_before,
+                                      time.perf_counter() - keyword_started)
+
+        self.current_keyword = ""
+        self.checkpoint.visited_count += visited
+        self.stats.total_visited = visited
+        self.stats.total_saved = self.checkpoint.saved_count
+        self.storage.save_checkpoint(self.checkpoint)
+        return {
+            "status": "success",
+            "message": "캡처 크롤링 정상 종료",
+            "visited_count": visited,
+            "saved_count": self.checkpoint.saved_count,
+            "csv_path": str(self.storage.get_csv_filepath()),
+            "details": [detail.to_dict() for detail in self.saved_details],
+        }
+
+    def _parallel_crawling(self, keywords: List[str]) -> Dict[str, Any]:
+        """Playwright 컨텍스트 풀로 키워드 병렬 처리 (필터/저장소/통계 공유)"""
+        from .parallel_crawler import ParallelKeywordCrawler
+
+        crawler = ParallelKeywordCrawler(self.config, self.filter, self.storage, self.stats)
+        result = crawler.run(keywords)
+
+        self.saved_details.extend(crawler.saved_details)
+        self.checkpoint.saved_count += len(crawler.saved_details)
+        self.checkpoint.visited_count += result.get("visited_count", 0)
+        self.stats.total_saved = self.checkpoint.saved_count
+        self.storage.save_checkpoint(self.checkpoint)
+        return result
+
+    def _timed(self, name: str, func, *args):
+        """호출 소요시간을 RunStats.timings에 기록"""
+        start = time.perf_counter()
         try:
-            # 1단계: 리스트에서 기본 정보 추출
-            store_name_list = card.store_name
-            review_count = card.review_count
+            return func(*args)
+        finally:
+            self.stats.record_timing(name, time.perf_counter() - start)
+
+    def _passes_list_filters(self, card, count: bool = True) -> bool:
+        """목록 단계 필터 (리뷰 수 / 차단 목록 / 다중 입점 / 중복)"""
+        store_name_list = card.store_name
+        review_count = card.review_count
 
-            # 리뷰 수 필터링
-            if not self.filter.passes_review_range(review_count):
+        # 리뷰 수 필터링
+        if not self.filter.passes_review_range(review_count):
+            if count:
                 self.stats.skipped_review_range += 1
+                self.storage.record_skip(self.current_keyword, store_name_list, "review_range")
                 logger.debug(f"리뷰 범위 외 스킵: {review_count}")
-                return False
+            return False
 
-            # 차단 목록 체크
-            if self.filter.is_blocklisted(store_name_list):
+        # 차단 목록 체크
+        if self.filter.is_blocklisted(store_name_list):
+            if count:
                 self.stats.skipped_blocklist += 1
+                self.storage.record_skip(self.current_keyword, store_name_list, "blocklist")
                 logger.debug(f"차단 목록 스킵: {store_name_list}")
-                return False
+            return False
 
-            if self.filter.is_multi_store(store_name_list):
+        if self.filter.is_multi_store(store_name_list):
+            if count:
                 self.stats.skipped_multi_store += 1
+                self.storage.record_skip(self.current_keyword, store_name_list, "multi_store")
                 logger.debug(f"다중 입점 스킵: {store_name_list}")
+            return False
+
+        # 목록 상호명으로 먼저 중복 확인 (OCR 잡음이 있는 유사 이름 포함) - 상세 페이지 방문 절약
+        # 임시 이름(상점_N)/판독 불가 이름은 스토어를 구분하지 못하므로 상세 페이지에서 URL로 확인
+        if not is_unreadable_store_name(store_name_list) and self.filter.is_duplicate(None, store_name_list):
+            if count:
+                self.stats.skipped_duplicate += 1
+                self.storage.record_skip(self.current_keyword, store_name_list, "duplicate")
+                logger.debug(f"목록 단계 중복 스킵: {store_name_list}")
+            return False
+
+        return True
+
+    def _open_detail(self, card, lookahead: Sequence = ()) -> bool:
+        """상세 페이지 열기 (선로딩 모드면 다음 카드들을 백그라운드 탭으로 미리 열어 둠)"""
+        if not self.prefetcher.enabled:
+            return self.reader.open_card(card)
+
+        if not self.prefetcher.is_open(card) and not self.prefetcher.open(card):
+            return False
+        self.prefetcher.fill(lookahead, lambda upcoming: self._passes_list_filters(upcoming, count=False))
+        return self.prefetcher.activate(card)
+
+    def _leave_detail(self) -> bool:
+        if self.prefetcher.enabled:
+            return self.prefetcher.close_current()
+        return self.reader.back_to_list()
+
+    def _process_card(self, card, lookahead: Sequence = ()) -> bool:
+        """개별 카드 처리 (lookahead: 선로딩 모드에서 미리 열어 둘 다음 카드들)"""
+        left_detail = False
+        try:
+            # 1단계: 리스트에서 기본 정보 추출
+            store_name_list = card.store_name
+            review_count = card.review_count
+
+            if not self._passes_list_filters(card):
+                self.prefetcher.discard(card)
                 return False
 
             # 2단계: 상세 페이지 열기
-            if not self.reader.open_card(card):
+            if not self._open_detail(card, lookahead):
                 self.stats.errors += 1
                 return False
 
@@ -293,25 +523,31 @@ class NaverShoppingCrawler:
                 self.monitor.abort_with_notice("상세 페이지에서 의심 화면 감지")
                 return False
 
-            # 3단계: 상세 정보 추출
-            url = self.reader.get_current_url()
-            store_name_detail = self.reader.read_store_name_from_detail() or store_name_list
+            # 3단계: 상세 정보 추출 (URL 확인 후 화면만 캡처하고, OCR은 목록 복귀 대기와 겹쳐 진행)
+            url = self.reader.get_current_url(store_name_list)
+            self.storage.record_visit(self.current_keyword, store_name_list, url)
+            detail_ocr = self._timed("detail_capture", self.reader.submit_detail_ocr)
+            left_detail = True
+            self._leave_detail()
+
+            store_name_detail = self._timed("read_store_name", detail_ocr.store_name) or store_name_list
 
             # 중복 체크
             if self.filter.is_duplicate(url, store_name_detail):
                 self.stats.skipped_duplicate += 1
+                self.storage.record_skip(self.current_keyword, store_name_detail, "duplicate")
                 logger.debug(f"중복 스킵: {store_name_detail}")
-                self.reader.back_to_list()
+                detail_ocr.cancel()
                 return False
 
             # 관심고객 수 추출
-            interest_count = self.reader.read_interest_count()
+            interest_count = self._timed("read_interest", detail_ocr.interest_count)
 
             # 관심고객 수 필터링
             if not self.filter.passes_interest_range(interest_count):
                 self.stats.skipped_interest_range += 1
+                self.storage.record_skip(self.current_keyword, store_name_detail, "interest_range")
                 logger.debug(f"관심고객 범위 외 스킵: {interest_count}")
-                self.reader.back_to_list()
                 return False
 
             # 4단계: 저장
@@ -324,25 +560,24 @@ class NaverShoppingCrawler:
                 note=self.current_keyword or ""
             )
 
-            if self.storage.append_csv(store_detail):
-                self.filter.add_to_processed(url, store_name_detail)
+            # 중복 색인에는 행이 실제로 기록된 뒤 저장 (그 전까지는 이번 실행에서만 기억)
+            if self.storage.append_csv(store_detail, partial(self.filter.add_to_processed, url, store_name_detail)):
+                self.filter.add_to_processed(url, store_name_detail, persist=False)
                 self.checkpoint.saved_count += 1
-                self.checkpoint.processed_urls.add(url or "")
                 self.saved_details.append(store_detail)
                 logger.info(f"저장 완료: {store_name_detail} (리뷰: {review_count}, 관심: {interest_count})")
 
-            # 목록으로 돌아가기
-            self.reader.back_to_list()
             return True
 
         except Exception as e:
             logger.error(f"카드 처리 실패: {e}")
             self.stats.errors += 1
             # 목록으로 돌아가기 시도
-            try:
-                self.reader.back_to_list()
-            except:
-                pass
+            if not left_detail:
+                try:
+                    self._leave_detail()
+                except:
+                    pass
             return False
 
 
@@ -1,10 +1,27 @@
 """
 데이터 모델 정의
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import json
+import re
+
+# 목록에서 상호명 OCR에 실패한 카드에 붙이는 임시 이름 (화면 내 순번이라 스토어를 구분하지 못함)
+PLACEHOLDER_NAME_PREFIX = "상점_"
+_PLACEHOLDER_NAME = re.compile(rf"^{PLACEHOLDER_NAME_PREFIX}\d+$")
+
+
+def placeholder_store_name(index: int) -> str:
+    return f"{PLACEHOLDER_NAME_PREFIX}{index}"
+
+
+def is_unreadable_store_name(name: Optional[str]) -> bool:
+    """비어 있거나, 임시 이름이거나, 글자/숫자가 하나도 없는(OCR 잡음) 상호명"""
+    if not name or not isinstance(name, str):
+        return True
+    text = name.strip()
+    return not text or bool(_PLACEHOLDER_NAME.match(text)) or not re.search(r"\w", text)
 
 
 @dataclass
@@ -16,6 +33,7 @@ class StoreCard:
     height: int
     store_name: Optional[str] = None
     review_count: Optional[int] = None
+    url: Optional[str] = None
 
 
 @dataclass
@@ -112,9 +130,97 @@ class RunStats:
     skipped_multi_store: int = 0
     skipped_duplicate: int = 0
     errors: int = 0
+    screen_checks: int = 0
+    screen_escalations: int = 0
+    screen_suspicious: int = 0
+    ocr_cache_hits: int = 0
+    ocr_cache_misses: int = 0
+    interest_ocr_reads: int = 0
+    interest_ocr_area: int = 0
+    interest_roi_predicted: int = 0
+    interest_roi_misses: int = 0
+    timings: Dict[str, List[float]] = field(default_factory=dict)
+    # 키워드 → [방문, 저장, 소요초] (키워드 스케줄러가 run.log에서 다시 읽음)
+    keyword_yields: Dict[str, List[float]] = field(default_factory=dict)
+    wait_saved_seconds: float = 0.0
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
 
+    def record_timing(self, name: str, seconds: float):
+        """구간별 소요시간 기록"""
+        self.timings.setdefault(name, []).append(seconds)
+
+    def record_wait(self, label: str, seconds: float, budget: float):
+        """준비 상태 대기 기록 (budget = 기존 랜덤 대기였다면 기다렸을 평균 시간)"""
+        self.record_timing(f"wait_{label}", seconds)
+        self.wait_saved_seconds += budget - seconds
+
+    def wait_histogram(self, edges: tuple = (0.25, 0.5, 1.0, 2.0)) -> str:
+        """대기 종류별 소요시간 분포"""
+        lines = []
+        for name, samples in self.timings.items():
+            if not name.startswith("wait_") or not samples:
+                continue
+            counts = [0] * (len(edges) + 1)
+            for sample in samples:
+                counts[next((i for i, edge in enumerate(edges) if sample < edge), len(edges))] += 1
+            buckets = [f"<{edge:g}s {count}" for edge, count in zip(edges, counts)] + [f">={edges[-1]:g}s {counts[-1]}"]
+            lines.append(f"  - {name}: " + " | ".join(buckets))
+        if lines:
+            per_card = self.wait_saved_seconds / self.total_visited if self.total_visited else 0.0
+            lines.append(f"  - 대기 절약: 총 {self.wait_saved_seconds:.1f}초 (카드당 {per_card:.2f}초)")
+        return "\n".join(lines)
+
+    def timing_summary(self) -> str:
+        """구간별 횟수/평균/최대 소요시간"""
+        lines = []
+        for name, samples in self.timings.items():
+            if samples:
+                average = sum(samples) / len(samples) * 1000
+                lines.append(f"  - {name}: {len(samples)}회, 평균 {average:.1f}ms, 최대 {max(samples) * 1000:.1f}ms")
+        return "\n".join(lines)
+
+    def screen_guard_summary(self) -> str:
+        """의심 화면 감시 요약 (정밀 검사 없이 통과한 비율 = 캐시 적중률)"""
+        if not self.screen_checks:
+            return "화면 감시: 검사 없음"
+        hit_rate = (self.screen_checks - self.screen_escalations) / self.screen_checks * 100
+        return (f"화면 감시: 검사 {self.screen_checks}회, 정밀 검사 {self.screen_escalations}회 "
+                f"(적중률 {hit_rate:.1f}%), 감지 {self.screen_suspicious}회")
+
+    def ocr_cache_summary(self) -> str:
+        lookups = self.ocr_cache_hits + self.ocr_cache_misses
+        if not lookups:
+            return "OCR 캐시: 조회 없음"
+        return (f"OCR 캐시: 적중 {self.ocr_cache_hits}회 / 미스 {self.ocr_cache_misses}회 "
+                f"(적중률 {self.ocr_cache_hits / lookups * 100:.1f}%)")
+
+    def record_keyword(self, keyword: str, visited: int, saved: int, seconds: float):
+        """키워드 한 번 처리한 성과 누적"""
+        entry = self.keyword_yields.setdefault(keyword, [0, 0, 0.0])
+        entry[0] += visited
+        entry[1] += saved
+        entry[2] += seconds
+
+    def keyword_summary(self) -> str:
+        """키워드별 방문/저장/소요시간 (KeywordScheduler가 파싱하는 형식)"""
+        if not self.keyword_yields:
+            return "키워드별 성과: 없음"
+        lines = ["키워드별 성과:"]
+        for keyword, (visited, saved, seconds) in self.keyword_yields.items():
+            lines.append(f"  - {keyword}: 방문 {int(visited)}, 저장 {int(saved)}, {seconds / 60:.1f}분")
+        return "\n".join(lines)
+
+    def roi_calibration_summary(self) -> str:
+        """관심고객 ROI 예측 박스 미스율과 OCR 평균 면적"""
+        if not self.interest_ocr_reads:
+            return "관심고객 ROI: 인식 없음"
+        average_area = self.interest_ocr_area / self.interest_ocr_reads
+        miss_rate = (f"{self.interest_roi_misses / self.interest_roi_predicted * 100:.1f}%"
+                     if self.interest_roi_predicted else "-")
+        return (f"관심고객 ROI: 인식 {self.interest_ocr_reads}회, 예측 박스 {self.interest_roi_predicted}회 "
+                f"(미스율 {miss_rate}), 평균 OCR 면적 {average_area:,.0f}px")
+
     def summary(self) -> str:
         """요약 문자열"""
         duration = ""
@@ -133,5 +239,11 @@ class RunStats:
   - 다중 입점: {self.skipped_multi_store}
   - 중복: {self.skipped_duplicate}
 오류: {self.errors}
+{self.keyword_summary()}
+{self.screen_guard_summary()}
+{self.ocr_cache_summary()}
+{self.roi_calibration_summary()}
+{self.timing_summary()}
+{self.wait_histogram()}
 {duration}
 """
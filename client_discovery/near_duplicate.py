@@ -0,0 +1,155 @@
+"""
+OCR 잡음에 강한 유사 스토어명 색인
+같은 스토어도 실행마다 OCR 결과가 조금씩 달라(글자 하나 추가/누락, 띄어쓰기, ㅇ/o 혼동)
+정확히 같은 이름만 보는 중복 체크를 통과해 상세 페이지를 다시 방문하게 된다.
+  - 이름을 한글 자모로 분해하고 OCR 혼동 문자(ㅇ/o/0, ㅣ/l/1 등)를 통일
+    (서로 다른 자음끼리는 통일하지 않음 - 마켓/아켓은 다른 이름)
+  - 자모 n-gram MinHash 서명을 LSH 밴드로 나눠 후보만 빠르게 조회 (전체 비교 없음)
+  - 후보는 자모 편집 거리 유사도(1 - 거리/길이)로 확인해 임계값(기본 0.9) 이상이면 중복
+  - 자모 16개 미만의 짧은 이름은 한 글자 차이도 다른 스토어일 수 있어(다온/다은) 정확히 같을 때만 중복
+  - 지난 실행의 이름은 DedupeIndex에 저장한 밴드 키로 필요한 버킷만 조회 (시작 시 전체 서명 재계산 없음)
+(config.json "dedupe": {"name_similarity", "name_min_length", "minhash_permutations", "lsh_bands"})
+"""
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .dedupe_index import DedupeIndex, canonical_store_name
+
+HANGUL_BASE, HANGUL_LAST = 0xAC00, 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# OCR이 서로 자주 바꿔 읽는 문자
+OCR_CONFUSIONS = str.maketrans({"ㅇ": "o", "0": "o", "ㅣ": "l", "1": "l", "i": "l", "|": "l", "!": "l"})
+
+MERSENNE_PRIME = (1 << 31) - 1
+
+
+def jamo_key(name: Optional[str]) -> str:
+    """비교용 이름: 정규화 → 자모 분해 → OCR 혼동 문자 통일"""
+    canonical = canonical_store_name(name)
+    if not canonical:
+        return ""
+    parts = []
+    for ch in canonical:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            index = code - HANGUL_BASE
+            parts.append(CHOSEONG[index // 588] + JUNGSEONG[(index % 588) // 28] + JONGSEONG[index % 28])
+        else:
+            parts.append(ch)
+    return "".join(parts).translate(OCR_CONFUSIONS)
+
+
+def similarity(a: str, b: str) -> float:
+    """편집 거리 기반 유사도 (1 - 거리 / 긴 쪽 길이)"""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return 1.0 - previous[-1] / max(len(a), len(b))
+
+
+class NearDuplicateIndex:
+    """자모 n-gram MinHash + LSH 유사 이름 색인 (store가 있으면 저장된 이름도 후보로 조회)"""
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 64, bands: int = 16, ngram: int = 2, seed: int = 1,
+                 min_length: int = 16, store: Optional[DedupeIndex] = None):
+        if num_perm % bands:
+            raise ValueError(f"minhash_permutations({num_perm})는 lsh_bands({bands})의 배수여야 합니다")
+        self.threshold = float(threshold)
+        self.min_length = int(min_length)
+        self.bands = int(bands)
+        self.rows = num_perm // self.bands
+        self.ngram = int(ngram)
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, MERSENNE_PRIME, size=(num_perm, 1)).astype(np.uint64)
+        self._b = rng.randint(0, MERSENNE_PRIME, size=(num_perm, 1)).astype(np.uint64)
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self._keys: List[str] = []
+        self._names: List[str] = []
+        self._exact: Dict[str, int] = {}
+        self.store = store
+        self.synced = 0
+        if store is not None:
+            self.synced = store.sync_name_bands(f"{num_perm}:{bands}:{ngram}:{seed}", self._name_band_keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _signature(self, key: str) -> np.ndarray:
+        n = self.ngram
+        shingles = {key[i:i + n] for i in range(max(1, len(key) - n + 1))}
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) & MERSENNE_PRIME for s in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        return ((self._a * hashes + self._b) % MERSENNE_PRIME).min(axis=1)
+
+    def _band_keys(self, key: str) -> List[bytes]:
+        signature = self._signature(key)
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def _name_band_keys(self, name: str) -> List[bytes]:
+        key = jamo_key(name)
+        return self._band_keys(key) if key else []
+
+    def add(self, name: Optional[str]) -> bool:
+        """이름 추가 (같은 비교용 이름이 이미 있으면 False)"""
+        key = jamo_key(name)
+        if not key or key in self._exact:
+            return False
+        entry = len(self._keys)
+        self._keys.append(key)
+        self._names.append(name)
+        self._exact[key] = entry
+        for band, band_key in enumerate(self._band_keys(key)):
+            self._buckets[band].setdefault(band_key, []).append(entry)
+        return True
+
+    def add_many(self, names: Iterable[Optional[str]]) -> int:
+        return sum(self.add(name) for name in names)
+
+    def find(self, name: Optional[str]) -> Optional[Tuple[str, float]]:
+        """임계값 이상으로 비슷한 기존 이름 중 가장 비슷한 것 (이름, 유사도)"""
+        key = jamo_key(name)
+        if not key:
+            return None
+        if key in self._exact:
+            return self._names[self._exact[key]], 1.0
+
+        band_keys = self._band_keys(key)
+        if len(key) < self.min_length:
+            # 짧은 이름은 정확히 같을 때만 - 같은 자모 키는 모든 밴드가 같으므로 한 밴드만 조회
+            band_keys = band_keys[:1]
+        candidates: Dict[str, str] = {}
+        for band, band_key in enumerate(band_keys):
+            for entry in self._buckets[band].get(band_key, ()):
+                candidates[self._keys[entry]] = self._names[entry]
+        if self.store is not None:
+            for other_name in self.store.name_band_candidates(band_keys):
+                candidates.setdefault(jamo_key(other_name), other_name)
+        if key in candidates:
+            return candidates[key], 1.0
+        if len(key) < self.min_length:
+            return None
+
+        best = None
+        for other, other_name in candidates.items():
+            # 짧은 기존 이름, 또는 길이 차이만으로 임계값에 못 미치면 편집 거리 계산 생략
+            if len(other) < self.min_length or 1.0 - abs(len(other) - len(key)) / max(len(other), len(key)) < self.threshold:
+                continue
+            score = similarity(key, other)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (other_name, score)
+        return best
+
+    def __contains__(self, name: Optional[str]) -> bool:
+        return self.find(name) is not None
@@ -0,0 +1,261 @@
+"""
+네트워크 응답 캡처 모드
+검색 페이지가 받아오는 검색 API JSON을 Playwright 컨텍스트에서 가로채
+StoreCard / StoreDetail로 바로 변환한다 (렌더링/스크린샷/OCR 없음).
+녹화한 HAR 또는 JSON 파일을 그대로 재생할 수 있어 오프라인 벤치마크가 가능하다.
+"""
+import base64
+import json
+import re
+import urllib.parse
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .dom_backend import backend_config, parse_count
+from .models import StoreCard, StoreDetail
+from .utils import logger
+
+DEFAULT_URL_PATTERN = r"search\.shopping\.naver\.com/(api|ns)/.*search"
+DEFAULT_PRODUCT_PATHS = [
+    "shoppingResult.products", "products", "items", "data.products",
+    "props.pageProps.initialState.products.list",
+]
+DEFAULT_FIELDS = {
+    "store_name": ["mallName", "mallNm", "mallInfoCache.name"],
+    "review_count": ["reviewCount", "reviewCnt", "mallInfoCache.reviewCount"],
+    "url": ["mallPcUrl", "mallUrl", "mallInfoCache.mallPcUrl", "mallProductUrl", "crUrl"],
+    "interest_count": ["mallInfoCache.keepCnt", "keepCnt", "interestCount"],
+}
+# 캡처 모드에서는 화면이 필요 없으므로 무거운 리소스는 받지 않음
+BLOCKED_RESOURCES = {"image", "media", "font", "stylesheet"}
+
+
+def capture_config(config: dict) -> dict:
+    return config.get("capture", {}) if isinstance(config, dict) else {}
+
+
+def _lookup(item: Dict[str, Any], path: str) -> Any:
+    value: Any = item
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _first(item: Dict[str, Any], paths: Iterable[str]) -> Any:
+    for path in paths:
+        value = _lookup(item, path)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _as_count(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    return parse_count(str(value)) if value is not None else None
+
+
+def find_products(payload: Any, product_paths: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """검색 응답 JSON에서 상품 목록 찾기 ({"item": {...}} 래핑은 벗김)"""
+    if isinstance(payload, list):
+        products = payload
+    else:
+        products = []
+        for path in product_paths or DEFAULT_PRODUCT_PATHS:
+            value = _lookup(payload, path) if isinstance(payload, dict) else None
+            if isinstance(value, list):
+                products = value
+                break
+
+    unwrapped = []
+    for product in products:
+        if isinstance(product, dict) and isinstance(product.get("item"), dict):
+            product = product["item"]
+        if isinstance(product, dict):
+            unwrapped.append(product)
+    return unwrapped
+
+
+@dataclass
+class CapturedStore:
+    """상품 하나에서 뽑은 스토어 정보 (관심고객 수가 있으면 detail까지 완성)"""
+    card: StoreCard
+    detail: Optional[StoreDetail] = None
+
+
+def parse_search_payload(payload: Any, config: Optional[dict] = None, keyword: str = "") -> List[CapturedStore]:
+    """검색 API 응답 하나 → 스토어 목록 (한 페이지 40~80개)"""
+    capture_cfg = capture_config(config or {})
+    fields = dict(DEFAULT_FIELDS)
+    fields.update(capture_cfg.get("fields", {}))
+
+    stores = []
+    for product in find_products(payload, capture_cfg.get("product_paths")):
+        store_name = _first(product, fields["store_name"])
+        review_count = _as_count(_first(product, fields["review_count"]))
+        url = _first(product, fields["url"])
+        if not store_name and not url:
+            continue
+
+        card = StoreCard(x=0, y=0, width=0, height=0, store_name=str(store_name).strip() if store_name else None,
+                         review_count=review_count, url=str(url) if url else None)
+        interest_count = _as_count(_first(product, fields["interest_count"]))
+        detail = None
+        if interest_count is not None:
+            detail = StoreDetail(
+                store_name=card.store_name or "",
+                store_url=card.url or "",
+                review_count=review_count if review_count is not None else 0,
+                interest_count=interest_count,
+                collected_at=datetime.now(),
+                note=keyword,
+            )
+        stores.append(CapturedStore(card, detail))
+    return stores
+
+
+# === 재생 (HAR / JSON) ===
+
+def iter_har_payloads(path, url_pattern: str = DEFAULT_URL_PATTERN) -> Iterator[Any]:
+    """HAR 파일에서 검색 API 응답 JSON만 꺼내기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        har = json.load(f)
+
+    matcher = re.compile(url_pattern)
+    for entry in har.get("log", {}).get("entries", []):
+        if not matcher.search(entry.get("request", {}).get("url", "")):
+            continue
+        content = entry.get("response", {}).get("content", {})
+        text = content.get("text")
+        if not text:
+            continue
+        if content.get("encoding") == "base64":
+            text = base64.b64decode(text).decode("utf-8")
+        try:
+            yield json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.debug(f"HAR 응답 JSON 파싱 실패: {e}")
+
+
+def iter_recorded_payloads(path, url_pattern: str = DEFAULT_URL_PATTERN) -> Iterator[Any]:
+    """HAR/JSON 파일 또는 그 파일들이 든 폴더 재생"""
+    path = Path(path)
+    files = sorted(p for p in path.iterdir() if p.suffix in (".har", ".json")) if path.is_dir() else [path]
+    for file_path in files:
+        if file_path.suffix == ".har":
+            yield from iter_har_payloads(file_path, url_pattern)
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                yield json.load(f)
+
+
+# === 필터 적용 ===
+
+@dataclass
+class CaptureResult:
+    details: List[StoreDetail] = field(default_factory=list)
+    # 관심고객 수가 응답에 없어 상세 확인이 필요한 카드
+    pending_cards: List[StoreCard] = field(default_factory=list)
+    parsed: int = 0
+
+
+class CaptureProcessor:
+    """캡처한 응답을 FilterManager 규칙으로 걸러 저장 대상/상세 확인 대상으로 분류"""
+
+    def __init__(self, config, filter_manager, stats=None):
+        self.config = config
+        self.filter = filter_manager
+        self.stats = stats
+
+    def _skip(self, counter: str):
+        if self.stats is not None:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def process(self, payloads: Iterable[Any], keyword: str = "") -> CaptureResult:
+        result = CaptureResult()
+        for payload in payloads:
+            for store in parse_search_payload(payload, self.config, keyword):
+                result.parsed += 1
+                card = store.card
+                if not self.filter.passes_review_range(card.review_count):
+                    self._skip("skipped_review_range")
+                elif self.filter.is_blocklisted(card.store_name):
+                    self._skip("skipped_blocklist")
+                elif self.filter.is_multi_store(card.store_name):
+                    self._skip("skipped_multi_store")
+                elif self.filter.is_duplicate(card.url, card.store_name):
+                    self._skip("skipped_duplicate")
+                elif store.detail is None:
+                    result.pending_cards.append(card)
+                    # 같은 응답 묶음 안의 중복 카드는 한 번만 (저장 전이므로 이번 실행에서만 기억)
+                    self.filter.add_to_processed(card.url, card.store_name, persist=False)
+                elif not self.filter.passes_interest_range(store.detail.interest_count):
+                    self._skip("skipped_interest_range")
+                else:
+                    # 중복 색인 저장은 크롤러가 결과 행을 기록한 뒤에
+                    self.filter.add_to_processed(card.url, card.store_name, persist=False)
+                    result.details.append(store.detail)
+        return result
+
+
+# === 실시간 캡처 ===
+
+class NetworkCapture:
+    """Playwright 컨텍스트에서 검색 API 응답을 가로채 수집"""
+
+    def __init__(self, config, session):
+        self.config = config
+        self.session = session
+        capture_cfg = capture_config(config)
+        self.url_pattern = re.compile(capture_cfg.get("url_pattern", DEFAULT_URL_PATTERN))
+        self.pages = int(capture_cfg.get("pages_per_keyword", 3))
+        self._payloads: List[Any] = []
+        self._installed = False
+
+    def _install(self, page):
+        if self._installed:
+            return
+        page.route("**/*", lambda route: route.abort()
+                   if route.request.resource_type in BLOCKED_RESOURCES else route.continue_())
+        page.on("response", self._on_response)
+        self._installed = True
+
+    def _on_response(self, response):
+        if not self.url_pattern.search(response.url):
+            return
+        try:
+            self._payloads.append(response.json())
+        except Exception as e:
+            logger.debug(f"캡처 응답 JSON 파싱 실패 ({response.url}): {e}")
+
+    def collect(self, keyword: str) -> List[Any]:
+        """키워드 검색 결과 여러 페이지의 응답 JSON 수집"""
+        backend_cfg = backend_config(self.config)
+        template = backend_cfg.get("search_url", "https://search.shopping.naver.com/search/all?query={query}&sort=review")
+        page = self.session.list_page
+        self._install(page)
+        self._payloads = []
+
+        for page_index in range(1, self.pages + 1):
+            url = template.format(query=urllib.parse.quote(keyword))
+            if page_index > 1:
+                url += f"&pagingIndex={page_index}"
+            try:
+                page.goto(url, wait_until="domcontentloaded")
+                page.wait_for_load_state("networkidle")
+                # 첫 페이지는 서버 렌더링 데이터(__NEXT_DATA__)에 담겨 오는 경우가 있음
+                next_data = page.evaluate("() => window.__NEXT_DATA__ || null")
+                if next_data:
+                    self._payloads.append(next_data)
+            except Exception as e:
+                logger.warning(f"[캡처] 페이지 로드 실패 ({url}): {e}")
+                break
+
+        logger.info(f"[캡처] {keyword}: 응답 {len(self._payloads)}개 수집")
+        return list(self._payloads)
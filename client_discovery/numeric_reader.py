@@ -0,0 +1,200 @@
+"""
+숫자 전용 리더
+'리뷰'/'관심고객' 라벨 앵커 바로 옆의 숫자 구간만 잘라 숫자 화이트리스트 + 한 줄 모드로 OCR
+"""
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from ocr.service import OcrWord, get_ocr_service
+from .utils import logger
+
+DIGIT_VARIABLES = {"tessedit_char_whitelist": "0123456789,"}
+DEFAULT_ANCHORS = {
+    "label_review": "assets/img/label_review.png",
+    "label_interest": "assets/img/label_interest.png",
+}
+
+
+class NumericReader:
+    """라벨 앵커 옆 숫자 구간 OCR (신뢰도가 낮으면 None을 반환해 호출 측이 전체 OCR로 폴백)"""
+
+    def __init__(self, config: Optional[dict] = None, ocr=None):
+        self.config = config or {}
+        self.ocr = ocr or get_ocr_service()
+        self._templates: Dict[str, Optional[np.ndarray]] = {}
+
+    # === 설정 ===
+
+    def _ocr_cfg(self) -> dict:
+        return self.config.get("ocr", {}) if isinstance(self.config, dict) else {}
+
+    @property
+    def min_confidence(self) -> float:
+        return float(self._ocr_cfg().get("numeric_min_confidence", 60))
+
+    @property
+    def span_width(self) -> int:
+        return int(self._ocr_cfg().get("numeric_span_width", 120))
+
+    @property
+    def anchor_confidence(self) -> float:
+        layout = self.config.get("layout", {}) if isinstance(self.config, dict) else {}
+        return float(layout.get("anchor_confidence", 0.75))
+
+    def _template(self, anchor_key: str) -> Optional[np.ndarray]:
+        """앵커 템플릿을 회색조로 한 번만 로드"""
+        if anchor_key not in self._templates:
+            anchors = self.config.get("anchors", {}) if isinstance(self.config, dict) else {}
+            path = anchors.get(anchor_key) or DEFAULT_ANCHORS.get(anchor_key)
+            template = None
+            if path and Path(path).exists():
+                template = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+            if template is None:
+                logger.debug(f"숫자 리더 앵커 없음: {anchor_key}")
+            self._templates[anchor_key] = template
+        return self._templates[anchor_key]
+
+    # === 앵커/숫자 구간 ===
+
+    def find_anchor(self, image: np.ndarray, anchor_key: str) -> Optional[Tuple[int, int, int, int]]:
+        """ROI 안에서 라벨 앵커 위치 (x, y, w, h) 탐색"""
+        template = self._template(anchor_key)
+        if image is None or template is None:
+            return None
+
+        gray = _to_gray(image)
+        t_height, t_width = template.shape[:2]
+        if gray.shape[0] < t_height or gray.shape[1] < t_width:
+            return None
+
+        result = cv2.matchTemplate(gray, template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (x, y) = cv2.minMaxLoc(result)
+        if score < self.anchor_confidence:
+            return None
+        return x, y, t_width, t_height
+
+    def digit_span(self, image: np.ndarray, anchor_box: Tuple[int, int, int, int], gap: int = 2,
+                   pad: int = 4) -> Optional[np.ndarray]:
+        """앵커 오른쪽 숫자 구간을 잘라 OCR용으로 이진화"""
+        if image is None:
+            return None
+
+        x, y, width, height = anchor_box
+        x0 = x + width + gap
+        x1 = min(image.shape[1], x0 + self.span_width)
+        y0 = max(0, y - pad)
+        y1 = min(image.shape[0], y + height + pad)
+        if x1 - x0 < 4 or y1 - y0 < 4:
+            return None
+
+        return preprocess_digits(image[y0:y1, x0:x1])
+
+    # === 인식 ===
+
+    def read_digits(self, span: np.ndarray) -> Optional[Tuple[int, float]]:
+        """전처리된 숫자 구간을 한 줄 모드로 인식해 (값, 최소 단어 신뢰도) 반환"""
+        if span is None or not self.ocr.available:
+            return None
+        words = self.ocr.image_to_words(span, lang="eng", psm=7, variables=DIGIT_VARIABLES)
+        return parse_digits(words)
+
+    def read_span(self, image: np.ndarray) -> Optional[int]:
+        """앵커 옆에서 이미 잘라낸 숫자 구간 읽기 (실패/저신뢰 시 None)"""
+        if image is None or image.size == 0:
+            return None
+        return self._accept(self.read_digits(preprocess_digits(image)))
+
+    def read_after_anchor(self, image: np.ndarray, anchor_key: str) -> Optional[int]:
+        """ROI에서 앵커를 찾아 옆 숫자만 읽기 (실패/저신뢰 시 None)"""
+        anchor_box = self.find_anchor(image, anchor_key)
+        if anchor_box is None:
+            return None
+        return self._accept(self.read_digits(self.digit_span(image, anchor_box)))
+
+    def read_batch(self, images: Sequence[Optional[np.ndarray]], anchor_key: str) -> List[Optional[int]]:
+        """여러 ROI의 숫자 구간을 모자이크 한 장으로 인식"""
+        spans = []
+        for image in images:
+            anchor_box = self.find_anchor(image, anchor_key) if image is not None else None
+            spans.append(self.digit_span(image, anchor_box) if anchor_box else None)
+
+        if not self.ocr.available or all(span is None for span in spans):
+            return [None] * len(spans)
+
+        results = self.ocr.image_to_string_batch(spans, lang="eng", psm=6, variables=DIGIT_VARIABLES)
+        return [
+            self._accept(parse_digits(result.words)) if span is not None else None
+            for span, result in zip(spans, results)
+        ]
+
+    def _accept(self, parsed: Optional[Tuple[int, float]]) -> Optional[int]:
+        if parsed is None:
+            return None
+        value, confidence = parsed
+        if confidence < self.min_confidence:
+            logger.debug(f"숫자 OCR 신뢰도 낮음: {value} ({confidence:.0f})")
+            return None
+        return value
+
+
+def _to_gray(image: np.ndarray) -> np.ndarray:
+    if image.ndim == 2:
+        return image
+    if image.shape[2] == 4:
+        return cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+def preprocess_digits(image: np.ndarray, scale: float = 2.0) -> np.ndarray:
+    """회색조 → 확대 → Otsu 이진화 (흰 배경에 검은 글자)"""
+    gray = _to_gray(image)
+    gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if binary.mean() < 127:
+        binary = cv2.bitwise_not(binary)
+    return binary
+
+
+# 글자 높이 대비 이 비율보다 넓은 가로 간격이면 다른 숫자 (1,234 와 5,678 이 붙지 않도록)
+WORD_GAP_RATIO = 0.6
+
+
+def parse_digits(words: Sequence[OcrWord]) -> Optional[Tuple[int, float]]:
+    """단어 목록에서 첫 숫자 덩어리와 그 덩어리의 최소 신뢰도 추출
+    (OCR이 한 숫자를 여러 단어로 쪼갠 경우만 이어 붙이고, 간격이 벌어진 단어는 따로 봄)"""
+    words = sorted((w for w in words if w.text), key=lambda w: w.left)
+    clusters: List[List[OcrWord]] = []
+    for word in words:
+        if clusters:
+            last = clusters[-1][-1]
+            gap = word.left - (last.left + last.width)
+            if gap <= max(word.height, last.height) * WORD_GAP_RATIO:
+                clusters[-1].append(word)
+                continue
+        clusters.append([word])
+
+    for cluster in clusters:
+        match = re.search(r'\d[\d,]*', "".join(w.text for w in cluster))
+        if not match:
+            continue
+        try:
+            value = int(match.group(0).replace(',', ''))
+        except ValueError:
+            continue
+        return value, min(w.confidence for w in cluster)
+    return None
+
+
+_default_reader: Optional[NumericReader] = None
+
+
+def get_default_reader() -> NumericReader:
+    """설정 없이 쓰는 유틸 함수용 기본 리더 (템플릿 캐시 공유)"""
+    global _default_reader
+    if _default_reader is None:
+        _default_reader = NumericReader()
+    return _default_reader
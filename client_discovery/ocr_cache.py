@@ -0,0 +1,161 @@
+"""
+OCR 결과 캐시
+같은 스토어의 이름/리뷰/관심고객 라벨은 키워드와 실행일이 달라도 같은 픽셀로 그려지므로
+ROI의 지각 해시(축소 회색조 가로 그래디언트 비트) + OCR 종류/파라미터를 키로 파싱 결과를 재사용한다.
+크기 제한 LRU로 보관하고 JSON 파일로 디스크에 저장해 다음 실행에서도 사용한다.
+(config.json "ocr": {"cache_enabled", "cache_path", "cache_max_entries"})
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import cv2
+import numpy as np
+
+from .utils import logger
+
+CACHE_VERSION = 1
+HASH_WIDTH = 128
+MAX_HASH_HEIGHT = 32
+
+
+def roi_hash(image: Any) -> Optional[str]:
+    """ROI 지각 해시 (비율을 유지해 가로 128칸으로 줄인 뒤 이웃 픽셀 밝기 비교 비트)"""
+    if image is None:
+        return None
+    array = np.asarray(image)
+    if array.size == 0 or array.ndim < 2:
+        return None
+    if array.ndim == 3:
+        # PIL(RGB)과 OpenCV(BGR) 입력이 같은 해시가 되도록 채널 평균으로 회색조 변환
+        array = array[:, :, :3].mean(axis=2)
+    gray = array.astype(np.float32)
+
+    height, width = gray.shape
+    hash_height = int(min(MAX_HASH_HEIGHT, max(4, round(HASH_WIDTH * height / max(width, 1)))))
+    thumb = cv2.resize(gray, (HASH_WIDTH + 1, hash_height), interpolation=cv2.INTER_AREA)
+    bits = np.packbits(thumb[:, 1:] > thumb[:, :-1])
+    return hashlib.sha1(bits.tobytes() + bytes([hash_height])).hexdigest()
+
+
+class OcrResultCache:
+    """지각 해시 키 → OCR 파싱 결과 LRU 캐시 (디스크 저장)"""
+
+    def __init__(self, config: Optional[dict] = None, stats=None):
+        ocr_cfg = (config or {}).get("ocr", {}) if isinstance(config, dict) else {}
+        self.enabled = bool(ocr_cfg.get("cache_enabled", True))
+        self.path = Path(ocr_cfg.get("cache_path", "client_discovery/ocr_cache.json"))
+        self.max_entries = int(ocr_cfg.get("cache_max_entries", 20000))
+        self.lang = ocr_cfg.get("lang", "kor+eng")
+        self.stats = stats
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._dirty = 0
+        if self.enabled:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, kind: str, image: Any, params: str = "") -> Optional[str]:
+        digest = roi_hash(image)
+        return f"{kind}|{self.lang}|{params}|{digest}" if digest else None
+
+    def get_or_compute(self, kind: str, image: Any, compute: Callable[[], Any], params: str = "") -> Any:
+        """캐시에 있으면 반환, 없으면 compute() 결과를 저장 (None/빈 결과는 저장하지 않음)"""
+        key = self.key(kind, image, params) if self.enabled else None
+        if key is None:
+            return compute()
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._count("ocr_cache_hits")
+            return self._entries[key]
+
+        self._count("ocr_cache_misses")
+        value = compute()
+        if value not in (None, ""):
+            self.put(key, value)
+        return value
+
+    def get(self, kind: str, image: Any, params: str = "") -> Any:
+        """배치 OCR처럼 계산을 직접 하는 경로용 조회 (없으면 None)"""
+        key = self.key(kind, image, params) if self.enabled else None
+        if key is None:
+            return None
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._count("ocr_cache_hits")
+            return self._entries[key]
+        self._count("ocr_cache_misses")
+        return None
+
+    def store(self, kind: str, image: Any, value: Any, params: str = ""):
+        key = self.key(kind, image, params) if self.enabled else None
+        if key is not None and value not in (None, ""):
+            self.put(key, value)
+
+    def put(self, key: str, value: Any):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._dirty += 1
+        if self._dirty >= 200:
+            self.save()
+
+    def _count(self, counter: str):
+        if self.stats is not None:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    # === 디스크 ===
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                logger.info("OCR 캐시 버전이 달라 새로 시작합니다.")
+                return
+            entries = data.get("entries", [])[-self.max_entries:]
+            self._entries = OrderedDict((key, value) for key, value in entries)
+            logger.info(f"OCR 캐시 로드: {len(self._entries)}개")
+        except Exception as e:
+            logger.warning(f"OCR 캐시 로드 실패: {e}")
+
+    def save(self):
+        """LRU 순서를 유지해 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.enabled or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": CACHE_VERSION, "entries": list(self._entries.items())}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = 0
+        except Exception as e:
+            logger.warning(f"OCR 캐시 저장 실패: {e}")
+
+
+_default_cache: Optional[OcrResultCache] = None
+
+
+def configure_ocr_cache(config: Optional[dict] = None, stats=None) -> OcrResultCache:
+    """크롤러 설정/통계로 전역 캐시 교체"""
+    global _default_cache
+    if _default_cache is not None:
+        _default_cache.save()
+    _default_cache = OcrResultCache(config, stats)
+    return _default_cache
+
+
+def get_ocr_cache() -> OcrResultCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = OcrResultCache({"ocr": {"cache_enabled": False}})
+    return _default_cache
@@ -0,0 +1,154 @@
+"""
+캡처 → OCR 파이프라인
+화면 캡처와 마우스/키보드 이동은 제어 스레드에서 하고, 잘라낸 ROI의 OCR은 프로세스 풀에 넘겨
+결과를 Future로 받는다. 크롤러는 상세 페이지 ROI를 캡처한 즉시 목록으로 돌아가고(로딩 대기)
+결과가 실제로 필요할 때만 기다리므로 페이지 이동/로딩과 OCR이 여러 코어에서 겹친다.
+(config.json "pipeline": {"ocr_workers": N}, 0이면 프로세스 없이 결과가 필요할 때 제어 스레드에서 실행)
+
+작업 함수는 피클 가능한 모듈 수준 함수여야 하며, 워커 프로세스에서 필요한 객체(OCR 엔진,
+숫자 리더 등)는 worker_object()로 프로세스마다 한 번만 만든다.
+"""
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from .utils import logger
+
+_worker_config: Dict[str, Any] = {}
+_worker_objects: Dict[str, Any] = {}
+
+
+def _init_worker(config: Dict[str, Any]):
+    """워커 프로세스 초기화 (Tesseract 내부 스레드는 1개로 제한해 코어를 워커끼리 나눔)"""
+    global _worker_config
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    _worker_config = config or {}
+    _worker_objects.clear()
+
+
+def worker_object(name: str, factory: Callable[[Dict[str, Any]], Any]) -> Any:
+    """현재 프로세스의 작업용 객체 (처음 호출 시 factory(config)로 생성)"""
+    if name not in _worker_objects:
+        _worker_objects[name] = factory(_worker_config)
+    return _worker_objects[name]
+
+
+def completed(value: Any) -> Future:
+    """이미 값이 정해진 Future (캐시 적중/DOM 백엔드용)"""
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
+class DeferredFuture(Future):
+    """워커 없이 result()를 처음 호출할 때 호출 스레드에서 계산하는 Future"""
+
+    def __init__(self, func: Callable, *args):
+        super().__init__()
+        self._call = (func, args)
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        if not self.done() and self.set_running_or_notify_cancel():
+            func, args = self._call
+            try:
+                self.set_result(func(*args))
+            except BaseException as exc:
+                self.set_exception(exc)
+        return super().result(timeout)
+
+
+class DetailOcrJob:
+    """제출한 상세 페이지 OCR (스토어명/관심고객수) - 결과는 필요할 때만 대기"""
+
+    def __init__(self, store_name: Future, interest_count: Future,
+                 on_result: Optional[Callable[[str, Any], Any]] = None):
+        # on_result(kind, value): 결과 후처리(캐시 저장 등) 후 최종 값을 반환
+        self._futures = {"store_name": store_name, "interest_count": interest_count}
+        self._values: Dict[str, Any] = {}
+        self._on_result = on_result
+
+    def _await(self, kind: str) -> Any:
+        if kind not in self._values:
+            try:
+                value = self._futures[kind].result()
+            except Exception as e:
+                logger.error(f"상세 OCR 작업 실패 ({kind}): {e}")
+                value = None
+            if self._on_result is not None:
+                value = self._on_result(kind, value)
+            self._values[kind] = value
+        return self._values[kind]
+
+    def store_name(self) -> Optional[str]:
+        return self._await("store_name")
+
+    def interest_count(self) -> Optional[int]:
+        return self._await("interest_count")
+
+    def cancel(self):
+        """더 필요 없는 결과 (중복 스토어 등) - 아직 시작하지 않은 작업은 실행하지 않음"""
+        for kind, future in self._futures.items():
+            if kind not in self._values:
+                future.cancel()
+
+
+class OcrPipeline:
+    """OCR 작업 제출기 (프로세스 풀 또는 지연 실행)"""
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config = config if isinstance(config, dict) else {}
+        pipeline_cfg = self.config.get("pipeline", {})
+        self.workers = max(0, int(pipeline_cfg.get("ocr_workers", 0) or 0))
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def parallel(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # fork는 pyautogui/OCR 엔진 스레드 상태까지 복제하므로 spawn으로 새 프로세스 시작
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.config,),
+            )
+            logger.info(f"OCR 워커 프로세스 {self.workers}개 시작")
+        return self._executor
+
+    def submit(self, func: Callable, *args, local: Optional[Callable] = None) -> Future:
+        """OCR 작업 제출 (워커가 없거나 풀 시작에 실패하면 local 또는 func를 지연 실행)"""
+        if self.parallel:
+            try:
+                return self._get_executor().submit(func, *args)
+            except Exception as e:
+                logger.warning(f"OCR 워커 제출 실패 - 제어 스레드에서 실행합니다: {e}")
+                self.close()
+                self.workers = 0
+        return DeferredFuture(local or func, *args)
+
+    def close(self):
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_default_pipeline: Optional[OcrPipeline] = None
+
+
+def configure_ocr_pipeline(config: Optional[dict] = None) -> OcrPipeline:
+    """크롤러 설정으로 전역 파이프라인 교체"""
+    global _default_pipeline
+    if _default_pipeline is not None:
+        _default_pipeline.close()
+    _default_pipeline = OcrPipeline(config)
+    return _default_pipeline
+
+
+def get_ocr_pipeline() -> OcrPipeline:
+    global _default_pipeline
+    if _default_pipeline is None:
+        _default_pipeline = OcrPipeline()
+    return _default_pipeline
@@ -0,0 +1,244 @@
+"""
+키워드 병렬 크롤러 (Playwright 비동기)
+브라우저 하나에 컨텍스트 N개를 띄워 키워드 큐를 나눠 처리한다.
+중복 판정(FilterManager)과 CSV 저장(StorageManager)은 락으로 공유하고,
+모든 컨텍스트의 페이지 요청은 전역 요청 간격(politeness)을 지킨다.
+"""
+import asyncio
+import time
+import urllib.parse
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .dom_backend import (LIST_STATE_JS, MORE_CARDS_JS, backend_config, get_selectors, parse_detail_html,
+                          parse_list_html, scroll_load_timeout)
+from .m4_filter import FilterManager
+from .m5_storage import StorageManager
+from .models import RunStats, StoreCard, StoreDetail
+from .utils import logger
+
+
+class RateLimiter:
+    """전역 요청 간격 제한 (모든 워커가 공유하는 최소 간격)"""
+
+    def __init__(self, requests_per_sec: float):
+        self.interval = 1.0 / requests_per_sec if requests_per_sec > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ParallelKeywordCrawler:
+    """컨텍스트 풀 기반 키워드 병렬 수집기"""
+
+    def __init__(self, config, filter_manager: Optional[FilterManager] = None,
+                 storage: Optional[StorageManager] = None, stats: Optional[RunStats] = None):
+        self.config = config
+        self.filter = filter_manager or FilterManager(config)
+        self.storage = storage or StorageManager(config)
+        self.stats = stats or RunStats()
+        self.selectors = get_selectors(config)
+
+        backend_cfg = backend_config(config)
+        search_cfg = config.get("search", {})
+        self.contexts = max(1, int(backend_cfg.get("parallel_contexts", 3)))
+        self.requests_per_sec = float(backend_cfg.get("requests_per_sec", 1.0))
+        self.max_scrolls = int(backend_cfg.get("max_scrolls", 10))
+        self.scroll_load_timeout = scroll_load_timeout(config)
+        self.max_per_keyword = int(search_cfg.get("max_results_per_keyword", 0) or 0)
+        self.max_overall = int(search_cfg.get("max_visits_per_run", 0) or 0)
+
+        self.saved_details: List[StoreDetail] = []
+        self._claimed: Set[str] = set()
+        self._visited = 0
+        self._filter_lock: Optional[asyncio.Lock] = None
+        self._storage_lock: Optional[asyncio.Lock] = None
+        self._limiter: Optional[RateLimiter] = None
+
+    def run(self, keywords: List[str]) -> Dict[str, Any]:
+        """동기 진입점"""
+        return asyncio.run(self.run_async(keywords))
+
+    async def run_async(self, keywords: List[str]) -> Dict[str, Any]:
+        from playwright.async_api import async_playwright
+
+        self._filter_lock = asyncio.Lock()
+        self._storage_lock = asyncio.Lock()
+        self._limiter = RateLimiter(self.requests_per_sec)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for keyword in keywords:
+            queue.put_nowait(keyword)
+
+        backend_cfg = backend_config(self.config)
+        storage_state = backend_cfg.get("storage_state", "playwright/storage_state.json")
+        context_kwargs = {"storage_state": storage_state} if storage_state and Path(storage_state).exists() else {}
+        workers = min(self.contexts, len(keywords)) or 1
+
+        logger.info(f"병렬 크롤링 시작: 키워드 {len(keywords)}개, 컨텍스트 {workers}개")
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=bool(backend_cfg.get("headless", True)))
+            try:
+                await asyncio.gather(*(self._worker(i, browser, context_kwargs, queue) for i in range(workers)))
+            finally:
+                await browser.close()
+
+        self.stats.total_visited = self._visited
+        self.storage.flush()
+        return {
+            "status": "success",
+            "message": "병렬 크롤링 정상 종료",
+            "visited_count": self._visited,
+            "saved_count": len(self.saved_details),
+            "csv_path": str(self.storage.get_csv_filepath()),
+            "details": [detail.to_dict() for detail in self.saved_details],
+        }
+
+    # === 워커 ===
+
+    async def _worker(self, index: int, browser, context_kwargs: dict, queue: asyncio.Queue):
+        context = await browser.new_context(**context_kwargs)
+        context.set_default_timeout(int(backend_config(self.config).get("timeout_ms", 15000)))
+        list_page = await context.new_page()
+        detail_page = await context.new_page()
+        try:
+            while not queue.empty() and not self._overall_limit_reached():
+                keyword = queue.get_nowait()
+                try:
+                    await self._crawl_keyword(keyword, list_page, detail_page)
+                except Exception as e:
+                    logger.error(f"[워커 {index}] 키워드 처리 실패 ({keyword}): {e}")
+                    self.stats.errors += 1
+        finally:
+            await context.close()
+
+    def _overall_limit_reached(self) -> bool:
+        return bool(self.max_overall) and self._visited >= self.max_overall
+
+    async def _goto(self, page, url: str):
+        await self._limiter.wait()
+        await page.goto(url, wait_until="domcontentloaded")
+
+    async def _crawl_keyword(self, keyword: str, list_page, detail_page):
+        template = backend_config(self.config).get(
+            "search_url", "https://search.shopping.naver.com/search/all?query={query}&sort=review")
+        url = template.format(query=urllib.parse.quote(keyword))
+        review_sorted = "sort=review" in url
+        review_min = self.config["search"]["review_min"]
+        review_max = self.config["search"]["review_max"]
+
+        keyword_started = time.perf_counter()
+        saved_before = len(self.saved_details)
+        visited = 0
+        try:
+            await self._goto(list_page, url)
+            await list_page.wait_for_selector(self.selectors["card"])
+            logger.info(f"[{keyword}] 검색 결과 로드")
+            visited = await self._scan_keyword(keyword, list_page, detail_page, review_sorted, review_min, review_max)
+        finally:
+            # 다른 워커의 저장분이 섞이지 않도록 이 키워드(note)로 저장된 건만 센다
+            saved = sum(1 for detail in self.saved_details[saved_before:] if detail.note == keyword)
+            self.stats.record_keyword(keyword, visited, saved, time.perf_counter() - keyword_started)
+
+    async def _scan_keyword(self, keyword: str, list_page, detail_page, review_sorted: bool,
+                            review_min: int, review_max: int) -> int:
+        """목록을 스크롤하며 카드 처리 (방문한 상세 수 반환)"""
+        visited = 0
+        handled = 0
+        for _ in range(self.max_scrolls + 1):
+            cards = parse_list_html(await list_page.content(), self.selectors, list_page.url)
+            for card in cards[handled:]:
+                if card.review_count is None:
+                    continue
+                if review_sorted and card.review_count < review_min:
+                    logger.info(f"[{keyword}] 리뷰 {review_min} 미만 도달 - 키워드 종료")
+                    return visited
+                if card.review_count > review_max:
+                    self.stats.skipped_review_range += 1
+                    continue
+                if self._overall_limit_reached() or (self.max_per_keyword and visited >= self.max_per_keyword):
+                    return visited
+                if await self._process_card(card, keyword, detail_page):
+                    visited += 1
+
+            handled = len(cards)
+            if not await self._scroll_for_more(list_page):
+                logger.info(f"[{keyword}] 스크롤 후 새 카드 없음 - 목록 끝")
+                break
+        return visited
+
+    async def _scroll_for_more(self, list_page) -> bool:
+        """목록을 스크롤하고 지연 로딩 카드를 기다림 (바닥에서 카드가 늘지 않으면 False)"""
+        selector = self.selectors["card"]
+        count, scroll_y = await list_page.evaluate(LIST_STATE_JS, selector)
+        await list_page.mouse.wheel(0, int(self.config.get("timing", {}).get("scroll_step", 400)) * 3)
+        try:
+            await list_page.wait_for_function(MORE_CARDS_JS, arg=[selector, count, scroll_y],
+                                              timeout=self.scroll_load_timeout)
+            return True
+        except Exception:
+            return False
+
+    async def _claim(self, card: StoreCard) -> bool:
+        """다른 워커와 겹치지 않게 카드 선점 (필터/중복 판정은 락 안에서)"""
+        async with self._filter_lock:
+            if self.filter.is_blocklisted(card.store_name):
+                self.stats.skipped_blocklist += 1
+                return False
+            if self.filter.is_multi_store(card.store_name):
+                self.stats.skipped_multi_store += 1
+                return False
+            key = card.url or card.store_name or ""
+            if not key or key in self._claimed or self.filter.is_duplicate(card.url, card.store_name):
+                self.stats.skipped_duplicate += 1
+                return False
+            self._claimed.add(key)
+            return True
+
+    async def _process_card(self, card: StoreCard, keyword: str, detail_page) -> bool:
+        if not card.url or not await self._claim(card):
+            return False
+
+        self._visited += 1
+        try:
+            await self._goto(detail_page, card.url)
+            detail = parse_detail_html(await detail_page.content(), self.selectors)
+        except Exception as e:
+            logger.error(f"[{keyword}] 상세 읽기 실패 ({card.url}): {e}")
+            self.stats.errors += 1
+            return True
+
+        interest_count = detail.get("interest_count")
+        store_name = detail.get("store_name") or card.store_name or ""
+        if not self.filter.passes_interest_range(interest_count):
+            self.stats.skipped_interest_range += 1
+            return True
+
+        store_detail = StoreDetail(
+            store_name=store_name,
+            store_url=detail_page.url,
+            review_count=card.review_count,
+            interest_count=interest_count,
+            collected_at=datetime.now(),
+            note=keyword,
+        )
+        async with self._storage_lock:
+            saved = await asyncio.to_thread(self.storage.append_csv, store_detail,
+                                            partial(self.filter.add_to_processed, detail_page.url, store_name))
+        if saved:
+            async with self._filter_lock:
+                self.filter.add_to_processed(detail_page.url, store_name, persist=False)
+            self.saved_details.append(store_detail)
+            self.stats.total_saved += 1
+        return True
@@ -0,0 +1,112 @@
+"""
+화면 준비 상태 대기
+고정 랜덤 대기 대신, 짧은 예의상 대기(politeness floor) 후
+축소 프레임이 연속으로 변하지 않거나 지정한 앵커가 보이면 바로 반환한다.
+동작 전 화면 지문(before)을 받으면 그 화면에서 바뀐 뒤의 안정만 인정한다 (클릭 직후의 이전 페이지 제외).
+최대 대기 시간은 기존 wait_for_load의 상한을 그대로 사용한다.
+"""
+import random
+import time
+from typing import Optional
+
+import numpy as np
+
+from .screen_guard import fingerprint, layout_distance
+from .utils import logger, grab_screen
+
+
+class ReadinessWaiter:
+    """화면 안정/앵커 감지 기반 대기 (대기 시간은 RunStats에 기록)"""
+
+    def __init__(self, config: Optional[dict] = None, stats=None):
+        timing_cfg = (config or {}).get("timing", {}) if isinstance(config, dict) else {}
+        ready_cfg = timing_cfg.get("readiness", {})
+        self.enabled = bool(ready_cfg.get("enabled", True))
+        self.floor_min = float(ready_cfg.get("politeness_min", 0.15))
+        self.floor_max = float(ready_cfg.get("politeness_max", 0.4))
+        self.poll_interval = float(ready_cfg.get("poll_interval", 0.1))
+        self.stable_frames = int(ready_cfg.get("stable_frames", 2))
+        self.change_threshold = float(ready_cfg.get("change_threshold", 0.01))
+        # 대기 종류별 준비 완료 앵커 (예: {"detail_open": "assets/img/label_interest.png"})
+        self.label_anchors = {k: v for k, v in ready_cfg.get("anchors", {}).items() if v}
+        self.config = config
+        self.stats = stats
+
+    def snapshot(self) -> Optional[np.ndarray]:
+        """동작(클릭/뒤로가기) 직전 화면 지문 - wait(before=...)에 전달"""
+        if not self.enabled:
+            return None
+        frame = grab_screen()
+        return fingerprint(frame) if frame is not None else None
+
+    def wait(self, max_sec: float, label: str = "load", anchor: Optional[str] = None,
+             min_sec: Optional[float] = None, before: Optional[np.ndarray] = None) -> float:
+        """준비될 때까지 대기하고 실제 대기 시간(초) 반환"""
+        start = time.perf_counter()
+        # 기존 방식이었다면 평균적으로 기다렸을 시간 (절약 시간 계산용)
+        budget = (min_sec + max_sec) / 2 if min_sec is not None else max_sec
+
+        anchor = anchor or self.label_anchors.get(label)
+
+        if not self.enabled:
+            time.sleep(random.uniform(min_sec or 0.0, max_sec))
+        else:
+            time.sleep(min(random.uniform(self.floor_min, self.floor_max), max_sec))
+            self._poll(start + max_sec, anchor, before)
+
+        elapsed = time.perf_counter() - start
+        if self.stats is not None:
+            self.stats.record_wait(label, elapsed, budget)
+        return elapsed
+
+    def _poll(self, deadline: float, anchor: Optional[str], before: Optional[np.ndarray] = None) -> bool:
+        previous = None
+        changed = before is None
+        stable = 0
+        anchors = None
+        if anchor:
+            from .anchor_engine import get_anchor_engine
+            anchors = get_anchor_engine(self.config)
+
+        while time.perf_counter() < deadline:
+            frame = grab_screen()
+            if frame is None:
+                return False
+
+            if anchors is not None:
+                if anchors.locate(anchor, frame):
+                    return True
+            else:
+                current = fingerprint(frame)
+                if not changed:
+                    # 아직 동작 전 화면 그대로면 안정으로 치지 않음
+                    changed = layout_distance(current, before) > self.change_threshold
+                elif previous is not None and layout_distance(current, previous) <= self.change_threshold:
+                    stable += 1
+                    if stable >= self.stable_frames:
+                        return True
+                else:
+                    stable = 0
+                previous = current
+
+            time.sleep(max(0.0, min(self.poll_interval, deadline - time.perf_counter())))
+
+        logger.debug("준비 상태 대기 시간 초과")
+        return False
+
+
+_default_waiter: Optional[ReadinessWaiter] = None
+
+
+def configure_readiness(config: Optional[dict] = None, stats=None) -> ReadinessWaiter:
+    """크롤러 설정/통계로 전역 대기기 교체"""
+    global _default_waiter
+    _default_waiter = ReadinessWaiter(config, stats)
+    return _default_waiter
+
+
+def get_readiness_waiter() -> ReadinessWaiter:
+    global _default_waiter
+    if _default_waiter is None:
+        _default_waiter = ReadinessWaiter()
+    return _default_waiter
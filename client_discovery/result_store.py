@@ -0,0 +1,259 @@
+"""
+발굴 결과 SQLite 저장소 (WAL)
+저장 스토어, 상세 방문, 스킵(사유), 실행, 키워드별 성과, 체크포인트를 한 파일에 보관한다.
+  - 체크포인트는 키/값 행 단위 갱신 (processed_urls 전체를 다시 쓰지 않음)
+  - 스토어는 정규화 URL(유일)/이름 색인으로 바로 조회
+  - 날짜별 targets_{date}.csv는 내보내기 사본
+(config.json "storage": {"backend": "sqlite", "db_file", "export_csv"})
+"""
+import csv
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .dedupe_index import canonical_store_name, canonical_store_url
+from .models import Checkpoint, StoreDetail
+from .utils import logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    ended_at TEXT,
+    end_reason TEXT,
+    visited INTEGER NOT NULL DEFAULT 0,
+    saved INTEGER NOT NULL DEFAULT 0,
+    summary TEXT
+);
+CREATE TABLE IF NOT EXISTS stores (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER REFERENCES runs(id),
+    keyword TEXT NOT NULL DEFAULT '',
+    store_name TEXT NOT NULL,
+    store_url TEXT NOT NULL DEFAULT '',
+    url_key TEXT,
+    name_key TEXT,
+    review_count INTEGER,
+    interest_count INTEGER,
+    collected_at TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS stores_url_key ON stores(url_key) WHERE url_key IS NOT NULL;
+CREATE INDEX IF NOT EXISTS stores_name_key ON stores(name_key);
+CREATE INDEX IF NOT EXISTS stores_collected_at ON stores(collected_at);
+CREATE TABLE IF NOT EXISTS visits (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER REFERENCES runs(id),
+    keyword TEXT NOT NULL DEFAULT '',
+    store_name TEXT,
+    store_url TEXT,
+    visited_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS skips (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER REFERENCES runs(id),
+    keyword TEXT NOT NULL DEFAULT '',
+    store_name TEXT,
+    reason TEXT NOT NULL,
+    skipped_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS skips_run_reason ON skips(run_id, reason);
+CREATE TABLE IF NOT EXISTS keywords (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    keyword TEXT NOT NULL,
+    visited INTEGER NOT NULL,
+    saved INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (run_id, keyword)
+);
+CREATE TABLE IF NOT EXISTS checkpoint (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+CHECKPOINT_FIELDS = ("last_scroll_position", "last_processed_url", "visited_count", "saved_count")
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class ResultStore:
+    """발굴 결과/체크포인트/실행 통계 SQLite 저장소"""
+
+    def __init__(self, path):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # WAL에서는 NORMAL이어도 커밋 순서가 보장되고, 전원 장애 시에만 마지막 커밋 일부를 잃을 수 있음
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+    def _execute(self, sql: str, params=()) -> sqlite3.Cursor:
+        with self._lock:
+            cursor = self._db.execute(sql, params)
+            self._db.commit()
+            return cursor
+
+    # === 실행 ===
+
+    def start_run(self, started_at: Optional[datetime] = None) -> int:
+        started = (started_at or datetime.now()).strftime(TIME_FORMAT)
+        return self._execute("INSERT INTO runs (started_at) VALUES (?)", (started,)).lastrowid
+
+    def finish_run(self, run_id: Optional[int], stats, reason: str) -> int:
+        """실행 종료 기록 + 키워드별 성과 저장 (start_run 없이 호출되면 실행 행을 새로 만듦)"""
+        if run_id is None:
+            run_id = self.start_run(getattr(stats, "start_time", None))
+        ended = (getattr(stats, "end_time", None) or datetime.now()).strftime(TIME_FORMAT)
+        with self._lock:
+            self._db.execute(
+                "UPDATE runs SET ended_at = ?, end_reason = ?, visited = ?, saved = ?, summary = ? WHERE id = ?",
+                (ended, reason, stats.total_visited, stats.total_saved, stats.summary(), run_id),
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO keywords (run_id, keyword, visited, saved, seconds) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, keyword, int(visited), int(saved), float(seconds))
+                 for keyword, (visited, saved, seconds) in stats.keyword_yields.items()],
+            )
+            self._db.commit()
+        return run_id
+
+    def has_runs(self) -> bool:
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM runs LIMIT 1").fetchone() is not None
+
+    def import_keyword_history(self, yields: Dict[str, Tuple[int, int, float]], reason: str) -> Optional[int]:
+        """이전 기록(run.log 합계)을 한 실행 행으로 가져오기 - 키워드 성과 집계가 이어지도록"""
+        if not yields:
+            return None
+        with self._lock:
+            now = datetime.now().strftime(TIME_FORMAT)
+            run_id = self._db.execute(
+                "INSERT INTO runs (started_at, ended_at, end_reason, visited, saved) VALUES (?, ?, ?, ?, ?)",
+                (now, now, reason, sum(int(v) for v, _, _ in yields.values()), sum(int(s) for _, s, _ in yields.values())),
+            ).lastrowid
+            self._db.executemany(
+                "INSERT INTO keywords (run_id, keyword, visited, saved, seconds) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, keyword, int(visited), int(saved), float(seconds))
+                 for keyword, (visited, saved, seconds) in yields.items()],
+            )
+            self._db.commit()
+        return run_id
+
+    # === 스토어/방문/스킵 ===
+
+    def add_store(self, detail: StoreDetail, run_id: Optional[int] = None) -> bool:
+        """스토어 저장 (같은 정규화 URL이 이미 있으면 False)"""
+        try:
+            self._execute(
+                "INSERT INTO stores (run_id, keyword, store_name, store_url, url_key, name_key, review_count, "
+                "interest_count, collected_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, detail.note or "", detail.store_name, detail.store_url or "",
+                 canonical_store_url(detail.store_url), canonical_store_name(detail.store_name),
+                 detail.review_count, detail.interest_count, detail.collected_at.strftime(TIME_FORMAT)),
+            )
+            return True
+        except sqlite3.IntegrityError:
+            return False
+
+    def has_store(self, store_url: Optional[str] = None, store_name: Optional[str] = None) -> bool:
+        """정규화 URL 또는 이름으로 저장 여부 조회 (색인 사용)"""
+        url_key, name_key = canonical_store_url(store_url), canonical_store_name(store_name)
+        with self._lock:
+            if url_key and self._db.execute("SELECT 1 FROM stores WHERE url_key = ?", (url_key,)).fetchone():
+                return True
+            return bool(name_key and self._db.execute("SELECT 1 FROM stores WHERE name_key = ?", (name_key,)).fetchone())
+
+    def record_visit(self, run_id: Optional[int], keyword: str, store_name: Optional[str], store_url: Optional[str]):
+        self._execute(
+            "INSERT INTO visits (run_id, keyword, store_name, store_url, visited_at) VALUES (?, ?, ?, ?, ?)",
+            (run_id, keyword or "", store_name, store_url, datetime.now().strftime(TIME_FORMAT)),
+        )
+
+    def record_skip(self, run_id: Optional[int], keyword: str, store_name: Optional[str], reason: str):
+        self._execute(
+            "INSERT INTO skips (run_id, keyword, store_name, reason, skipped_at) VALUES (?, ?, ?, ?, ?)",
+            (run_id, keyword or "", store_name, reason, datetime.now().strftime(TIME_FORMAT)),
+        )
+
+    def count_stores(self, day: Optional[datetime] = None) -> int:
+        """하루(기본 오늘) 저장 건수 (collected_at 색인 범위 조회)"""
+        prefix = (day or datetime.now()).strftime("%Y-%m-%d")
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM stores WHERE collected_at >= ? AND collected_at < ?", (prefix, prefix + "~")
+            ).fetchone()[0]
+
+    # === 분석 ===
+
+    def keyword_yields(self) -> Dict[str, Tuple[int, int, float]]:
+        """키워드별 누적 (방문, 저장, 소요 초) - 모든 실행 합계"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT keyword, SUM(visited), SUM(saved), SUM(seconds) FROM keywords GROUP BY keyword"
+            ).fetchall()
+        return {keyword: (int(visited), int(saved), float(seconds)) for keyword, visited, saved, seconds in rows}
+
+    def skip_counts(self, run_id: Optional[int] = None) -> Dict[str, int]:
+        """스킵 사유별 건수 (run_id를 주면 해당 실행만)"""
+        sql = "SELECT reason, COUNT(*) FROM skips" + (" WHERE run_id = ?" if run_id is not None else "") + " GROUP BY reason"
+        with self._lock:
+            rows = self._db.execute(sql, (run_id,) if run_id is not None else ()).fetchall()
+        return dict(rows)
+
+    # === 체크포인트 ===
+
+    def save_checkpoint(self, checkpoint: Checkpoint):
+        """체크포인트 필드만 키/값으로 갱신"""
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO checkpoint (key, value) VALUES (?, ?)",
+                [(field, str(getattr(checkpoint, field))) for field in CHECKPOINT_FIELDS],
+            )
+            self._db.commit()
+
+    def load_checkpoint(self) -> Optional[Checkpoint]:
+        """저장된 체크포인트 (없으면 None)"""
+        with self._lock:
+            values = dict(self._db.execute("SELECT key, value FROM checkpoint").fetchall())
+        if not values:
+            return None
+        return Checkpoint(
+            last_scroll_position=int(values.get("last_scroll_position", 0)),
+            last_processed_url=values.get("last_processed_url", ""),
+            processed_urls=set(),
+            visited_count=int(values.get("visited_count", 0)),
+            saved_count=int(values.get("saved_count", 0)),
+        )
+
+    # === 내보내기/종료 ===
+
+    def export_csv(self, path, day: Optional[datetime] = None) -> int:
+        """저장 스토어를 결과 CSV 형식으로 내보내기 (day를 주면 그날 것만)"""
+        sql = ("SELECT store_name, store_url, review_count, interest_count, collected_at, keyword "
+               "FROM stores")
+        params: tuple = ()
+        if day is not None:
+            prefix = day.strftime("%Y-%m-%d")
+            sql += " WHERE collected_at >= ? AND collected_at < ?"
+            params = (prefix, prefix + "~")
+        with self._lock:
+            rows = self._db.execute(sql + " ORDER BY id", params).fetchall()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(StoreDetail.csv_headers())
+            for name, url, review, interest, collected_at, keyword in rows:
+                detail = StoreDetail(name, url, review, interest, datetime.strptime(collected_at, TIME_FORMAT), keyword)
+                writer.writerow(detail.to_csv_row())
+        logger.info(f"결과 CSV 내보내기: {path} ({len(rows)}개)")
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,158 @@
+"""
+상세 페이지 관심고객 ROI 보정
+성공한 페이지에서 '관심고객' 앵커와 숫자가 실제로 찍힌 위치를 화면 레이아웃(해상도)별로 기록해
+다음 페이지에서는 예측한 좁은 박스부터 찾고, 실패했을 때만 전체 화면 → 폴백 영역으로 넓힌다.
+실행마다 예측 박스 미스율과 관심고객 OCR 평균 면적을 RunStats 요약에 남긴다.
+(config.json "roi_calibration": {"enabled", "path", "history", "min_samples", "anchor_margin", "number_pad"})
+"""
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from .utils import logger
+
+Region = Tuple[int, int, int, int]
+CALIBRATION_VERSION = 1
+
+
+def ink_box(image: Optional[np.ndarray]) -> Optional[Region]:
+    """ROI 안 글자 픽셀의 외곽 박스 (Otsu 이진화 후 적은 쪽을 글자로 간주)"""
+    if image is None or image.size == 0:
+        return None
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if binary.mean() > 127:
+        binary = 255 - binary
+    points = cv2.findNonZero(binary)
+    if points is None:
+        return None
+    x, y, width, height = cv2.boundingRect(points)
+    return int(x), int(y), int(width), int(height)
+
+
+def _median_box(boxes: Sequence[Sequence[int]]) -> Region:
+    x, y, width, height = (int(round(v)) for v in np.median(np.asarray(boxes, dtype=np.float32), axis=0))
+    return x, y, width, height
+
+
+class RoiCalibrator:
+    """레이아웃별 앵커 위치/앵커 기준 숫자 박스 기록 + 예측"""
+
+    def __init__(self, config: Optional[dict] = None, stats=None):
+        calibration_cfg = (config or {}).get("roi_calibration", {}) if isinstance(config, dict) else {}
+        self.enabled = bool(calibration_cfg.get("enabled", True))
+        self.path = Path(calibration_cfg.get("path", "client_discovery/roi_calibration.json"))
+        self.history = int(calibration_cfg.get("history", 20))
+        self.min_samples = int(calibration_cfg.get("min_samples", 3))
+        self.anchor_margin = int(calibration_cfg.get("anchor_margin", 16))
+        self.number_pad = int(calibration_cfg.get("number_pad", 6))
+        self.stats = stats
+        # 레이아웃 → {"anchor": [[x, y, w, h], ...], "number": [[dx, dy, w, h], ...]} (최근 history개)
+        self._models: Dict[str, Dict[str, List[List[int]]]] = {}
+        self._dirty = False
+        if self.enabled:
+            self.load()
+
+    @staticmethod
+    def layout_key(frame_shape: Sequence[int]) -> str:
+        height, width = frame_shape[:2]
+        return f"{width}x{height}"
+
+    def _samples(self, layout: str, kind: str) -> List[List[int]]:
+        return self._models.get(layout, {}).get(kind, [])
+
+    # === 예측 ===
+
+    def predict_anchor_region(self, layout: str) -> Optional[Region]:
+        """최근 앵커 위치 중앙값 주변의 좁은 탐색 영역"""
+        samples = self._samples(layout, "anchor")
+        if not self.enabled or len(samples) < self.min_samples:
+            return None
+        x, y, width, height = _median_box(samples)
+        margin = self.anchor_margin
+        return x - margin, y - margin, width + margin * 2, height + margin * 2
+
+    def predict_number_box(self, layout: str, anchor: Region) -> Optional[Region]:
+        """찾은 앵커 기준으로 숫자가 찍혀 온 위치의 좁은 박스"""
+        samples = self._samples(layout, "number")
+        if not self.enabled or len(samples) < self.min_samples:
+            return None
+        dx, dy, width, height = _median_box(samples)
+        pad = self.number_pad
+        return anchor[0] + dx - pad, anchor[1] + dy - pad, width + pad * 2, height + pad * 2
+
+    # === 기록 ===
+
+    def record(self, layout: str, anchor: Optional[Region], number: Optional[Region] = None):
+        """성공한 페이지의 앵커 박스와 숫자 박스(화면 좌표) 기록"""
+        if not self.enabled or anchor is None:
+            return
+        model = self._models.setdefault(layout, {"anchor": [], "number": []})
+        model["anchor"] = (model["anchor"] + [[int(v) for v in anchor[:4]]])[-self.history:]
+        if number is not None:
+            relative = [int(number[0] - anchor[0]), int(number[1] - anchor[1]), int(number[2]), int(number[3])]
+            model["number"] = (model["number"] + [relative])[-self.history:]
+        self._dirty = True
+
+    def observe(self, predicted: bool, stage: Optional[str], area: int):
+        """관심고객 OCR 1회 결과 (예측 박스를 시도했는지, 성공 단계, OCR한 총 면적)"""
+        if self.stats is None:
+            return
+        self.stats.interest_ocr_reads += 1
+        self.stats.interest_ocr_area += int(area)
+        if predicted:
+            self.stats.interest_roi_predicted += 1
+            if stage != "predicted":
+                self.stats.interest_roi_misses += 1
+
+    # === 디스크 ===
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != CALIBRATION_VERSION:
+                logger.info("ROI 보정 파일 버전이 달라 새로 시작합니다.")
+                return
+            self._models = data.get("layouts", {})
+            logger.info(f"ROI 보정 로드: 레이아웃 {len(self._models)}개")
+        except Exception as e:
+            logger.warning(f"ROI 보정 로드 실패: {e}")
+
+    def save(self):
+        if not self.enabled or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": CALIBRATION_VERSION, "layouts": self._models}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"ROI 보정 저장 실패: {e}")
+
+
+_default_calibrator: Optional[RoiCalibrator] = None
+
+
+def configure_roi_calibration(config: Optional[dict] = None, stats=None) -> RoiCalibrator:
+    """크롤러 설정/통계로 전역 보정기 교체"""
+    global _default_calibrator
+    if _default_calibrator is not None:
+        _default_calibrator.save()
+    _default_calibrator = RoiCalibrator(config, stats)
+    return _default_calibrator
+
+
+def get_roi_calibration() -> RoiCalibrator:
+    global _default_calibrator
+    if _default_calibrator is None:
+        _default_calibrator = RoiCalibrator({"roi_calibration": {"enabled": False}})
+    return _default_calibrator
@@ -0,0 +1,131 @@
+"""
+화면 변화 기반 의심 화면 감지
+마지막으로 정상 판정된 화면들의 축소 지문(회색조 썸네일)을 보관하고,
+레이아웃이 임계값 이상 바뀌었을 때만 차단 페이지 앵커 + 중앙 대화상자 OCR로 정밀 검사한다.
+"""
+import time
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+from ocr.service import get_ocr_service
+from .anchor_engine import get_anchor_engine
+from .utils import logger, grab_screen, crop_region, contains_suspicious_text
+
+
+def fingerprint(frame: np.ndarray, size: tuple = (32, 18)) -> np.ndarray:
+    """화면 지문: 회색조로 줄인 썸네일 (0~1 실수)"""
+    gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    thumb = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+    return thumb.astype(np.float32) / 255.0
+
+
+def layout_distance(a: np.ndarray, b: np.ndarray) -> float:
+    """두 지문의 평균 밝기 차이 (0=동일, 1=완전 반전)"""
+    if a.shape != b.shape:
+        return 1.0
+    return float(np.mean(np.abs(a - b)))
+
+
+class ScreenGuard:
+    """정상 화면 지문 캐시 + 변화 시에만 캡챠/로그인 분류"""
+
+    def __init__(self, config: Optional[dict] = None, stats=None, ocr=None, anchors=None):
+        guard_cfg = (config or {}).get("screen_guard", {}) if isinstance(config, dict) else {}
+        self.change_threshold = float(guard_cfg.get("change_threshold", 0.06))
+        self.full_check_every = int(guard_cfg.get("full_check_every", 20))
+        self.known_pages = int(guard_cfg.get("known_pages", 4))
+        self.dialog_fraction = float(guard_cfg.get("dialog_fraction", 0.5))
+        self.block_anchors: List[str] = [p for p in guard_cfg.get("block_anchors", []) if p]
+        self.anchor_confidence = float(guard_cfg.get("anchor_confidence", 0.8))
+
+        self.stats = stats
+        self.ocr = ocr or get_ocr_service()
+        self.anchors = anchors or get_anchor_engine(config)
+        self._known: List[np.ndarray] = []
+        self._since_full_check = 0
+
+    def check(self, frame: Optional[np.ndarray] = None) -> bool:
+        """의심 화면이면 True (정상 화면과 비슷하면 정밀 검사 생략)"""
+        start = time.perf_counter()
+        suspicious = False
+        escalated = False
+        try:
+            if frame is None:
+                frame = grab_screen()
+            if frame is None:
+                return False
+
+            current = fingerprint(frame)
+            self._since_full_check += 1
+            if self._matches_known(current) and self._since_full_check < self.full_check_every:
+                return False
+
+            escalated = True
+            self._since_full_check = 0
+            suspicious = self.classify(frame)
+            if suspicious:
+                logger.warning("의심 화면 감지 (캡챠/로그인/차단)")
+            else:
+                self._remember(current)
+            return suspicious
+
+        except Exception as e:
+            logger.error(f"의심 화면 감지 실패: {e}")
+            return False
+
+        finally:
+            self._record(time.perf_counter() - start, escalated, suspicious)
+
+    def classify(self, frame: np.ndarray) -> bool:
+        """차단 페이지 앵커 → 중앙 대화상자 OCR 순으로 판정"""
+        for anchor_path in self.block_anchors:
+            if self.anchors.locate(anchor_path, frame, confidence=self.anchor_confidence):
+                logger.debug(f"차단 페이지 앵커 발견: {anchor_path}")
+                return True
+
+        if not self.ocr.available:
+            return False
+
+        dialog = self.dialog_region(frame)
+        if dialog is None:
+            return False
+        text = self.ocr.image_to_string(dialog, lang='kor+eng')
+        return contains_suspicious_text(text)
+
+    def dialog_region(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """캡챠/로그인 대화상자가 뜨는 화면 중앙 영역"""
+        height, width = frame.shape[:2]
+        region_width = int(width * self.dialog_fraction)
+        region_height = int(height * self.dialog_fraction)
+        return crop_region(frame, (width - region_width) // 2, (height - region_height) // 2,
+                           region_width, region_height)
+
+    def reset(self):
+        """정상 화면 지문 초기화 (새 키워드/탭 전환 시)"""
+        self._known.clear()
+        self._since_full_check = 0
+
+    def _matches_known(self, current: np.ndarray) -> bool:
+        for index, known in enumerate(self._known):
+            if layout_distance(current, known) <= self.change_threshold:
+                # 최근 사용한 지문을 앞으로
+                self._known.insert(0, self._known.pop(index))
+                return True
+        return False
+
+    def _remember(self, current: np.ndarray):
+        self._known.insert(0, current)
+        del self._known[self.known_pages:]
+
+    def _record(self, elapsed: float, escalated: bool, suspicious: bool):
+        if self.stats is None:
+            return
+        self.stats.screen_checks += 1
+        self.stats.record_timing("screen_check", elapsed)
+        if escalated:
+            self.stats.screen_escalations += 1
+            self.stats.record_timing("screen_escalation", elapsed)
+        if suspicious:
+            self.stats.screen_suspicious += 1
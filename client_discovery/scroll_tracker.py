@@ -0,0 +1,150 @@
+"""
+스크롤 추적
+연속된 두 스캔 프레임 사이의 실제 스크롤 양을 축소한 세로 띠의 위상 상관(phase correlation)으로 추정해
+목록 기준 절대 y좌표를 유지한다.
+  - 이미 읽은 카드(절대 위치 + 이름 영역 지문이 같은 카드)는 OCR 결과를 재사용
+  - 스크롤했는데 화면이 움직이지 않았으면 목록 끝
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .models import StoreCard
+from .screen_guard import fingerprint, layout_distance
+from .utils import logger, crop_region
+
+
+def _strip(frame: np.ndarray, scale: float, strip_width: float, ignore_top: float) -> np.ndarray:
+    """가운데 세로 띠를 회색조로 줄여 위상 상관 입력으로 변환 (상단 고정 헤더 제외)"""
+    gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    height, width = gray.shape[:2]
+    x0 = int(width * (1 - strip_width) / 2)
+    band = gray[int(height * ignore_top):, x0:x0 + max(1, int(width * strip_width))]
+    if scale != 1.0:
+        band = cv2.resize(band, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return band.astype(np.float32)
+
+
+def estimate_scroll(previous: np.ndarray, current: np.ndarray, scale: float = 0.25,
+                    strip_width: float = 0.5, ignore_top: float = 0.1) -> Tuple[float, float]:
+    """직전 → 현재 프레임의 스크롤 양(px, 아래로 스크롤 = 양수)과 상관 응답(0~1) 반환"""
+    a = _strip(previous, scale, strip_width, ignore_top)
+    b = _strip(current, scale, strip_width, ignore_top)
+    if a.shape != b.shape or min(a.shape) < 8:
+        return 0.0, 0.0
+    window = cv2.createHanningWindow((a.shape[1], a.shape[0]), cv2.CV_32F)
+    (_, shift_y), response = cv2.phaseCorrelate(a, b, window)
+    # 내용이 위로 올라가면(아래로 스크롤) shift_y가 음수
+    return -shift_y / scale, float(response)
+
+
+@dataclass
+class _CachedCard:
+    x: int
+    abs_y: int
+    signature: np.ndarray
+    store_name: Optional[str]
+    review_count: Optional[int]
+
+
+class ScrollTracker:
+    """절대 스크롤 위치 추적 + 카드 OCR 결과 캐시"""
+
+    def __init__(self, config):
+        tracker_cfg = config.get("scroll_tracker", {})
+        layout_cfg = config.get("layout", {})
+        self.enabled = bool(tracker_cfg.get("enabled", True))
+        self.scale = float(tracker_cfg.get("downscale", 0.25))
+        self.strip_width = float(tracker_cfg.get("strip_width", 0.5))
+        self.ignore_top = float(tracker_cfg.get("ignore_top", 0.1))
+        self.min_response = float(tracker_cfg.get("min_response", 0.12))
+        self.end_threshold_px = float(tracker_cfg.get("end_threshold_px", 6))
+        self.signature_threshold = float(tracker_cfg.get("signature_threshold", 0.04))
+        self.tolerance_px = int(layout_cfg.get("dedupe_threshold_px", 40))
+
+        self.offset = 0.0
+        self.last_delta: Optional[float] = None
+        self.at_list_end = False
+        self._previous: Optional[np.ndarray] = None
+        self._scroll_expected = False
+        self._cache: List[_CachedCard] = []
+
+    def expect_scroll(self):
+        """스크롤 직후 호출 - 다음 프레임에서 움직임이 없으면 목록 끝으로 판정"""
+        self._scroll_expected = True
+
+    def observe(self, frame: Optional[np.ndarray]) -> Optional[float]:
+        """새 스캔 프레임으로 스크롤 양 갱신 (추정 실패 시 캐시를 비우고 None)"""
+        expected, self._scroll_expected = self._scroll_expected, False
+        self.at_list_end = False
+        self.last_delta = None
+        if not self.enabled or frame is None:
+            return None
+
+        previous, self._previous = self._previous, frame.copy()
+        if previous is None or previous.shape != frame.shape:
+            self._cache = []
+            return None
+
+        delta, response = estimate_scroll(previous, frame, self.scale, self.strip_width, self.ignore_top)
+        if response < self.min_response:
+            # 무늬가 거의 없는 화면은 상관 응답이 낮으므로 두 프레임이 같으면 정지로 간주
+            if layout_distance(fingerprint(previous), fingerprint(frame)) > 0.001:
+                logger.debug(f"스크롤 추정 실패 (응답 {response:.2f}) - OCR 캐시 초기화")
+                self._cache = []
+                return None
+            delta = 0.0
+
+        self.last_delta = delta
+        self.offset += delta
+        # 화면 한 장 이상 위로 지나간 카드는 캐시에서 제외
+        self._cache = [c for c in self._cache if c.abs_y > self.offset - frame.shape[0]]
+        if expected and abs(delta) <= self.end_threshold_px:
+            logger.info("스크롤했지만 화면이 움직이지 않음 - 목록 끝")
+            self.at_list_end = True
+        else:
+            logger.debug(f"스크롤 추정: {delta:+.0f}px (응답 {response:.2f})")
+        return delta
+
+    def _signature(self, frame: np.ndarray, region: tuple) -> Optional[np.ndarray]:
+        roi = crop_region(frame, *region)
+        if roi is None or roi.size == 0:
+            return None
+        return fingerprint(roi, (16, 4))
+
+    def lookup(self, card: StoreCard, frame: np.ndarray, region: tuple) -> Optional[Tuple[Optional[str], Optional[int]]]:
+        """이미 읽은 카드면 (스토어명, 리뷰 수) 반환 - 절대 위치와 이름 영역 지문이 모두 같아야 재사용"""
+        if not self._cache or self.last_delta is None:
+            return None
+        signature = self._signature(frame, region)
+        if signature is None:
+            return None
+        abs_y = self.offset + card.y
+        for cached in self._cache:
+            if (abs(cached.x - card.x) < self.tolerance_px and abs(cached.abs_y - abs_y) < self.tolerance_px
+                    and layout_distance(cached.signature, signature) <= self.signature_threshold):
+                return cached.store_name, cached.review_count
+        return None
+
+    def remember(self, card: StoreCard, frame: np.ndarray, region: tuple,
+                 store_name: Optional[str], review_count: Optional[int]):
+        if not self.enabled:
+            return
+        signature = self._signature(frame, region)
+        if signature is None:
+            return
+        abs_y = int(round(self.offset + card.y))
+        self._cache = [c for c in self._cache
+                       if not (abs(c.x - card.x) < self.tolerance_px and abs(c.abs_y - abs_y) < self.tolerance_px)]
+        self._cache.append(_CachedCard(card.x, abs_y, signature, store_name, review_count))
+
+    def reset(self):
+        """키워드 전환 시 초기화"""
+        self.offset = 0.0
+        self.last_delta = None
+        self.at_list_end = False
+        self._previous = None
+        self._scroll_expected = False
+        self._cache = []
@@ -0,0 +1,175 @@
+"""
+상세 페이지 백그라운드 탭 선로딩
+현재 상세 페이지를 읽는 동안 다음 카드 K개를 Ctrl+클릭으로 백그라운드 탭에 미리 열어 두어
+페이지 로딩 시간이 OCR/필터링 시간과 겹치도록 한다.
+(config.json "pipeline": {"prefetch_tabs": K}, 0이면 기존 open_card → back_to_list 직렬 방식)
+
+탭 배치 (Chromium 계열 브라우저 기준)
+  - 목록은 항상 첫 번째 탭(Ctrl+1)
+  - 목록에서 연달아 Ctrl+클릭한 탭은 목록 바로 오른쪽부터 연 순서대로 쌓이고,
+    탭을 한 번 전환하고 돌아오면 다시 목록 바로 오른쪽부터 끼워 넣는다
+  - 전환 후에는 창 제목의 스토어명으로 맞는 탭인지 확인하고, 다르면 탭을 차례로 찾아본다
+"""
+from collections import deque
+from typing import Callable, Deque, Iterable, List, Optional
+
+from .io_backend import get_io_backend
+from .models import StoreCard
+from .url_resolver import active_window_title, store_name_from_title
+from .utils import logger, wait_for_load
+
+# Ctrl+2 ~ Ctrl+8 (Ctrl+9는 '마지막 탭'이라 사용하지 않음)
+MAX_PREFETCH_TABS = 7
+
+
+def _normalize(name: Optional[str]) -> str:
+    return "".join((name or "").split()).lower()
+
+
+def same_store(card_name: Optional[str], title_name: Optional[str]) -> bool:
+    """목록 OCR 스토어명과 창 제목 스토어명이 같은 스토어인지 (공백/부분 일치 허용)"""
+    a, b = _normalize(card_name), _normalize(title_name)
+    if not a or not b:
+        return True
+    return a in b or b in a
+
+
+class TabPrefetcher:
+    """백그라운드 탭 큐 (연 순서대로 처리, 탭 위치는 직접 추적)"""
+
+    def __init__(self, config):
+        pipeline_cfg = config.get("pipeline", {})
+        # DOM/캡처 백엔드는 화면 OCR 대기가 없으므로 RPA 모드에서만 사용
+        rpa_mode = config.get("backend", {}).get("mode", "rpa") == "rpa"
+        depth = int(pipeline_cfg.get("prefetch_tabs", 0) or 0) if rpa_mode else 0
+        self.depth = max(0, min(depth, MAX_PREFETCH_TABS))
+        self.tab_switch_wait = float(pipeline_cfg.get("tab_switch_wait", 1.0))
+        self.load_wait_max = float(config.get("timing", {}).get("load_wait_max", 3.0))
+
+        self._queue: Deque[StoreCard] = deque()   # 연 순서 (처리 순서)
+        self._strip: List[StoreCard] = []         # 탭 막대 순서 (목록 오른쪽부터)
+        self._burst = 0                           # 목록에 머무는 동안 연 탭 수
+        self._active: Optional[StoreCard] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.depth > 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def is_open(self, card: StoreCard) -> bool:
+        return any(opened is card for opened in self._queue)
+
+    # === 열기 ===
+
+    def open(self, card: StoreCard) -> bool:
+        """목록 탭에서 카드를 Ctrl+클릭해 백그라운드 탭으로 열기"""
+        if len(self._queue) >= self.depth:
+            return False
+        try:
+            center_x = card.x + card.width // 2
+            center_y = card.y + card.height // 2
+            get_io_backend().key_down('ctrl')
+            try:
+                get_io_backend().click(center_x, center_y)
+            finally:
+                get_io_backend().key_up('ctrl')
+        except Exception as e:
+            logger.error(f"백그라운드 탭 열기 실패: {e}")
+            return False
+
+        self._strip.insert(self._burst, card)
+        self._burst += 1
+        self._queue.append(card)
+        logger.debug(f"백그라운드 탭 선로딩: {card.store_name} ({len(self._queue)}/{self.depth})")
+        return True
+
+    def fill(self, cards: Iterable[StoreCard], accept: Callable[[StoreCard], bool]) -> int:
+        """열린 탭이 depth개가 될 때까지 accept를 통과한 다음 카드들을 미리 연다"""
+        opened = 0
+        for card in cards:
+            if len(self._queue) >= self.depth:
+                break
+            if self.is_open(card) or not accept(card):
+                continue
+            if self.open(card):
+                opened += 1
+        return opened
+
+    # === 전환/닫기 ===
+
+    def _select_tab(self, position: int):
+        get_io_backend().hotkey('ctrl', str(position + 2))
+        self._burst = 0
+
+    def _title_matches(self, card: StoreCard) -> bool:
+        return same_store(card.store_name, store_name_from_title(active_window_title()))
+
+    def activate(self, card: StoreCard) -> bool:
+        """카드의 탭으로 전환하고 로딩이 끝날 때까지 대기 (이미 로딩된 탭은 바로 반환)"""
+        if not self.is_open(card):
+            return False
+        try:
+            expected = next(i for i, opened in enumerate(self._strip) if opened is card)
+            self._select_tab(expected)
+            wait_for_load(0, self.load_wait_max, label="prefetch_tab")
+
+            if not self._title_matches(card):
+                # 브라우저마다 새 탭 위치 규칙이 달라 예상과 다르면 탭을 차례로 확인
+                for position in range(len(self._strip)):
+                    if position == expected:
+                        continue
+                    self._select_tab(position)
+                    wait_for_load(0, self.tab_switch_wait, label="prefetch_tab_search")
+                    if self._title_matches(card):
+                        self._strip.remove(card)
+                        self._strip.insert(position, card)
+                        break
+                else:
+                    logger.warning(f"선로딩 탭 확인 실패 - 예상 위치 사용: {card.store_name}")
+                    self._select_tab(expected)
+
+            self._active = card
+            return True
+        except Exception as e:
+            logger.error(f"선로딩 탭 전환 실패: {e}")
+            return False
+
+    def close_current(self) -> bool:
+        """현재 상세 탭을 닫고 목록 탭으로 복귀"""
+        card, self._active = self._active, None
+        try:
+            if card is not None:
+                get_io_backend().hotkey('ctrl', 'w')
+                self._forget(card)
+            get_io_backend().hotkey('ctrl', '1')
+            self._burst = 0
+            wait_for_load(0, self.tab_switch_wait, label="tab_return")
+            return True
+        except Exception as e:
+            logger.error(f"목록 탭 복귀 실패: {e}")
+            return False
+
+    def discard(self, card: StoreCard):
+        """미리 열었지만 처리하지 않을 카드의 탭 닫기"""
+        if not self.is_open(card):
+            return
+        try:
+            position = next(i for i, opened in enumerate(self._strip) if opened is card)
+            self._select_tab(position)
+            get_io_backend().hotkey('ctrl', 'w')
+            get_io_backend().hotkey('ctrl', '1')
+        except Exception as e:
+            logger.debug(f"선로딩 탭 닫기 실패: {e}")
+        self._forget(card)
+
+    def discard_all(self):
+        """남은 선로딩 탭 모두 닫기 (화면/키워드 전환 전)"""
+        while self._queue:
+            self.discard(self._queue[0])
+        self._burst = 0
+
+    def _forget(self, card: StoreCard):
+        self._queue = deque(opened for opened in self._queue if opened is not card)
+        self._strip = [opened for opened in self._strip if opened is not card]
@@ -0,0 +1,71 @@
+"""
+다중 패턴 문자열 매처 (Aho-Corasick)
+차단 목록, 다중 입점 키워드, 구분자를 하나의 오토마톤으로 컴파일해
+스토어명을 한 번만 훑어 걸리는 규칙을 모두 찾는다.
+  - 패턴/본문 모두 소문자로 비교 (기존 `keyword.lower() in name.lower()`와 동일)
+  - 목록이 수천 개여도 스토어명 길이에 비례하는 시간으로 판정
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+Match = Tuple[str, str]  # (규칙 종류, 원래 패턴)
+
+
+class TextMatcher:
+    """규칙 종류별 패턴 목록을 한 오토마톤으로 묶은 부분 문자열 매처"""
+
+    def __init__(self, rules: Dict[str, Iterable[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[Match, ...]] = [()]
+        self.pattern_count = 0
+        for kind, patterns in rules.items():
+            for pattern in dict.fromkeys(patterns or []):
+                if isinstance(pattern, str) and pattern:
+                    self._insert(pattern.lower(), (kind, pattern))
+        self._build_links()
+
+    def _insert(self, key: str, match: Match):
+        state = 0
+        for ch in key:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        if match not in self._out[state]:
+            self._out[state] += (match,)
+            self.pattern_count += 1
+
+    def _build_links(self):
+        """BFS로 실패 링크를 잇고, 실패 링크 쪽 출력도 미리 합쳐 둠"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._out[child] += self._out[self._fail[child]]
+                queue.append(child)
+
+    def matches(self, text: str) -> Dict[str, List[str]]:
+        """규칙 종류별로 text에 포함된 패턴 목록 (포함 순서, 중복 없음)"""
+        found: Dict[str, List[str]] = {}
+        if not text or not self.pattern_count:
+            return found
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for kind, pattern in out[state]:
+                hits = found.setdefault(kind, [])
+                if pattern not in hits:
+                    hits.append(pattern)
+        return found
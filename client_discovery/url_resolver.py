@@ -0,0 +1,158 @@
+"""
+상세 페이지 URL 확보
+클립보드(주소창 복사) 대신 순서대로 더 빠른 출처를 시도한다.
+  1) cdp       - 원격 디버깅 포트(/json)의 현재 탭 URL
+  2) title     - 활성 창 제목의 스토어명 → 알려진 스토어명/URL 매핑 (제목 이름으로만 조회)
+  3) clipboard - 최후 수단 (기존 클립보드 내용은 복원)
+출처별 소요시간은 RunStats.timings에 url_<출처> / url_<출처>_miss 로 기록된다.
+"""
+import csv
+import json
+import time
+import urllib.request
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .io_backend import get_io_backend
+from .models import is_unreadable_store_name
+from .utils import logger
+
+DEFAULT_SOURCES = ["cdp", "title", "clipboard"]
+# Edge는 제목의 "Microsoft Edge" 사이에 폭 없는 공백을 넣음
+BROWSER_SUFFIXES = (" - Chrome", " - Google Chrome", " - Whale", " - Microsoft Edge", " - Microsoft\u200b Edge")
+
+
+def store_name_from_title(title: Optional[str]) -> Optional[str]:
+    """'알파상회 : 네이버 스마트스토어 - Chrome' → '알파상회'"""
+    if not title:
+        return None
+    for suffix in BROWSER_SUFFIXES:
+        if title.endswith(suffix):
+            title = title[:-len(suffix)]
+            break
+    name = title.split(" : ")[0].strip()
+    return name or None
+
+
+class UrlResolver:
+    """출처 순서대로 현재 상세 페이지 URL을 찾는다"""
+
+    def __init__(self, config, stats=None):
+        self.config = config
+        self.stats = stats
+        resolver_cfg = config.get("url_resolver", {}) if isinstance(config, dict) else {}
+        self.sources: List[str] = list(resolver_cfg.get("sources", DEFAULT_SOURCES))
+        self.cdp_endpoint = resolver_cfg.get("cdp_endpoint", "http://127.0.0.1:9222/json")
+        self.cdp_timeout = float(resolver_cfg.get("cdp_timeout", 0.3))
+        self.clipboard_timeout = float(resolver_cfg.get("clipboard_timeout", 0.8))
+        self.known_urls: Dict[str, str] = {}
+        self._cdp_available = True
+        self._handlers: Dict[str, Callable[[Optional[str]], Optional[str]]] = {
+            "cdp": self._from_cdp,
+            "title": self._from_title,
+            "clipboard": self._from_clipboard,
+        }
+
+    # === 스토어명 → URL 매핑 ===
+
+    def remember(self, store_name: Optional[str], url: Optional[str]):
+        # 임시 이름(상점_N)은 화면마다 다른 스토어에 붙으므로 매핑하지 않음
+        if url and not is_unreadable_store_name(store_name):
+            self.known_urls[store_name.strip()] = url
+
+    def load_known_urls(self, csv_path) -> int:
+        """기존 결과 CSV의 store_name/store_url을 매핑에 추가"""
+        path = Path(csv_path)
+        if not path.exists():
+            return 0
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    self.remember(row.get("store_name"), row.get("store_url"))
+        except Exception as e:
+            logger.debug(f"URL 매핑 로드 실패: {e}")
+        return len(self.known_urls)
+
+    # === 조회 ===
+
+    def resolve(self, store_name: Optional[str] = None) -> Optional[str]:
+        """출처 순서대로 시도해 첫 번째로 찾은 URL 반환"""
+        for source in self.sources:
+            handler = self._handlers.get(source)
+            if handler is None:
+                continue
+            start = time.perf_counter()
+            try:
+                url = handler(store_name)
+            except Exception as e:
+                logger.debug(f"URL 출처 실패 ({source}): {e}")
+                url = None
+            self._record(source, time.perf_counter() - start, url is not None)
+            if url:
+                logger.debug(f"상세 URL ({source}): {url}")
+                return url
+        return None
+
+    def _record(self, source: str, elapsed: float, hit: bool):
+        if self.stats is not None:
+            self.stats.record_timing(f"url_{source}" if hit else f"url_{source}_miss", elapsed)
+
+    def _from_cdp(self, store_name: Optional[str]) -> Optional[str]:
+        """브라우저를 --remote-debugging-port로 띄운 경우 현재 탭 URL"""
+        if not self._cdp_available:
+            return None
+        try:
+            with urllib.request.urlopen(self.cdp_endpoint, timeout=self.cdp_timeout) as response:
+                targets = json.loads(response.read().decode("utf-8"))
+        except OSError:
+            # 디버깅 포트가 없으면 이번 실행에서는 다시 시도하지 않음
+            self._cdp_available = False
+            logger.info("CDP 엔드포인트 없음 - URL 출처에서 제외")
+            return None
+
+        pages = [t for t in targets if t.get("type") == "page" and str(t.get("url", "")).startswith("http")]
+        if not pages:
+            return None
+
+        # 활성 창 제목과 같은 탭 우선, 없으면 최근 활성 탭(목록 첫 번째)
+        window_title = active_window_title()
+        for page in pages:
+            if window_title and page.get("title") and window_title.startswith(page["title"]):
+                return page["url"]
+        return pages[0]["url"]
+
+    def _from_title(self, store_name: Optional[str]) -> Optional[str]:
+        """창 제목의 스토어명과 정확히 같은 매핑만 (목록 OCR 이름은 현재 페이지를 보장하지 않음)"""
+        name = store_name_from_title(active_window_title())
+        if is_unreadable_store_name(name):
+            return None
+        return self.known_urls.get(name.strip())
+
+    def _from_clipboard(self, store_name: Optional[str]) -> Optional[str]:
+        """주소창 복사 (기존 클립보드 내용은 복원, 고정 대기 대신 변경 감지)"""
+        io = get_io_backend()
+        try:
+            saved = io.clipboard_paste()
+        except Exception:
+            saved = None
+
+        sentinel = f"__url_resolver_{time.time_ns()}__"
+        io.clipboard_copy(sentinel)
+        try:
+            io.hotkey('ctrl', 'l')
+            io.hotkey('ctrl', 'c')
+            deadline = time.perf_counter() + self.clipboard_timeout
+            url = sentinel
+            while url == sentinel and time.perf_counter() < deadline:
+                time.sleep(0.03)
+                url = io.clipboard_paste()
+            io.press('esc')
+        finally:
+            if saved is not None:
+                io.clipboard_copy(saved)
+
+        return url if url and url.startswith('http') else None
+
+
+def active_window_title() -> Optional[str]:
+    return get_io_backend().active_window_title()
@@ -2,16 +2,15 @@
 공통 유틸리티 함수들
 """
 import time
-import random
 import cv2
 import numpy as np
-import pyautogui
-import pygetwindow as gw
 import logging
 from typing import Optional, Tuple
 from pathlib import Path
 import re
 
+from ocr.service import get_ocr_service
+
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -23,10 +22,13 @@ if not logger.handlers:
     logger.setLevel(logging.INFO)
 
 
-def wait_for_load(min_sec: float = 1.0, max_sec: float = 2.0):
-    """랜덤 대기 시간"""
-    wait_time = random.uniform(min_sec, max_sec)
-    time.sleep(wait_time)
+def wait_for_load(min_sec: float = 1.0, max_sec: float = 2.0, label: str = "load", anchor: Optional[str] = None,
+                  before=None):
+    """화면이 안정되거나 앵커가 보일 때까지 대기 (max_sec은 상한, 랜덤 지터는 짧은 예의상 대기로만 사용)
+    before: 동작 직전 화면 지문 (get_readiness_waiter().snapshot()) - 화면이 바뀐 뒤의 안정만 인정"""
+    from .readiness import get_readiness_waiter
+
+    get_readiness_waiter().wait(max_sec, label=label, anchor=anchor, min_sec=min_sec, before=before)
 
 
 def find_image_on_screen(image_path: str, confidence: float = 0.8) -> Optional[Tuple[int, int]]:
@@ -36,10 +38,10 @@ def find_image_on_screen(image_path: str, confidence: float = 0.8) -> Optional[T
             logger.warning(f"앵커 이미지가 없습니다: {image_path}")
             return None
 
-        location = pyautogui.locateOnScreen(image_path, confidence=confidence)
+        from .anchor_engine import get_anchor_engine
+        location = get_anchor_engine().locate(image_path, confidence=confidence)
         if location:
-            center = pyautogui.center(location)
-            return (center.x, center.y)
+            return (location.left + location.width // 2, location.top + location.height // 2)
         return None
 
     except Exception as e:
@@ -64,13 +66,40 @@ def extract_numbers_from_text(text: str) -> Optional[int]:
 def capture_screen_region(x: int, y: int, width: int, height: int) -> np.ndarray:
     """화면 영역 캡처"""
     try:
-        screenshot = pyautogui.screenshot(region=(x, y, width, height))
+        from .io_backend import get_io_backend
+        screenshot = get_io_backend().screenshot(region=(x, y, width, height))
         return cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
     except Exception as e:
         logger.error(f"화면 캡처 실패: {e}")
         return None
 
 
+def grab_screen() -> Optional[np.ndarray]:
+    """전체 화면을 한 번 캡처해 BGR 배열로 반환"""
+    try:
+        from .io_backend import get_io_backend
+        screenshot = get_io_backend().screenshot()
+        return cv2.cvtColor(np.asarray(screenshot), cv2.COLOR_RGB2BGR)
+    except Exception as e:
+        logger.error(f"화면 캡처 실패: {e}")
+        return None
+
+
+def crop_region(frame: np.ndarray, x: int, y: int, width: int, height: int) -> Optional[np.ndarray]:
+    """프레임에서 영역을 복사 없이 잘라낸 뷰 반환 (화면 밖 부분은 잘림)"""
+    if frame is None:
+        return None
+
+    frame_height, frame_width = frame.shape[:2]
+    x0, y0 = max(0, int(x)), max(0, int(y))
+    x1 = min(frame_width, int(x) + int(width))
+    y1 = min(frame_height, int(y) + int(height))
+    if x1 <= x0 or y1 <= y0:
+        return None
+
+    return frame[y0:y1, x0:x1]
+
+
 def save_screenshot(filename: str, region: Optional[Tuple[int, int, int, int]] = None):
     """스크린샷 저장"""
     try:
@@ -78,10 +107,8 @@ def save_screenshot(filename: str, region: Optional[Tuple[int, int, int, int]] =
         screenshot_dir.mkdir(parents=True, exist_ok=True)
 
         filepath = screenshot_dir / filename
-        if region:
-            screenshot = pyautogui.screenshot(region=region)
-        else:
-            screenshot = pyautogui.screenshot()
+        from .io_backend import get_io_backend
+        screenshot = get_io_backend().screenshot(region=region)
 
         screenshot.save(filepath)
         logger.info(f"스크린샷 저장: {filepath}")
@@ -93,9 +120,10 @@ def save_screenshot(filename: str, region: Optional[Tuple[int, int, int, int]] =
 def is_browser_focused() -> bool:
     """브라우저가 포커스되어 있는지 확인"""
     try:
-        active_window = gw.getActiveWindow()
-        if active_window:
-            title = active_window.title.lower()
+        from .io_backend import get_io_backend
+        active_title = get_io_backend().active_window_title()
+        if active_title:
+            title = active_title.lower()
             logger.debug(f"활성 창 제목: {title}")
             # 네이버, 쇼핑, chrome, edge 등 브라우저 관련 키워드 포함 시 True
             browser_keywords = ['chrome', 'firefox', 'edge', 'safari', 'naver', 'shopping', '네이버', '쇼핑']
@@ -116,36 +144,30 @@ def extract_review_count_from_region(x: int, y: int, width: int, height: int) ->
         if region_image is None:
             return None
 
-        # OCR 처리 (pytesseract 필요)
-        try:
-            import pytesseract
-            import yaml
-            import os
-            # Tesseract 경로 설정 (config.yaml에서 읽기)
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config_data = yaml.safe_load(f)
-                tesseract_cmd = config_data.get('ocr', {}).get('tesseract_cmd', r'E:\tesseract\tesseract.exe')
-            else:
-                tesseract_cmd = r'E:\tesseract\tesseract.exe'  # 기본값
-            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-            text = pytesseract.image_to_string(region_image, lang='kor+eng')
-            logger.debug(f"OCR 텍스트: {text}")
-
-            # 리뷰 패턴 매칭
-            review_pattern = r'리뷰\s*([\d,]+)'
-            match = re.search(review_pattern, text)
-            if match:
-                return int(match.group(1).replace(',', ''))
-
-            # 숫자만 추출
-            return extract_numbers_from_text(text)
-
-        except ImportError:
-            logger.warning("pytesseract가 설치되지 않음. OCR 기능 비활성화")
+        # OCR 처리 (상주 OCR 엔진 사용)
+        ocr = get_ocr_service()
+        if not ocr.available:
+            logger.warning("OCR 엔진을 사용할 수 없어 리뷰 수 추출을 건너뜁니다")
             return None
 
+        # '리뷰' 앵커 옆 숫자만 읽는 빠른 경로
+        from .numeric_reader import get_default_reader
+        review_count = get_default_reader().read_after_anchor(region_image, "label_review")
+        if review_count is not None:
+            return review_count
+
+        text = ocr.image_to_string(region_image, lang='kor+eng')
+        logger.debug(f"OCR 텍스트: {text}")
+
+        # 리뷰 패턴 매칭
+        review_pattern = r'리뷰\s*([\d,]+)'
+        match = re.search(review_pattern, text)
+        if match:
+            return int(match.group(1).replace(',', ''))
+
+        # 숫자만 추출
+        return extract_numbers_from_text(text)
+
     except Exception as e:
         logger.error(f"리뷰 수 추출 실패: {e}")
         return None
@@ -160,29 +182,23 @@ def extract_interest_count_from_region(x: int, y: int, width: int, height: int)
             return None
 
         # OCR 처리
-        try:
-            import pytesseract
-            import yaml
-            import os
-            # Tesseract 경로 설정 (config.yaml에서 읽기)
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config_data = yaml.safe_load(f)
-                tesseract_cmd = config_data.get('ocr', {}).get('tesseract_cmd', r'E:\tesseract\tesseract.exe')
-            else:
-                tesseract_cmd = r'E:\tesseract\tesseract.exe'  # 기본값
-            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-            text = pytesseract.image_to_string(region_image, lang='kor+eng')
-            logger.debug(f"관심고객 OCR 텍스트: {text}")
-
-            # 숫자 추출
-            return extract_numbers_from_text(text)
-
-        except ImportError:
-            logger.warning("pytesseract가 설치되지 않음. OCR 기능 비활성화")
+        ocr = get_ocr_service()
+        if not ocr.available:
+            logger.warning("OCR 엔진을 사용할 수 없어 관심고객 수 추출을 건너뜁니다")
             return None
 
+        # '관심고객' 앵커 옆 숫자만 읽는 빠른 경로
+        from .numeric_reader import get_default_reader
+        interest_count = get_default_reader().read_after_anchor(region_image, "label_interest")
+        if interest_count is not None:
+            return interest_count
+
+        text = ocr.image_to_string(region_image, lang='kor+eng')
+        logger.debug(f"관심고객 OCR 텍스트: {text}")
+
+        # 숫자 추출
+        return extract_numbers_from_text(text)
+
     except Exception as e:
         logger.error(f"관심고객 수 추출 실패: {e}")
         return None
@@ -191,14 +207,16 @@ def extract_interest_count_from_region(x: int, y: int, width: int, height: int)
 def get_current_url() -> Optional[str]:
     """현재 브라우저 URL 가져오기"""
     try:
+        from .io_backend import get_io_backend
+        io = get_io_backend()
+
         # 주소창 클릭 후 복사
-        pyautogui.hotkey('ctrl', 'l')
+        io.hotkey('ctrl', 'l')
         time.sleep(0.3)
-        pyautogui.hotkey('ctrl', 'c')
+        io.hotkey('ctrl', 'c')
         time.sleep(0.5)
 
-        import pyperclip
-        url = pyperclip.paste()
+        url = io.clipboard_paste()
         return url if url and url.startswith('http') else None
 
     except Exception as e:
@@ -206,40 +224,14 @@ def get_current_url() -> Optional[str]:
         return None
 
 
-def detect_suspicious_screen() -> bool:
-    """의심스러운 화면 감지 (캡챠, 로그인 등)"""
-    try:
-        # 화면 전체 캡처
-        screenshot = pyautogui.screenshot()
-
-        # 간단한 텍스트 기반 감지
-        try:
-            import pytesseract
-            import yaml
-            import os
-            # Tesseract 경로 설정 (config.yaml에서 읽기)
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config_data = yaml.safe_load(f)
-                tesseract_cmd = config_data.get('ocr', {}).get('tesseract_cmd', r'E:\tesseract\tesseract.exe')
-            else:
-                tesseract_cmd = r'E:\tesseract\tesseract.exe'  # 기본값
-            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-            text = pytesseract.image_to_string(screenshot, lang='kor+eng').lower()
-
-            suspicious_keywords = [
-                'captcha', '캡챠', '로그인', 'login', '자동', '로봇', 'robot',
-                '보안', 'security', '차단', 'blocked', '접근', 'access',
-                '중단', '인증', '재확인'
-            ]
-
-            return any(keyword in text for keyword in suspicious_keywords)
-
-        except ImportError:
-            # OCR 없이는 기본적으로 안전하다고 가정
-            return False
+SUSPICIOUS_KEYWORDS = (
+    'captcha', '캡챠', '로그인', 'login', '자동', '로봇', 'robot',
+    '보안', 'security', '차단', 'blocked', '접근', 'access',
+    '중단', '인증', '재확인'
+)
 
-    except Exception as e:
-        logger.error(f"의심 화면 감지 실패: {e}")
-        return False
+
+def contains_suspicious_text(text: str) -> bool:
+    """캡챠/로그인/차단 안내 문구 포함 여부"""
+    text = (text or "").lower()
+    return any(keyword in text for keyword in SUSPICIOUS_KEYWORDS)
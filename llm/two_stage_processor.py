@@ -131,7 +131,7 @@ class TwoStageProcessor:
                 logger.info(f"Tesseract로 이미지 처리 중: {image_path}")
 
                 # Tesseract로 OCR 처리 (무료!)
-                raw_text = self._extract_text_with_tesseract(image_path)
+                raw_text = await self._extract_text_with_tesseract(image_path)
 
                 # 추출된 텍스트를 Gemini로 구조화 (비용 절약)
                 structured_response = await self.client.process_text_only(
@@ -378,35 +378,6 @@ class TwoStageProcessor:
         except Exception:
             return "미확인"
 
-    def _extract_text_with_tesseract(self, image_path: str) -> str:
-        """Tesseract를 사용한 무료 OCR 처리"""
-        try:
-            import pytesseract
-            from PIL import Image
-
-            # Tesseract 설정
-            pytesseract.pytesseract.tesseract_cmd = self.config.ocr.tesseract_cmd
-
-            # 이미지 로드 및 OCR
-            image = Image.open(image_path)
-
-            # 언어 설정 (한국어 + 영어)
-            languages = '+'.join(self.config.ocr.languages)
-
-            # OCR 실행
-            extracted_text = pytesseract.image_to_string(
-                image,
-                lang=languages,
-                config=f'--psm {self.config.ocr.psm} --oem {self.config.ocr.oem}'
-            )
-
-            logger.info(f"Tesseract OCR 완료: {len(extracted_text)}자 추출")
-            return extracted_text.strip()
-
-        except Exception as e:
-            logger.error(f"Tesseract OCR 실패: {e}")
-            return f"OCR 처리 실패: {str(e)}"
-
     def _extract_product_name_from_content(self, cold_email: str, product_info: str) -> str:
         """콜드메일 내용에서 상품명 추출"""
         try:
@@ -433,14 +404,16 @@ class TwoStageProcessor:
         except Exception:
             return "미확인"
 
-    def _extract_text_with_tesseract(self, image_path: str) -> str:
-        """Tesseract를 사용한 무료 OCR 처리"""
+    async def _extract_text_with_tesseract(self, image_path: str) -> str:
+        """Tesseract를 사용한 무료 OCR 처리 (상주 OCR 엔진 풀 사용)"""
         try:
-            import pytesseract
             from PIL import Image
+            from ocr.service import get_ocr_service
 
-            # Tesseract 설정
-            pytesseract.pytesseract.tesseract_cmd = self.config.ocr.tesseract_cmd
+            ocr = get_ocr_service(self.config.ocr.tesseract_cmd)
+            if not ocr.available:
+                logger.warning("Tesseract OCR 실패: 사용할 수 있는 OCR 엔진이 없습니다")
+                return "OCR 처리 실패: 사용할 수 있는 OCR 엔진이 없습니다"
 
             # 이미지 로드 및 OCR
             image = Image.open(image_path)
@@ -449,10 +422,11 @@ class TwoStageProcessor:
             languages = '+'.join(self.config.ocr.languages)
 
             # OCR 실행
-            extracted_text = pytesseract.image_to_string(
+            extracted_text = await ocr.image_to_string_async(
                 image,
                 lang=languages,
-                config=f'--psm {self.config.ocr.psm} --oem {self.config.ocr.oem}'
+                psm=self.config.ocr.psm,
+                oem=self.config.ocr.oem,
             )
 
             logger.info(f"Tesseract OCR 완료: {len(extracted_text)}자 추출")
@@ -0,0 +1,111 @@
+"""
+모자이크 배치 OCR 유틸리티
+여러 작은 ROI를 구분 여백과 함께 한 장의 이미지로 이어 붙이고,
+한 번의 인식 결과(단어 좌표)를 타일 오프셋으로 원래 ROI에 되돌려 분배한다.
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from ocr.service import OcrWord
+
+# (x, y, width, height) - 모자이크 안에서 타일이 놓인 위치
+TileBox = Tuple[int, int, int, int]
+
+
+@dataclass
+class TileResult:
+    """타일(ROI) 하나의 인식 결과"""
+    text: str = ""
+    confidence: float = 0.0
+    words: List[OcrWord] = field(default_factory=list)
+
+
+def _to_gray(image: np.ndarray) -> np.ndarray:
+    if image.ndim == 2:
+        return image
+    if image.shape[2] == 4:
+        return cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+def build_mosaic(images: Sequence[Optional[np.ndarray]], gap: int = 24, margin: int = 10,
+                 background: int = 255) -> Tuple[np.ndarray, List[Optional[TileBox]]]:
+    """ROI들을 세로로 이어 붙인 회색조 모자이크와 타일 위치 목록 반환 (None/빈 ROI는 건너뜀)"""
+    tiles = [None if img is None or img.size == 0 else _to_gray(np.asarray(img)) for img in images]
+    present = [tile for tile in tiles if tile is not None]
+
+    width = max((tile.shape[1] for tile in present), default=1) + margin * 2
+    height = sum(tile.shape[0] for tile in present) + gap * max(len(present) - 1, 0) + margin * 2
+    mosaic = np.full((height, width), background, dtype=np.uint8)
+
+    boxes: List[Optional[TileBox]] = []
+    y = margin
+    for tile in tiles:
+        if tile is None:
+            boxes.append(None)
+            continue
+        tile_height, tile_width = tile.shape[:2]
+        mosaic[y:y + tile_height, margin:margin + tile_width] = tile
+        boxes.append((margin, y, tile_width, tile_height))
+        y += tile_height + gap
+
+    return mosaic, boxes
+
+
+def assign_words_to_tiles(words: Sequence[OcrWord], boxes: Sequence[Optional[TileBox]]) -> List[List[OcrWord]]:
+    """모자이크 기준 단어를 세로 중심이 가장 가까운 타일에 배정하고 타일 좌표로 변환"""
+    assigned: List[List[OcrWord]] = [[] for _ in boxes]
+    placed = [(i, box) for i, box in enumerate(boxes) if box is not None]
+    if not placed:
+        return assigned
+
+    for word in words:
+        center_y = word.top + word.height / 2
+
+        def distance(item):
+            _, (_, tile_y, _, tile_height) = item
+            if tile_y <= center_y <= tile_y + tile_height:
+                return 0.0
+            return min(abs(center_y - tile_y), abs(center_y - (tile_y + tile_height)))
+
+        index, (tile_x, tile_y, _, _) = min(placed, key=distance)
+        assigned[index].append(OcrWord(
+            word.text, word.confidence,
+            word.left - tile_x, word.top - tile_y, word.width, word.height,
+        ))
+
+    return assigned
+
+
+def words_to_text(words: Sequence[OcrWord]) -> str:
+    """단어 좌표로 줄을 묶어 텍스트 복원 (줄은 위→아래, 단어는 왼→오른쪽)"""
+    lines: List[List[OcrWord]] = []
+    spans: List[Tuple[float, float]] = []
+
+    for word in sorted(words, key=lambda w: (w.top, w.left)):
+        center_y = word.top + word.height / 2
+        for index, (top, bottom) in enumerate(spans):
+            if top <= center_y <= bottom:
+                lines[index].append(word)
+                spans[index] = (min(top, word.top), max(bottom, word.top + word.height))
+                break
+        else:
+            lines.append([word])
+            spans.append((word.top, word.top + word.height))
+
+    return "\n".join(
+        " ".join(w.text for w in sorted(line, key=lambda w: w.left))
+        for line in lines
+    )
+
+
+def split_results(words: Sequence[OcrWord], boxes: Sequence[Optional[TileBox]]) -> List[TileResult]:
+    """모자이크 인식 결과를 타일별 텍스트/신뢰도로 분리"""
+    results = []
+    for tile_words in assign_words_to_tiles(words, boxes):
+        confidence = sum(w.confidence for w in tile_words) / len(tile_words) if tile_words else 0.0
+        results.append(TileResult(words_to_text(tile_words), confidence, tile_words))
+    return results
@@ -0,0 +1,529 @@
+"""
+공용 OCR 서비스
+Tesseract 엔진을 한 번만 초기화해 두고 (언어, PSM, OEM, 변수) 조합별 풀로 재사용한다.
+
+- tesserocr(C API 바인딩)가 설치되어 있으면 프로세스 안에서 엔진을 유지하므로
+  호출마다 tesseract 프로세스를 띄우고 traineddata를 다시 읽는 비용이 없다.
+- tesserocr가 없으면 Tesseract 설치본의 libtesseract(C API)를 ctypes로 직접 불러
+  같은 방식으로 상주시킨다 (Windows 설치본의 libtesseract-*.dll 포함, 별도 빌드 불필요).
+- 둘 다 없을 때만 pytesseract로 폴백한다 (호출마다 tesseract 프로세스 실행).
+"""
+import asyncio
+import ctypes
+import ctypes.util
+import glob
+import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from queue import Queue, Empty
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "config.yaml"
+DEFAULT_LANG = "kor+eng"
+
+
+@dataclass(frozen=True)
+class EngineKey:
+    """엔진 풀 키 (같은 키의 엔진은 서로 교체 가능)"""
+    lang: str = DEFAULT_LANG
+    psm: Optional[int] = None
+    oem: Optional[int] = None
+    variables: Tuple[Tuple[str, str], ...] = ()
+
+    def tesseract_config(self) -> str:
+        """pytesseract용 config 문자열"""
+        parts = []
+        if self.psm is not None:
+            parts.append(f"--psm {self.psm}")
+        if self.oem is not None:
+            parts.append(f"--oem {self.oem}")
+        parts.extend(f"-c {name}={value}" for name, value in self.variables)
+        return " ".join(parts)
+
+
+@dataclass
+class OcrWord:
+    """단어 단위 인식 결과 (좌표는 입력 이미지 기준)"""
+    text: str
+    confidence: float
+    left: int
+    top: int
+    width: int
+    height: int
+
+
+def _load_ocr_settings() -> Dict[str, Any]:
+    """config/config.yaml의 ocr 섹션 로드"""
+    try:
+        import yaml  # type: ignore
+    except ImportError:
+        return {}
+
+    if not CONFIG_PATH.exists():
+        return {}
+
+    try:
+        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+            config_data = yaml.safe_load(f) or {}
+        return config_data.get('ocr', {}) or {}
+    except Exception as e:
+        logger.warning(f"config.yaml 로드 실패: {e}")
+        return {}
+
+
+def resolve_tesseract_cmd(settings: Optional[Dict[str, Any]] = None,
+                          tesseract_cmd: Optional[str] = None) -> Optional[str]:
+    """tesseract 실행 파일 경로 결정 (인자 → config.yaml → TESSERACT_CMD → PATH)"""
+    if not tesseract_cmd:
+        settings = _load_ocr_settings() if settings is None else settings
+        tesseract_cmd = settings.get('tesseract_cmd')
+
+    if not tesseract_cmd or '${' in str(tesseract_cmd):
+        tesseract_cmd = os.getenv('TESSERACT_CMD') or shutil.which('tesseract')
+
+    if not tesseract_cmd:
+        return None
+    return os.path.expanduser(os.path.expandvars(str(tesseract_cmd)))
+
+
+def _to_pil(image: Any) -> Image.Image:
+    """numpy(BGR/BGRA/GRAY) 또는 PIL 이미지를 PIL 이미지로 변환"""
+    if isinstance(image, Image.Image):
+        return image
+
+    array = np.asarray(image)
+    if array.ndim == 3 and array.shape[2] == 3:
+        return Image.fromarray(np.ascontiguousarray(array[:, :, ::-1]))
+    if array.ndim == 3 and array.shape[2] == 4:
+        return Image.fromarray(np.ascontiguousarray(array[:, :, [2, 1, 0, 3]]))
+    return Image.fromarray(np.ascontiguousarray(array))
+
+
+class _TesserocrEngine:
+    """tesserocr C API 엔진 (프로세스 내 상주)"""
+
+    def __init__(self, key: EngineKey, tessdata_path: Optional[str] = None):
+        import tesserocr  # type: ignore
+
+        self._tesserocr = tesserocr
+        kwargs: Dict[str, Any] = {"lang": key.lang, "variables": dict(key.variables)}
+        if key.psm is not None:
+            kwargs["psm"] = key.psm
+        if key.oem is not None:
+            kwargs["oem"] = key.oem
+        if tessdata_path:
+            kwargs["path"] = tessdata_path
+        self.api = tesserocr.PyTessBaseAPI(**kwargs)
+
+    def recognize(self, image: Image.Image) -> str:
+        self.api.SetImage(image)
+        return self.api.GetUTF8Text()
+
+    def recognize_words(self, image: Image.Image) -> List[OcrWord]:
+        RIL = self._tesserocr.RIL
+        self.api.SetImage(image)
+        self.api.Recognize()
+
+        words: List[OcrWord] = []
+        iterator = self.api.GetIterator()
+        if iterator is None:
+            return words
+
+        for item in self._tesserocr.iterate_level(iterator, RIL.WORD):
+            text = item.GetUTF8Text(RIL.WORD)
+            box = item.BoundingBox(RIL.WORD)
+            if not text or not text.strip() or not box:
+                continue
+            x1, y1, x2, y2 = box
+            words.append(OcrWord(text.strip(), float(item.Confidence(RIL.WORD)), x1, y1, x2 - x1, y2 - y1))
+        return words
+
+    def close(self):
+        self.api.End()
+
+
+def find_tesseract_library(tesseract_cmd: Optional[str] = None) -> Optional[str]:
+    """libtesseract 경로 (tesseract 실행 파일 옆의 DLL → 시스템 라이브러리 순)"""
+    if tesseract_cmd:
+        folder = os.path.dirname(tesseract_cmd)
+        for pattern in ("libtesseract*.dll", "tesseract*.dll", "libtesseract*.dylib", "libtesseract.so*"):
+            found = sorted(glob.glob(os.path.join(folder, pattern)))
+            if found:
+                return found[-1]
+    return ctypes.util.find_library("tesseract")
+
+
+class _CapiLibrary:
+    """libtesseract C API 함수 시그니처 (프로세스당 한 번 로드)"""
+
+    RIL_WORD = 3
+
+    def __init__(self, path: str):
+        folder = os.path.dirname(path)
+        if folder and hasattr(os, "add_dll_directory"):
+            # Windows: 같은 폴더의 leptonica 등 의존 DLL 탐색 경로 추가
+            os.add_dll_directory(folder)
+        lib = ctypes.CDLL(path)
+        handle, text = ctypes.c_void_p, ctypes.c_char_p
+        signatures = {
+            "TessBaseAPICreate": ([], handle),
+            "TessBaseAPIInit2": ([handle, text, text, ctypes.c_int], ctypes.c_int),
+            "TessBaseAPISetPageSegMode": ([handle, ctypes.c_int], None),
+            "TessBaseAPISetVariable": ([handle, text, text], ctypes.c_int),
+            "TessBaseAPISetImage": ([handle, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                     ctypes.c_int], None),
+            "TessBaseAPIRecognize": ([handle, ctypes.c_void_p], ctypes.c_int),
+            "TessBaseAPIGetUTF8Text": ([handle], ctypes.c_void_p),
+            "TessBaseAPIGetIterator": ([handle], handle),
+            "TessBaseAPIEnd": ([handle], None),
+            "TessBaseAPIDelete": ([handle], None),
+            "TessDeleteText": ([ctypes.c_void_p], None),
+            "TessResultIteratorGetPageIterator": ([handle], handle),
+            "TessResultIteratorGetUTF8Text": ([handle, ctypes.c_int], ctypes.c_void_p),
+            "TessResultIteratorConfidence": ([handle, ctypes.c_int], ctypes.c_float),
+            "TessResultIteratorNext": ([handle, ctypes.c_int], ctypes.c_int),
+            "TessResultIteratorDelete": ([handle], None),
+            "TessPageIteratorBoundingBox": ([handle, ctypes.c_int] + [ctypes.POINTER(ctypes.c_int)] * 4,
+                                            ctypes.c_int),
+        }
+        for name, (argtypes, restype) in signatures.items():
+            function = getattr(lib, name)
+            function.argtypes, function.restype = argtypes, restype
+        self.lib = lib
+
+    def take_text(self, pointer: Optional[int]) -> str:
+        """C API가 돌려준 문자열을 복사하고 해제"""
+        if not pointer:
+            return ""
+        try:
+            return ctypes.string_at(pointer).decode("utf-8", errors="replace")
+        finally:
+            self.lib.TessDeleteText(pointer)
+
+
+_capi: Optional[_CapiLibrary] = None
+_capi_lock = threading.Lock()
+
+
+def _load_capi(tesseract_cmd: Optional[str]) -> Optional[_CapiLibrary]:
+    """libtesseract를 찾아 로드 (없거나 실패하면 None)"""
+    global _capi
+    with _capi_lock:
+        if _capi is None:
+            path = find_tesseract_library(tesseract_cmd)
+            if not path:
+                return None
+            try:
+                _capi = _CapiLibrary(path)
+                logger.info(f"libtesseract C API 로드: {path}")
+            except (OSError, AttributeError) as e:
+                logger.warning(f"libtesseract 로드 실패 ({path}): {e}")
+                return None
+        return _capi
+
+
+class _CapiEngine:
+    """libtesseract C API 엔진 (ctypes, 프로세스 내 상주)"""
+
+    def __init__(self, key: EngineKey, capi: _CapiLibrary, tessdata_path: Optional[str] = None):
+        self.capi = capi
+        lib = capi.lib
+        self.api = lib.TessBaseAPICreate()
+        oem = key.oem if key.oem is not None else 3  # OEM_DEFAULT
+        datapath = tessdata_path.encode("utf-8") if tessdata_path else None
+        if lib.TessBaseAPIInit2(self.api, datapath, key.lang.encode("utf-8"), oem) != 0:
+            lib.TessBaseAPIDelete(self.api)
+            raise RuntimeError(f"Tesseract 초기화 실패 (lang={key.lang}, tessdata={tessdata_path})")
+        if key.psm is not None:
+            lib.TessBaseAPISetPageSegMode(self.api, key.psm)
+        for name, value in key.variables:
+            lib.TessBaseAPISetVariable(self.api, name.encode("utf-8"), value.encode("utf-8"))
+
+    def _set_image(self, image: Image.Image):
+        if image.mode not in ("L", "RGB"):
+            image = image.convert("RGB")
+        channels = 1 if image.mode == "L" else 3
+        width, height = image.size
+        self.capi.lib.TessBaseAPISetImage(self.api, image.tobytes(), width, height, channels, width * channels)
+
+    def recognize(self, image: Image.Image) -> str:
+        self._set_image(image)
+        return self.capi.take_text(self.capi.lib.TessBaseAPIGetUTF8Text(self.api))
+
+    def recognize_words(self, image: Image.Image) -> List[OcrWord]:
+        lib, level = self.capi.lib, _CapiLibrary.RIL_WORD
+        self._set_image(image)
+        words: List[OcrWord] = []
+        if lib.TessBaseAPIRecognize(self.api, None) != 0:
+            return words
+        iterator = lib.TessBaseAPIGetIterator(self.api)
+        if not iterator:
+            return words
+        try:
+            page = lib.TessResultIteratorGetPageIterator(iterator)
+            box = [ctypes.c_int() for _ in range(4)]
+            while True:
+                text = self.capi.take_text(lib.TessResultIteratorGetUTF8Text(iterator, level)).strip()
+                if text and lib.TessPageIteratorBoundingBox(page, level, *(ctypes.byref(v) for v in box)):
+                    x1, y1, x2, y2 = (v.value for v in box)
+                    confidence = float(lib.TessResultIteratorConfidence(iterator, level))
+                    words.append(OcrWord(text, confidence, x1, y1, x2 - x1, y2 - y1))
+                if not lib.TessResultIteratorNext(iterator, level):
+                    break
+        finally:
+            lib.TessResultIteratorDelete(iterator)
+        return words
+
+    def close(self):
+        self.capi.lib.TessBaseAPIEnd(self.api)
+        self.capi.lib.TessBaseAPIDelete(self.api)
+
+
+class _PytesseractEngine:
+    """pytesseract 폴백 엔진 (호출마다 tesseract 프로세스를 실행)"""
+
+    def __init__(self, key: EngineKey, tesseract_cmd: str):
+        import pytesseract  # type: ignore
+
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        self._pytesseract = pytesseract
+        self._lang = key.lang
+        self._config = key.tesseract_config()
+
+    def recognize(self, image: Image.Image) -> str:
+        return self._pytesseract.image_to_string(image, lang=self._lang, config=self._config)
+
+    def recognize_words(self, image: Image.Image) -> List[OcrWord]:
+        data = self._pytesseract.image_to_data(
+            image, lang=self._lang, config=self._config, output_type=self._pytesseract.Output.DICT
+        )
+        words: List[OcrWord] = []
+        for i, text in enumerate(data.get("text", [])):
+            confidence = float(data["conf"][i])
+            if not text or not text.strip() or confidence < 0:
+                continue
+            words.append(OcrWord(
+                text.strip(), confidence,
+                int(data["left"][i]), int(data["top"][i]),
+                int(data["width"][i]), int(data["height"][i]),
+            ))
+        return words
+
+    def close(self):
+        pass
+
+
+class OcrService:
+    """언어/PSM 조합별로 초기화된 엔진을 풀링하는 OCR 서비스 (동기/비동기 API)"""
+
+    def __init__(self, tesseract_cmd: Optional[str] = None, pool_size: Optional[int] = None,
+                 tessdata_path: Optional[str] = None):
+        settings = _load_ocr_settings()
+        self.tesseract_cmd = resolve_tesseract_cmd(settings, tesseract_cmd)
+        self.tessdata_path = tessdata_path or settings.get('tessdata_dir') or os.getenv('TESSDATA_PREFIX')
+        self.pool_size = max(1, int(pool_size or settings.get('pool_size', 2)))
+        self.backend = self._detect_backend()
+
+        self._pools: Dict[EngineKey, Queue] = {}
+        self._created: Dict[EngineKey, int] = {}
+        self._engines: List[Any] = []
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _detect_backend(self) -> Optional[str]:
+        try:
+            import tesserocr  # type: ignore  # noqa: F401
+            return "tesserocr"
+        except ImportError:
+            pass
+
+        if _load_capi(self.tesseract_cmd) is not None:
+            return "capi"
+
+        try:
+            import pytesseract  # type: ignore  # noqa: F401
+        except ImportError:
+            logger.warning('pytesseract가 설치되지 않아 OCR을 사용할 수 없습니다.')
+            return None
+
+        if not self.tesseract_cmd:
+            logger.warning('tesseract_cmd가 설정되지 않아 OCR 기능을 비활성화합니다.')
+            return None
+        logger.warning('tesserocr/libtesseract를 찾지 못해 pytesseract로 폴백합니다 (OCR 호출마다 tesseract 프로세스 실행).')
+        return "pytesseract"
+
+    @property
+    def available(self) -> bool:
+        return self.backend is not None
+
+    # === 엔진 풀 ===
+
+    def _create_engine(self, key: EngineKey):
+        if self.backend == "tesserocr":
+            return _TesserocrEngine(key, self.tessdata_path)
+        if self.backend == "capi":
+            return _CapiEngine(key, _load_capi(self.tesseract_cmd), self._capi_tessdata())
+        return _PytesseractEngine(key, self.tesseract_cmd)
+
+    def _capi_tessdata(self) -> Optional[str]:
+        """C API용 tessdata 경로 (미지정 시 실행 파일 옆 tessdata 폴더, 없으면 라이브러리 기본값)"""
+        if self.tessdata_path:
+            return self.tessdata_path
+        if self.tesseract_cmd:
+            folder = os.path.join(os.path.dirname(self.tesseract_cmd), "tessdata")
+            if os.path.isdir(folder):
+                return folder
+        return None
+
+    @contextmanager
+    def _lease(self, key: EngineKey) -> Iterator[Any]:
+        """풀에서 엔진을 빌려오고 사용 후 반납 (풀이 비었고 여유가 있으면 새로 생성)"""
+        create = False
+        with self._lock:
+            pool = self._pools.setdefault(key, Queue())
+            engine = None
+            try:
+                engine = pool.get_nowait()
+            except Empty:
+                if self._created.get(key, 0) < self.pool_size:
+                    # 자리만 잡아 두고 생성(traineddata 로드)은 락 밖에서 - 다른 키 조회를 막지 않음
+                    self._created[key] = self._created.get(key, 0) + 1
+                    create = True
+
+        if create:
+            try:
+                engine = self._create_engine(key)
+            except Exception:
+                with self._lock:
+                    self._created[key] = max(0, self._created.get(key, 1) - 1)
+                raise
+            with self._lock:
+                self._engines.append(engine)
+            logger.debug(f"OCR 엔진 초기화: {key}")
+        elif engine is None:
+            engine = pool.get()
+
+        try:
+            yield engine
+        finally:
+            pool.put(engine)
+
+    @staticmethod
+    def _make_key(lang: str, psm: Optional[int], oem: Optional[int],
+                  variables: Optional[Dict[str, str]]) -> EngineKey:
+        items = tuple(sorted((str(k), str(v)) for k, v in (variables or {}).items()))
+        return EngineKey(lang or DEFAULT_LANG, psm, oem, items)
+
+    # === 동기 API ===
+
+    def image_to_string(self, image: Any, lang: str = DEFAULT_LANG, psm: Optional[int] = None,
+                        oem: Optional[int] = None, variables: Optional[Dict[str, str]] = None) -> str:
+        """이미지 전체 텍스트 인식"""
+        if not self.available:
+            return ""
+        key = self._make_key(lang, psm, oem, variables)
+        with self._lease(key) as engine:
+            return engine.recognize(_to_pil(image))
+
+    def image_to_words(self, image: Any, lang: str = DEFAULT_LANG, psm: Optional[int] = None,
+                       oem: Optional[int] = None, variables: Optional[Dict[str, str]] = None) -> List[OcrWord]:
+        """단어 단위 인식 (텍스트, 신뢰도, 좌표)"""
+        if not self.available:
+            return []
+        key = self._make_key(lang, psm, oem, variables)
+        with self._lease(key) as engine:
+            return engine.recognize_words(_to_pil(image))
+
+    def image_to_string_batch(self, images: List[Any], lang: str = DEFAULT_LANG, psm: Optional[int] = 4,
+                              oem: Optional[int] = None, variables: Optional[Dict[str, str]] = None,
+                              gap: int = 24) -> List[Any]:
+        """여러 ROI를 모자이크 한 장으로 묶어 한 번에 인식하고 ROI별 TileResult(텍스트, 신뢰도) 반환"""
+        from ocr.mosaic import TileResult, build_mosaic, split_results
+
+        if not self.available or not images:
+            return [TileResult() for _ in images]
+
+        mosaic, boxes = build_mosaic(images, gap=gap)
+        words = self.image_to_words(mosaic, lang, psm, oem, variables)
+        return split_results(words, boxes)
+
+    # === 비동기 API ===
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="ocr")
+            return self._executor
+
+    async def image_to_string_async(self, image: Any, lang: str = DEFAULT_LANG, psm: Optional[int] = None,
+                                    oem: Optional[int] = None, variables: Optional[Dict[str, str]] = None) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), lambda: self.image_to_string(image, lang, psm, oem, variables)
+        )
+
+    async def image_to_words_async(self, image: Any, lang: str = DEFAULT_LANG, psm: Optional[int] = None,
+                                   oem: Optional[int] = None,
+                                   variables: Optional[Dict[str, str]] = None) -> List[OcrWord]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), lambda: self.image_to_words(image, lang, psm, oem, variables)
+        )
+
+    async def image_to_string_batch_async(self, images: List[Any], lang: str = DEFAULT_LANG,
+                                          psm: Optional[int] = 4, oem: Optional[int] = None,
+                                          variables: Optional[Dict[str, str]] = None, gap: int = 24) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), lambda: self.image_to_string_batch(images, lang, psm, oem, variables, gap)
+        )
+
+    def close(self):
+        """엔진과 실행기 정리"""
+        with self._lock:
+            engines, self._engines = self._engines, []
+            self._pools.clear()
+            self._created.clear()
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+        for engine in engines:
+            try:
+                engine.close()
+            except Exception as e:
+                logger.debug(f"OCR 엔진 종료 실패(무시): {e}")
+
+
+_service: Optional[OcrService] = None
+_service_lock = threading.Lock()
+
+
+def get_ocr_service(tesseract_cmd: Optional[str] = None) -> OcrService:
+    """프로세스 전역 OCR 서비스 반환 (최초 호출 시 생성, 다른 tesseract_cmd를 받으면 다시 생성)"""
+    global _service
+    with _service_lock:
+        requested = resolve_tesseract_cmd({}, tesseract_cmd) if tesseract_cmd else None
+        if _service is not None and requested and requested != _service.tesseract_cmd:
+            if _service.backend in ("tesserocr", "capi"):
+                # C API 엔진은 실행 파일을 쓰지 않으므로 기존 엔진 유지
+                logger.debug(f"C API 엔진 사용 중이라 tesseract_cmd 변경은 무시합니다: {requested}")
+            else:
+                logger.warning(f"tesseract_cmd 변경으로 OCR 서비스를 다시 만듭니다: "
+                               f"{_service.tesseract_cmd} → {requested}")
+                _service.close()
+                _service = None
+        if _service is None:
+            _service = OcrService(tesseract_cmd=tesseract_cmd)
+            logger.info(f"OCR 서비스 초기화: backend={_service.backend}, pool={_service.pool_size}")
+        return _service
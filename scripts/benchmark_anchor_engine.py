@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark the OpenCV anchor engine against pyautogui/pyscreeze on recorded screenshots."""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import cv2
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_SCREENS = ["client_discovery/screens", "_archive/backup_data"]
+DEFAULT_ANCHORS = ["label_review", "label_interest", "tab_shoppingmall", "sort_review_desc"]
+
+
+def collect_screens(paths: list[str]) -> list[Path]:
+    screens: list[Path] = []
+    for raw in paths:
+        path = ROOT / raw
+        if path.is_dir():
+            screens.extend(sorted(path.glob("*.png")))
+        elif path.suffix.lower() == ".png":
+            screens.append(path)
+    return screens
+
+
+def time_call(fn, repeat: int) -> tuple[float, object]:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("screens", nargs="*", default=DEFAULT_SCREENS, help="PNG files or directories")
+    parser.add_argument("--config", default="client_discovery/config.json")
+    parser.add_argument("--anchors", nargs="*", default=DEFAULT_ANCHORS)
+    parser.add_argument("--confidence", type=float, default=0.8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    import pyscreeze
+    from PIL import Image
+    from client_discovery.anchor_engine import AnchorEngine
+
+    with open(ROOT / args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    anchor_paths = {
+        name: str(ROOT / config.get("anchors", {}).get(name, ""))
+        for name in args.anchors
+        if config.get("anchors", {}).get(name)
+    }
+
+    screens = collect_screens(args.screens)
+    if not screens or not anchor_paths:
+        print("No screenshots or anchors to benchmark.")
+        return 1
+
+    engine = AnchorEngine(config)
+    legacy_ms, engine_ms, mismatches = [], [], 0
+
+    for screen_path in screens:
+        pil_image = Image.open(screen_path).convert("RGB")
+        frame = cv2.imread(str(screen_path))
+        for name, anchor_path in anchor_paths.items():
+            def legacy():
+                try:
+                    return list(pyscreeze.locateAll(anchor_path, pil_image, confidence=args.confidence))
+                except (pyscreeze.ImageNotFoundException, ValueError):
+                    return []
+
+            legacy_time, legacy_boxes = time_call(legacy, args.repeat)
+            engine_time, engine_boxes = time_call(
+                lambda: engine.locate_all(anchor_path, frame.copy(), confidence=args.confidence), args.repeat
+            )
+            legacy_ms.append(legacy_time)
+            engine_ms.append(engine_time)
+
+            if len(legacy_boxes) != len(engine_boxes):
+                mismatches += 1
+                print(f"  ! {screen_path.name} / {name}: pyscreeze {len(legacy_boxes)} vs engine {len(engine_boxes)}")
+
+    print(f"screens={len(screens)} anchors={len(anchor_paths)} searches={len(legacy_ms)} repeat={args.repeat}")
+    print(f"pyscreeze locateAll : median {statistics.median(legacy_ms):7.1f} ms, total {sum(legacy_ms):8.1f} ms")
+    print(f"AnchorEngine        : median {statistics.median(engine_ms):7.1f} ms, total {sum(engine_ms):8.1f} ms")
+    print(f"speedup             : x{sum(legacy_ms) / max(sum(engine_ms), 1e-6):.1f}")
+    print(f"match-count mismatches: {mismatches}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Replay recorded search API responses (HAR/JSON) through the capture pipeline and report throughput."""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("recordings", nargs="?", default="tests/fixtures/capture", help="HAR/JSON file or directory")
+    parser.add_argument("--config", default="client_discovery/config.json")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    from client_discovery.m4_filter import FilterManager
+    from client_discovery.network_capture import CaptureProcessor, iter_recorded_payloads
+
+    with open(ROOT / args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    payloads = list(iter_recorded_payloads(ROOT / args.recordings))
+    if not payloads:
+        print("No recorded search responses found.")
+        return 1
+
+    # 실제 중복 색인을 건드리지 않도록 메모리 색인 사용
+    config["dedupe"] = {"index_file": ":memory:"}
+    filter_manager = FilterManager(config)
+    parsed = saved = pending = 0
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        # 매 반복을 같은 조건으로: 이전 반복에서 처리한 스토어 기록은 비움
+        filter_manager.index.clear()
+        result = CaptureProcessor(config, filter_manager).process(payloads)
+        parsed += result.parsed
+        saved += len(result.details)
+        pending += len(result.pending_cards)
+    elapsed = time.perf_counter() - start
+
+    print(f"responses={len(payloads)} repeat={args.repeat}")
+    print(f"stores parsed : {parsed} ({parsed / elapsed:,.0f} stores/s, {elapsed / args.repeat * 1000:.2f} ms per replay)")
+    print(f"to save       : {saved / args.repeat:.1f} per replay")
+    print(f"needs detail  : {pending / args.repeat:.1f} per replay")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
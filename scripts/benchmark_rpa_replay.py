@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Replay a recorded RPA session (io.mode = "record") headlessly and report cards/minute, per-step timings and wait overhead."""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("session", help="session directory written with io.mode = record")
+    parser.add_argument("--config", default="client_discovery/config.json")
+    parser.add_argument("--keyword", default="", help="keyword typed during the recording (default: config search.keywords)")
+    parser.add_argument("--keep-politeness", action="store_true", help="keep the readiness politeness floor")
+    args = parser.parse_args()
+
+    from client_discovery.io_backend import get_io_backend
+    from client_discovery.main_crawler import NaverShoppingCrawler
+    from client_discovery.models import Checkpoint
+
+    with open(ROOT / args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    config["io"] = {"mode": "replay", "session_dir": str(Path(args.session).resolve())}
+    config["dedupe"] = {"index_file": ":memory:"}
+    # 결과 DB(체크포인트/실행 기록/키워드 성과)도 메모리에만 - 크롤러 생성 시 바로 열리므로 생성 전에 지정
+    config.setdefault("storage", {})["db_file"] = ":memory:"
+    config.setdefault("backend", {})["mode"] = "rpa"
+    if args.keyword:
+        config.setdefault("search", {})["keywords"] = [args.keyword]
+    # 재생 중에는 디버깅 포트가 없으므로 창 제목/클립보드 기록만 사용
+    config.setdefault("url_resolver", {})["sources"] = ["title", "clipboard"]
+    if not args.keep_politeness:
+        readiness = config.setdefault("timing", {}).setdefault("readiness", {})
+        readiness["politeness_min"] = readiness["politeness_max"] = 0.0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp) / "config.json"
+        config_path.write_text(json.dumps(config, ensure_ascii=False), encoding="utf-8")
+
+        crawler = NaverShoppingCrawler(str(config_path))
+        # 실제 결과/체크포인트를 건드리지 않고 매번 같은 조건에서 재생
+        crawler.storage.output_dir = Path(tmp)
+        crawler.checkpoint = Checkpoint.load(str(Path(tmp) / "checkpoint.json"))
+
+        replay = get_io_backend()
+        start = time.perf_counter()
+        result = crawler.run()
+        elapsed = time.perf_counter() - start
+
+    stats = crawler.stats
+    print(f"status        : {result.get('status')} ({result.get('message')})")
+    print(f"inputs        : {replay.actions} replayed, {replay.divergences} diverged")
+    print(f"cards         : {stats.total_visited} visited, {stats.total_saved} saved in {elapsed:.1f}s "
+          f"({stats.total_visited / elapsed * 60 if elapsed else 0:.1f} cards/min)")
+    print("timings:")
+    print(stats.timing_summary() or "  (none)")
+    print("waits:")
+    print(stats.wait_histogram() or "  (none)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark the Aho-Corasick name-rule matcher against the per-entry substring loop on large blocklists."""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+SYLLABLES = "가나다라마바사아자차카타파하몰샵숍스토어리빙마켓"
+SEPARATORS = ['/', '|', '·', 'ㆍ', '+', ',']
+MULTI_STORE_KEYWORDS = ["가격비교", "여러", "공동"]
+
+
+def random_name(rng: random.Random, low: int = 3, high: int = 10) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(low, high)))
+
+
+def legacy_rules(name: str, blocklist: list[str]) -> tuple[bool, bool]:
+    """FilterManager 이전 구현: 차단 목록 루프 + 구분자/키워드 루프"""
+    lowered = name.lower()
+    blocked = any(keyword.lower() in lowered for keyword in blocklist)
+    multi = any(sep in name for sep in SEPARATORS) or any(kw in lowered for kw in MULTI_STORE_KEYWORDS)
+    return blocked, multi
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[100, 1000, 5000, 20000], help="blocklist sizes")
+    parser.add_argument("--names", type=int, default=2000, help="store names checked per size")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    from client_discovery.text_matcher import TextMatcher
+
+    rng = random.Random(args.seed)
+    names = [random_name(rng, 2, 12) for _ in range(args.names)]
+
+    print(f"names={len(names)} repeat={args.repeat}")
+    for size in args.sizes:
+        blocklist = [random_name(rng, 4, 8) for _ in range(size)]
+        build_start = time.perf_counter()
+        matcher = TextMatcher({"blocklist": blocklist, "multi_store": MULTI_STORE_KEYWORDS, "separator": SEPARATORS})
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        legacy_ms, matcher_ms = [], []
+        legacy_result = matcher_result = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            legacy_result = [legacy_rules(name, blocklist) for name in names]
+            legacy_ms.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            matcher_result = []
+            for name in names:
+                found = matcher.matches(name)
+                matcher_result.append((bool(found.get("blocklist")), bool(found.get("separator") or found.get("multi_store"))))
+            matcher_ms.append((time.perf_counter() - start) * 1000)
+
+        mismatches = sum(a != b for a, b in zip(legacy_result, matcher_result))
+        legacy, fast = statistics.median(legacy_ms), statistics.median(matcher_ms)
+        print(f"blocklist={size:6d}: substring loop {legacy:8.1f} ms, automaton {fast:6.1f} ms "
+              f"(build {build_ms:6.1f} ms), speedup x{legacy / max(fast, 1e-6):.1f}, mismatches {mismatches}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from client_discovery.m4_filter import FilterManager
+from client_discovery.m5_storage import StorageManager
+from client_discovery.parallel_crawler import ParallelKeywordCrawler
+
+pytestmark = pytest.mark.e2e
+
+SITE = Path(__file__).resolve().parents[1] / "fixtures" / "dom" / "site"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def fixture_site():
+    handler = functools.partial(_QuietHandler, directory=str(SITE))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.mark.skipif(os.environ.get("RUN_PLAYWRIGHT") != "1", reason="Set RUN_PLAYWRIGHT=1 to enable Playwright flows")
+def test_parallel_crawl_shares_dedupe_and_storage(fixture_site, tmp_path, monkeypatch):
+    monkeypatch.setattr(FilterManager, "_get_output_file", lambda self: tmp_path / "targets.csv")
+    config = {
+        "search": {"review_min": 200, "review_max": 300, "follower_min": 50, "follower_max": 1500},
+        "output": {"csv_file": "targets.csv", "log_file": "run.log"},
+        "blocklist": [],
+        "backend": {
+            "search_url": fixture_site + "/search_{query}.html?sort=review",
+            "storage_state": "",
+            "parallel_contexts": 2,
+            "requests_per_sec": 20,
+            "max_scrolls": 0,
+        },
+    }
+    storage = StorageManager(config)
+    storage.output_dir = tmp_path
+
+    result = ParallelKeywordCrawler(config, FilterManager(config), storage).run(["a", "b"])
+
+    saved = sorted(detail["store_name"] for detail in result["details"])
+    assert saved == ["감마샵", "베타리빙"]
+    assert result["visited_count"] == 3  # 감마샵은 두 키워드에 모두 있지만 한 번만 방문
+    assert (tmp_path / "targets.csv").read_text(encoding="utf-8").count("\n") == 3
@@ -0,0 +1,59 @@
+import cv2
+import numpy as np
+
+from client_discovery.anchor_engine import AnchorEngine
+
+ANCHOR = "assets/img/label_review.png"
+
+
+def _frame_with_anchors(positions):
+    template = cv2.imread(ANCHOR)
+    rng = np.random.default_rng(0)
+    frame = rng.integers(200, 256, (900, 700, 3), dtype=np.uint8)
+    for x, y in positions:
+        frame[y:y + template.shape[0], x:x + template.shape[1]] = template
+    return frame
+
+
+def test_locate_all_finds_every_anchor_in_order():
+    positions = [(40, 500), (40, 100), (360, 300)]
+    engine = AnchorEngine({"anchor_engine": {"downscale": 0.5}})
+
+    matches = engine.locate_all(ANCHOR, _frame_with_anchors(positions), confidence=0.8)
+
+    assert [(m.left, m.top) for m in matches] == sorted(positions, key=lambda p: (p[1], p[0]))
+    assert all(m.score >= 0.8 for m in matches)
+
+
+def test_locate_prefers_hint_region_and_forget_resets_it():
+    engine = AnchorEngine()
+    first = engine.locate(ANCHOR, _frame_with_anchors([(100, 200)]))
+    assert (first.left, first.top) == (100, 200)
+    assert engine._hint_region(ANCHOR) is not None
+
+    moved = engine.locate(ANCHOR, _frame_with_anchors([(500, 700)]))
+    assert (moved.left, moved.top) == (500, 700)
+
+    engine.forget(ANCHOR)
+    assert engine._hint_region(ANCHOR) is None
+    assert engine.locate(ANCHOR, _frame_with_anchors([])) is None
+
+
+def test_hint_outside_region_is_not_returned():
+    engine = AnchorEngine()
+    frame = _frame_with_anchors([(100, 200), (400, 600)])
+    engine.locate(ANCHOR, frame, region=(0, 0, 300, 400))
+
+    # 직전 위치(100, 200)는 힌트에 남아 있지만 지정 영역 밖이므로 영역 안의 앵커를 반환
+    found = engine.locate(ANCHOR, frame, region=(300, 500, 400, 400))
+    assert (found.left, found.top) == (400, 600)
+
+
+def test_low_texture_frame_caps_coarse_candidates():
+    engine = AnchorEngine({"anchor_engine": {"max_candidates": 16}})
+    rng = np.random.default_rng(3)
+    flat = rng.integers(250, 253, (900, 700, 3), dtype=np.uint8)
+    gray, small = engine._prepare_frame(flat)
+    template = engine._load_template(ANCHOR)
+
+    assert len(engine._candidates(gray, small, template, None, -1.0)) <= 16
@@ -0,0 +1,58 @@
+from client_discovery.band_seeker import ReviewBandSeeker
+
+
+def _seeker(**seek):
+    return ReviewBandSeeker({"search": {"review_min": 200, "review_max": 300, "band_seek": seek}})
+
+
+def _simulate(seeker, pages, limit=50):
+    """pages[i] = i번째 스텝 위치 화면의 리뷰 수 - (방문 위치, 처리한 위치) 반환"""
+    visited, processed = [], []
+    for _ in range(limit):
+        position = seeker.position
+        visited.append(position)
+        counts = pages[position] if 0 <= position < len(pages) else []
+        move = seeker.next_move(counts)
+        if move is None:
+            break
+        if move == 0:
+            processed.append(position)
+            seeker.moved(1)
+    return visited, processed
+
+
+def test_classify():
+    seeker = _seeker()
+    assert seeker.classify([]) == "unknown"
+    assert seeker.classify([900, 400]) == "above"
+    assert seeker.classify([320, 250, 150]) == "in_band"
+    assert seeker.classify([150, 90]) == "below"
+    assert seeker.classify([350, 150]) == "below"
+
+
+def test_gallops_over_high_counts_then_bisects_back():
+    pages = [[5000 - 400 * i] for i in range(12)] + [[250], [220], [180], [120]]
+    visited, processed = _simulate(_seeker(max_gallop_steps=8), pages)
+
+    assert processed == [12, 13]
+    assert visited[-1] == 14
+    # 0,1,3,7,15 까지 갤럽 후 이분 탐색 → 선형 스캔보다 적은 화면만 확인
+    assert visited[:5] == [0, 1, 3, 7, 15]
+    assert len(visited) < len(pages)
+
+
+def test_stops_when_first_page_already_below_band():
+    assert _seeker().next_move([150, 120, 90]) is None
+
+
+def test_stops_when_scroll_does_not_change_screen():
+    seeker = _seeker()
+    assert seeker.next_move([900, 800]) == 1
+    assert seeker.next_move([900, 800]) is None
+
+
+def test_gallop_landing_inside_band_backs_up_to_first_band_page():
+    pages = [[900], [700], [500], [280], [260], [240], [220], [150]]
+    visited, processed = _simulate(_seeker(), pages)
+
+    assert processed == [3, 4, 5, 6]
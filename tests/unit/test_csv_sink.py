@@ -0,0 +1,99 @@
+import csv
+import time
+from datetime import datetime
+
+from client_discovery.csv_sink import BufferedCsvSink
+from client_discovery.m5_storage import StorageManager
+from client_discovery.models import StoreDetail
+
+HEADERS = ["collected_at", "store_name"]
+
+
+def _rows(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_batches_rows_until_flush_size(tmp_path):
+    sink = BufferedCsvSink(tmp_path, "targets_{date}.csv", HEADERS, flush_rows=3, flush_interval=0,
+                           clock=Clock(datetime(2026, 10, 1, 12)))
+    sink.append(["t1", "a"])
+    sink.append(["t2", "b"])
+    assert not sink.path.exists() and sink.row_count == 2
+
+    sink.append(["t3", "c"])
+    assert _rows(sink.path) == [HEADERS, ["t1", "a"], ["t2", "b"], ["t3", "c"]]
+
+    sink.append(["t4", "d"])
+    sink.close()
+    assert len(_rows(sink.path)) == 5
+
+    # 다시 열면 기존 행 수에서 이어서 세고 헤더는 한 번만
+    reopened = BufferedCsvSink(tmp_path, "targets_{date}.csv", HEADERS, durability="row",
+                               clock=Clock(datetime(2026, 10, 1, 13)))
+    assert reopened.row_count == 4
+    reopened.append(["t5", "e"])
+    assert _rows(reopened.path)[-1] == ["t5", "e"] and reopened.row_count == 5
+    reopened.close()
+
+
+def test_midnight_rollover_switches_file(tmp_path):
+    clock = Clock(datetime(2026, 10, 1, 23, 59, 59))
+    sink = BufferedCsvSink(tmp_path, "targets_{date}.csv", HEADERS, flush_rows=10, flush_interval=0, clock=clock)
+    sink.append(["before", "a"])
+
+    clock.now = datetime(2026, 10, 2, 0, 0, 1)
+    sink.append(["after", "b"])
+    assert sink.row_count == 1
+    sink.close()
+
+    assert _rows(tmp_path / "targets_20261001.csv") == [HEADERS, ["before", "a"]]
+    assert _rows(tmp_path / "targets_20261002.csv") == [HEADERS, ["after", "b"]]
+
+
+def test_background_thread_flushes_on_interval(tmp_path):
+    sink = BufferedCsvSink(tmp_path, "targets.csv", HEADERS, flush_rows=100, flush_interval=0.05)
+    sink.append(["t1", "a"])
+    deadline = time.time() + 2
+    while not sink.path.exists() and time.time() < deadline:
+        time.sleep(0.02)
+    assert _rows(sink.path) == [HEADERS, ["t1", "a"]]
+    sink.close()
+
+
+def test_storage_manager_counts_and_writes_through_sink(tmp_path):
+    storage = StorageManager({"output": {"csv_file": "targets.csv", "flush_rows": 50, "flush_interval_sec": 0}})
+    storage.output_dir = tmp_path
+    assert storage.get_existing_store_count() == 0
+
+    detail = StoreDetail("알파샵", "https://smartstore.naver.com/alpha", 250, 300, datetime(2026, 10, 1, 10), "텀블러")
+    assert storage.append_csv(detail)
+    assert storage.get_existing_store_count() == 1
+    assert not (tmp_path / "targets.csv").exists()
+
+    storage.close()
+    rows = _rows(tmp_path / "targets.csv")
+    assert rows[0] == StoreDetail.csv_headers() and rows[1][1] == "알파샵"
+
+
+def test_on_flushed_runs_only_after_rows_are_written(tmp_path):
+    sink = BufferedCsvSink(tmp_path, "targets_{date}.csv", HEADERS, flush_rows=10, flush_interval=0,
+                           clock=Clock(datetime(2026, 10, 1, 12)))
+    written = []
+    sink.append(["t1", "a"], on_flushed=lambda: written.append(len(_rows(sink.path))))
+    sink.append(["t2", "b"])
+    assert written == []
+
+    sink.flush()
+    assert written == [3]
+    sink.flush()
+    assert written == [3]
+    sink.close()
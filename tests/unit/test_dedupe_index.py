@@ -0,0 +1,98 @@
+import csv
+
+from client_discovery.dedupe_index import BloomFilter, DedupeIndex, canonical_store_name, canonical_store_url, dedupe_keys
+from client_discovery.m4_filter import FilterManager
+
+
+def _write_csv(path, rows):
+    with open(path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        if f.tell() == 0:
+            writer.writerow(["collected_at", "store_name", "store_url", "review_count", "interest_count", "note"])
+        for name, url in rows:
+            writer.writerow(["2026-10-01 10:00:00", name, url, "250", "300", "텀블러"])
+
+
+def test_store_urls_are_canonicalized():
+    same = [
+        "https://smartstore.naver.com/AlphaShop",
+        "http://m.smartstore.naver.com/alphashop/products/123?NaPm=ct%3Dabc&utm_source=x",
+        "smartstore.naver.com/alphashop/",
+    ]
+    assert {canonical_store_url(url) for url in same} == {"smartstore.naver.com/alphashop"}
+    assert canonical_store_url("https://brand.naver.com/Beta?n_media=27") == "brand.naver.com/beta"
+    assert canonical_store_url("https://WWW.Example.com/shop/?b=2&utm_medium=x&a=1") == "example.com/shop?a=1&b=2"
+    assert canonical_store_name(" 알파 샵 ") == canonical_store_name("알파샵") == "알파샵"
+    assert canonical_store_url("") is None
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [f"u:store{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"u:other{i}" in bloom for i in range(5000))
+    assert false_positives < 5000 * 0.03
+
+
+def test_index_persists_and_catches_up_bloom_after_crash(tmp_path):
+    path = tmp_path / "dedupe_index.sqlite3"
+    index = DedupeIndex(path, capacity=1000)
+    index.add_many(["u:a", "n:가"])
+    index.close()
+
+    # Bloom 파일 저장 없이 종료된 실행에서 추가된 키도 다음 실행에서 반영
+    crashed = DedupeIndex(path, capacity=1000)
+    crashed.add("u:b")
+
+    reopened = DedupeIndex(path, capacity=1000)
+    assert "u:a" in reopened and "n:가" in reopened and "u:b" in reopened
+    assert "u:c" not in reopened
+    assert len(reopened) == 3
+
+
+def test_csv_import_reads_only_new_or_grown_files(tmp_path):
+    index = DedupeIndex(":memory:")
+    first = tmp_path / "targets_20261001.csv"
+    _write_csv(first, [("알파샵", "https://smartstore.naver.com/alpha")])
+    assert index.import_csv_files([first]) == 2
+    assert index.import_csv_files([first]) == 0
+
+    _write_csv(first, [("베타몰", "https://smartstore.naver.com/beta")])
+    assert index.import_csv_files([first]) == 2
+    assert "u:smartstore.naver.com/beta" in index
+
+
+def test_filter_manager_dedupes_across_dates(tmp_path, monkeypatch):
+    monkeypatch.setattr(FilterManager, "_get_output_file", lambda self: tmp_path / "targets_20261002.csv")
+    _write_csv(tmp_path / "targets_20261001.csv", [("알파샵", "https://smartstore.naver.com/alpha")])
+    config = {"output": {"csv_file": "targets_{date}.csv"}, "filters": {}}
+
+    manager = FilterManager(config)
+    assert manager.is_duplicate("https://m.smartstore.naver.com/Alpha/products/1?NaPm=x")
+    assert manager.is_duplicate(None, "알파 샵")
+    assert not manager.is_duplicate("https://smartstore.naver.com/gamma", "감마샵")
+
+    manager.add_to_processed("https://smartstore.naver.com/pending", persist=False)
+    manager.add_to_processed("https://smartstore.naver.com/gamma", "감마샵")
+    manager.close()
+
+    reopened = FilterManager(config)
+    assert reopened.is_duplicate("https://smartstore.naver.com/gamma")
+    assert not reopened.is_duplicate("https://smartstore.naver.com/pending")
+    reopened.close()
+
+
+def test_placeholder_names_are_never_persisted(tmp_path, monkeypatch):
+    monkeypatch.setattr(FilterManager, "_get_output_file", lambda self: tmp_path / "targets_20261002.csv")
+    config = {"output": {"csv_file": "targets_{date}.csv"}, "filters": {}}
+    assert dedupe_keys("https://smartstore.naver.com/alpha", "상점_3") == ("u:smartstore.naver.com/alpha", None)
+    assert dedupe_keys(None, " ... ") == (None, None)
+
+    manager = FilterManager(config)
+    manager.add_to_processed("https://smartstore.naver.com/alpha", "상점_3")
+    manager.add_to_processed(None, "상점_4")
+    assert manager.index.keys_with_prefix("n:") == []
+    assert not manager.is_duplicate("https://smartstore.naver.com/beta", "상점_3")
+    manager.close()
@@ -0,0 +1,100 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from client_discovery.dom_backend import (
+    LIST_STATE_JS,
+    MORE_CARDS_JS,
+    DomListScanner,
+    DomNavigator,
+    get_selectors,
+    is_blocked_html,
+    parse_count,
+    parse_detail_html,
+    parse_list_html,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "dom"
+BASE_URL = "https://search.shopping.naver.com/search/all?query=텀블러"
+
+
+def _read(name):
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def test_parse_count_handles_commas_and_man_unit():
+    assert parse_count("1,234") == 1234
+    assert parse_count("리뷰 1.2만") == 12000
+    assert parse_count("없음") is None
+
+
+def test_parse_list_html_reads_name_review_and_url():
+    cards = parse_list_html(_read("search_list.html"), base_url=BASE_URL)
+
+    assert [(c.store_name, c.review_count) for c in cards] == [("알파상회", 1234), ("베타리빙", 12000)]
+    assert cards[0].url == "https://smartstore.naver.com/alpha_store"
+    assert cards[1].url == "https://search.shopping.naver.com/mall/beta"
+
+
+def test_parse_detail_html_reads_store_name_and_interest():
+    detail = parse_detail_html(_read("store_detail.html"))
+    assert detail == {"store_name": "알파상회", "interest_count": 2345}
+
+
+def test_block_page_and_selector_override():
+    assert is_blocked_html(_read("blocked.html")) is True
+    assert is_blocked_html(_read("search_list.html")) is False
+
+    selectors = get_selectors({"backend": {"selectors": {"card": "li.custom"}}})
+    assert selectors["card"] == "li.custom"
+    assert selectors["block_page"] == "div.content_error"
+
+
+class FakeListPage:
+    """카드 수/스크롤 위치만 흉내 내는 목록 페이지 (스크롤하면 loads 순서대로 카드가 늘어남)"""
+
+    def __init__(self, cards, loads, max_scroll):
+        self.cards, self.loads, self.max_scroll = cards, list(loads), max_scroll
+        self.scroll_y = 0
+        self.waits = []
+        self.url = BASE_URL
+        self.mouse = SimpleNamespace(wheel=self._wheel)
+
+    def _wheel(self, dx, dy):
+        self.scroll_y = min(self.scroll_y + dy, self.max_scroll)
+        self.cards += self.loads.pop(0) if self.loads else 0
+
+    def evaluate(self, script, arg=None):
+        if script == LIST_STATE_JS:
+            return [self.cards, self.scroll_y]
+        return []
+
+    def wait_for_function(self, script, arg=None, timeout=None):
+        assert script == MORE_CARDS_JS
+        self.waits.append((arg, timeout))
+        if self.cards <= arg[1]:
+            raise TimeoutError("no more cards")
+
+
+def test_dom_scroll_waits_for_cards_and_detects_list_end():
+    config = {"search": {"review_min": 0, "review_max": 10}, "backend": {"scroll_load_timeout_ms": 500}}
+    page = FakeListPage(cards=20, loads=[20], max_scroll=400)
+    session = SimpleNamespace(list_page=page)
+    navigator, scanner = DomNavigator(config, session), DomListScanner(config, session)
+    selector = get_selectors(config)["card"]
+
+    scanner.scan_visible_cards()
+    assert navigator.scroll_steps(1)
+    assert page.waits[-1] == ([selector, 20, 0], 500)
+    scanner.expect_scroll()
+    scanner.scan_visible_cards()
+    assert not scanner.at_list_end
+
+    # 바닥에서 더 스크롤해도 카드가 늘지 않으면 대기 시간 초과 후 목록 끝
+    assert navigator.scroll_steps(1)
+    assert page.waits[-1] == ([selector, 40, 400], 500)
+    scanner.expect_scroll()
+    scanner.scan_visible_cards()
+    assert scanner.at_list_end
+
+    scanner.reset_tracking()
+    assert not scanner.at_list_end
@@ -1,6 +1,7 @@
 ﻿import pytest
 
-from client_discovery.m4_filter import FilterManager
+from client_discovery.m4_filter import FilterManager, VisibleCardMemory
+from client_discovery.models import StoreCard
 
 
 @pytest.fixture
@@ -58,3 +59,22 @@ def test_review_and_interest_range(tmp_path, monkeypatch, base_config):
     assert manager.passes_interest_range(500)
     assert not manager.passes_review_range(None)
     assert not manager.passes_interest_range(None)
+
+
+def test_visible_card_memory_skips_handled_cards_until_scroll():
+    memory = VisibleCardMemory({"layout": {"dedupe_threshold_px": 40}})
+    first = StoreCard(100, 200, 340, 420, "스토어A", 120)
+    second = StoreCard(460, 200, 340, 420, "스토어B", 80)
+
+    memory.mark(first)
+    rescanned = [StoreCard(104, 197, 340, 420, "스토어A", 120), second]
+    assert memory.pending(rescanned) == [second]
+
+    memory.mark(second)
+    assert memory.pending(rescanned) == []
+
+    memory.next_screen()
+    assert memory.is_unmoved(rescanned) is True
+    scrolled = [StoreCard(100, 200, 340, 420, "스토어C", 50)]
+    assert memory.is_unmoved(scrolled) is False
+    assert memory.pending(scrolled) == scrolled
@@ -0,0 +1,99 @@
+from PIL import Image
+
+from client_discovery import io_backend, utils
+from client_discovery.io_backend import RecordingBackend, ReplayBackend
+
+
+class FakeDesktop:
+    """화면 색이 입력마다 바뀌는 가짜 데스크톱"""
+
+    def __init__(self):
+        self.shade = 0
+        self.clipboard = ""
+
+    def screenshot(self, region=None):
+        image = Image.new("RGB", (64, 48), (self.shade, 0, 0))
+        return image.crop((region[0], region[1], region[0] + region[2], region[1] + region[3])) if region else image
+
+    def size(self):
+        return 64, 48
+
+    def active_window_title(self):
+        return f"스토어{self.shade} : 네이버 스마트스토어 - Chrome"
+
+    def click(self, x, y):
+        self.shade += 40
+
+    def hotkey(self, *keys):
+        if keys == ('ctrl', 'c'):
+            self.clipboard = f"https://smartstore.naver.com/s{self.shade}"
+
+    def press(self, key):
+        pass
+
+    def scroll(self, clicks):
+        self.shade += 10
+
+    def key_down(self, key):
+        pass
+
+    def key_up(self, key):
+        pass
+
+    def clipboard_copy(self, text):
+        self.clipboard = text
+
+    def clipboard_paste(self):
+        return self.clipboard
+
+    def close(self):
+        pass
+
+
+def _record(session_dir):
+    recorder = RecordingBackend(session_dir, inner=FakeDesktop())
+    seen = [recorder.screenshot().getpixel((0, 0)), recorder.screenshot().getpixel((0, 0))]
+    recorder.click(10, 10)
+    seen.append(recorder.screenshot(region=(8, 8, 4, 4)).getpixel((0, 0)))
+    seen.append(recorder.active_window_title())
+    recorder.hotkey('ctrl', 'c')
+    seen.append(recorder.clipboard_paste())
+    recorder.scroll(-3)
+    seen.append(recorder.screenshot().getpixel((0, 0)))
+    recorder.close()
+    return seen
+
+
+def test_replay_reproduces_recorded_session(tmp_path):
+    recorded = _record(tmp_path)
+    # 같은 프레임은 한 번만 저장
+    assert len(list((tmp_path / "frames").iterdir())) == 3
+
+    replay = ReplayBackend(tmp_path)
+    replayed = [replay.screenshot().getpixel((0, 0)), replay.screenshot().getpixel((0, 0))]
+    replay.click(10, 10)
+    replayed.append(replay.screenshot(region=(8, 8, 4, 4)).getpixel((0, 0)))
+    replayed.append(replay.active_window_title())
+    replay.hotkey('ctrl', 'c')
+    replayed.append(replay.clipboard_paste())
+    replay.scroll(-3)
+    replayed.append(replay.screenshot().getpixel((0, 0)))
+
+    assert replayed == recorded
+    assert replay.divergences == 0 and not replay.finished
+    assert replay.screenshot(region=(0, 0, 5, 7)).size == (5, 7)
+
+    replay.press('home')
+    assert replay.finished
+
+
+def test_divergent_input_is_counted_and_utils_use_backend(tmp_path, monkeypatch):
+    _record(tmp_path)
+    replay = ReplayBackend(tmp_path)
+    monkeypatch.setattr(io_backend, "_backend", replay)
+
+    assert utils.grab_screen().shape == (48, 64, 3)
+    replay.click(99, 99)
+    assert replay.divergences == 1
+    assert utils.is_browser_focused()
+    assert utils.capture_screen_region(0, 0, 10, 5).shape == (5, 10, 3)
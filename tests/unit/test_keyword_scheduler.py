@@ -0,0 +1,63 @@
+import csv
+
+from client_discovery.keyword_scheduler import KeywordScheduler, count_csv_leads, parse_run_log
+from client_discovery.models import RunStats
+
+
+def _write_run_log(path, *runs):
+    with open(path, 'a', encoding='utf-8') as f:
+        for yields in runs:
+            stats = RunStats()
+            for keyword, visited, saved, minutes in yields:
+                stats.record_keyword(keyword, visited, saved, minutes * 60)
+            f.write(stats.summary())
+
+
+def _write_csv(path, keywords):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["collected_at", "store_name", "store_url", "review_count", "interest_count", "note"])
+        for i, keyword in enumerate(keywords):
+            writer.writerow(["2026-10-01 10:00:00", f"스토어{i}", "", "250", "300", keyword])
+
+
+def _scheduler(tmp_path, **scheduler_cfg):
+    config = {"scheduler": scheduler_cfg, "output": {"csv_file": "targets_{date}.csv", "log_file": "run.log"}}
+    return KeywordScheduler(config, tmp_path)
+
+
+def test_run_log_round_trips_through_summary(tmp_path):
+    _write_run_log(tmp_path / "run.log", [("텀블러", 40, 4, 10.0)], [("텀블러", 10, 1, 2.5), ("머그컵", 20, 0, 5.0)])
+    history = parse_run_log(tmp_path / "run.log")
+    assert (history["텀블러"].visited, history["텀블러"].saved, history["텀블러"].minutes) == (50, 5, 12.5)
+    assert history["머그컵"].lead_rate == 0.0
+
+
+def test_without_history_keeps_config_order_and_budget(tmp_path):
+    plan = _scheduler(tmp_path).plan(["a", "b", "c"], max_overall=100, max_per_keyword=30)
+    assert plan == [("a", 30), ("b", 30), ("c", 30)]
+
+
+def test_productive_keywords_first_with_larger_budget(tmp_path):
+    _write_run_log(tmp_path / "run.log", [("텀블러", 100, 20, 20.0), ("머그컵", 100, 2, 20.0), ("보틀", 100, 10, 40.0)])
+    plan = _scheduler(tmp_path, exploration=0.1).plan(["머그컵", "보틀", "텀블러"], max_overall=120, max_per_keyword=60)
+
+    assert [keyword for keyword, _ in plan] == ["텀블러", "보틀", "머그컵"]
+    budgets = dict(plan)
+    assert sum(budgets.values()) == 120
+    assert budgets["텀블러"] > budgets["보틀"] > budgets["머그컵"] >= 10
+    assert budgets["텀블러"] <= 120
+
+
+def test_unlogged_keyword_gets_exploration_and_csv_estimate(tmp_path):
+    _write_run_log(tmp_path / "run.log", [("텀블러", 100, 10, 20.0)])
+    _write_csv(tmp_path / "targets_20261001.csv", ["텀블러"] * 3 + ["보온병"] * 6)
+    assert count_csv_leads(tmp_path) == {"텀블러": 3, "보온병": 6}
+
+    scheduler = _scheduler(tmp_path)
+    history = scheduler.load_history()
+    # CSV만 있는 키워드는 전체 저장률(10%)로 방문 수 추정
+    assert (history["보온병"].visited, history["보온병"].saved) == (60, 6)
+
+    plan = dict(scheduler.plan(["텀블러", "새키워드"], max_overall=40, max_per_keyword=0))
+    assert plan["새키워드"] >= 10 and sum(plan.values()) == 40
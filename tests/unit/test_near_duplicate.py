@@ -0,0 +1,123 @@
+import random
+from types import SimpleNamespace
+
+from client_discovery.dedupe_index import DedupeIndex
+from client_discovery.m4_filter import FilterManager
+from client_discovery.main_crawler import NaverShoppingCrawler
+from client_discovery.models import RunStats, StoreCard
+from client_discovery.near_duplicate import NearDuplicateIndex, jamo_key, similarity
+
+
+def test_jamo_key_folds_spacing_and_ocr_confusions():
+    assert jamo_key("오렌지 하우스") == jamo_key("0렌지하우스".replace("0", "오")) == "oㅗㄹㅔㄴㅈlㅎㅏoㅜㅅㅡ"
+    assert jamo_key("Shop1") == jamo_key("shopl")
+    assert jamo_key(" ") == ""
+    assert similarity("abcd", "abed") == 0.75
+
+
+def test_finds_ocr_variants_but_not_different_stores():
+    index = NearDuplicateIndex(threshold=0.9)
+    index.add_many(["알파리빙 공식스토어", "오렌지하우스 주방용품", "감성캠핑마켓"])
+
+    assert index.find("알파리빙공식스토어") == ("알파리빙 공식스토어", 1.0)
+    assert index.find("0렌지하우스 주방용품")[0] == "오렌지하우스 주방용품"
+    assert index.find("알파리빙 공식스토0어")[0] == "알파리빙 공식스토어"
+    assert "감성캠핑마켓!" in index
+
+    assert index.find("감마리빙 공식스토어") is None
+    assert index.find("알파리빙 공식몰") is None
+    assert "감성캠핑" not in index
+
+
+def test_distinct_consonants_and_short_names_are_not_merged():
+    assert jamo_key("마켓") != jamo_key("아켓")
+    index = NearDuplicateIndex(threshold=0.9)
+    index.add_many(["마켓", "다온스토어", "한빛상사"])
+    assert index.find("아켓") is None
+    assert index.find("다은스토어") is None
+    assert index.find("한빗상사") is None
+    assert index.find("다온스토어!") is None
+    # 짧은 이름은 정규화 후 정확히 같을 때만 중복
+    assert index.find("다온 스토어") == ("다온스토어", 1.0)
+
+
+def test_lsh_recalls_variants_among_many_names():
+    rng = random.Random(5)
+    syllables = "가나다라마바사자차카타파하몰샵리빙마켓스토어"
+    names = sorted({"".join(rng.choice(syllables) for _ in range(rng.randint(8, 12))) for _ in range(3000)})
+    index = NearDuplicateIndex(threshold=0.9)
+    index.add_many(names)
+
+    hits = 0
+    for name in rng.sample(names, 200):
+        # OCR이 끼워 넣은 잡음 문자 하나
+        position = rng.randrange(1, len(name))
+        variant = name[:position] + "." + name[position:]
+        hits += index.find(variant) == (name, similarity(jamo_key(name), jamo_key(variant)))
+    assert hits >= 195
+
+
+def test_stored_band_keys_are_synced_incrementally(tmp_path, monkeypatch):
+    store = DedupeIndex(tmp_path / "index.sqlite3")
+    store.add_many(["n:알파리빙공식스토어", "n:다온스토어", "n:상점_3", "u:smartstore.naver.com/alpha"])
+    first = NearDuplicateIndex(threshold=0.9, store=store)
+    assert first.synced == 3 and len(first) == 0
+
+    # 다시 열 때는 밴드 키가 없는 새 이름만 계산하고, 후보는 SQLite 버킷에서 조회
+    store.add("n:오렌지하우스주방용품")
+    signed = []
+    monkeypatch.setattr(NearDuplicateIndex, "_name_band_keys",
+                        lambda self, name: signed.append(name) or self._band_keys(jamo_key(name)))
+    reopened = NearDuplicateIndex(threshold=0.9, store=store)
+    assert signed == ["오렌지하우스주방용품"]
+    assert reopened.find("알파리빙 공식스토0어") == ("알파리빙공식스토어", similarity(
+        jamo_key("알파리빙공식스토어"), jamo_key("알파리빙 공식스토0어")))
+    assert reopened.find("다온 스토어") == ("다온스토어", 1.0)
+    assert reopened.find("다은스토어") is None and reopened.find("상점_3") is None
+
+    # MinHash 설정이 바뀌면 밴드 키를 전부 다시 계산
+    signed.clear()
+    assert NearDuplicateIndex(threshold=0.9, num_perm=32, bands=8, store=store).synced == 4
+    assert len(signed) == 4
+    store.close()
+
+
+def test_filter_manager_rejects_near_duplicate_names(tmp_path, monkeypatch):
+    monkeypatch.setattr(FilterManager, "_get_output_file", lambda self: tmp_path / "targets.csv")
+    config = {"output": {"csv_file": "targets_{date}.csv"}, "filters": {}}
+
+    manager = FilterManager(config)
+    manager.add_to_processed("https://smartstore.naver.com/alpha", "알파리빙 공식스토어")
+    assert manager.is_duplicate(None, "알파리빙 공식스토0어")
+    manager.close()
+
+    # 다음 실행에서도 색인의 스토어명으로 다시 구성
+    reopened = FilterManager(config)
+    assert reopened.is_duplicate(None, "알파리빙공식 스토어")
+    assert not reopened.is_duplicate(None, "베타리빙 공식스토어")
+    reopened.close()
+
+    config["dedupe"] = {"name_similarity": 0}
+    exact_only = FilterManager(config)
+    assert exact_only.near_names is None
+    assert not exact_only.is_duplicate(None, "알파리빙 공식스토0어")
+    exact_only.close()
+
+
+def test_list_stage_skips_dedupe_for_placeholder_names(tmp_path, monkeypatch):
+    monkeypatch.setattr(FilterManager, "_get_output_file", lambda self: tmp_path / "targets.csv")
+    config = {"output": {"csv_file": "targets_{date}.csv"}, "filters": {}, "blocklist": [],
+              "search": {"review_min": 0, "review_max": 1000}}
+    crawler = object.__new__(NaverShoppingCrawler)
+    crawler.filter = FilterManager(config)
+    crawler.stats = RunStats()
+    crawler.storage = SimpleNamespace(record_skip=lambda *args: None)
+    crawler.current_keyword = "텀블러"
+    crawler.filter.add_to_processed("https://smartstore.naver.com/alpha", "알파리빙 공식스토어")
+    # 예전 실행에서 잘못 저장된 임시 이름 키가 남아 있어도 목록 단계에서는 보지 않음
+    crawler.filter.index.add("n:상점_3")
+
+    assert not crawler._passes_list_filters(StoreCard(0, 0, 10, 10, "알파리빙 공식스토0어", 250))
+    assert crawler._passes_list_filters(StoreCard(0, 0, 10, 10, "상점_3", 250))
+    assert crawler.stats.skipped_duplicate == 1
+    crawler.filter.close()
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from client_discovery.m4_filter import FilterManager
+from client_discovery.models import RunStats
+from client_discovery.network_capture import (
+    CaptureProcessor,
+    iter_har_payloads,
+    iter_recorded_payloads,
+    parse_search_payload,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "capture"
+CONFIG = {
+    "search": {"review_min": 200, "review_max": 300, "follower_min": 50, "follower_max": 1500},
+    "output": {"csv_file": "targets.csv"},
+    "blocklist": ["쿠팡"],
+    "filters": {},
+}
+
+
+def test_har_replay_keeps_only_search_api_json():
+    payloads = list(iter_har_payloads(FIXTURES / "search_page2.har"))
+    assert len(payloads) == 1
+    stores = parse_search_payload(payloads[0], keyword="텀블러")
+    assert [s.card.store_name for s in stores] == ["제타몰", "에타스토어 외 2곳", "세타공방"]
+    assert stores[2].detail.interest_count == 12000
+    assert stores[0].detail.note == "텀블러"
+
+
+def test_processor_applies_filters_without_rendering(tmp_path, monkeypatch):
+    monkeypatch.setattr(FilterManager, "_get_output_file", lambda self: tmp_path / "targets.csv")
+    stats = RunStats()
+    processor = CaptureProcessor(CONFIG, FilterManager(CONFIG), stats)
+
+    result = processor.process(iter_recorded_payloads(FIXTURES), keyword="텀블러")
+
+    assert result.parsed == 10
+    assert [(d.store_name, d.interest_count) for d in result.details] == [("베타리빙", 800), ("제타몰", 400)]
+    assert [c.store_name for c in result.pending_cards] == ["감마샵"]
+    assert result.details[0].store_url == "https://smartstore.naver.com/store2"
+    assert (stats.skipped_review_range, stats.skipped_blocklist, stats.skipped_multi_store) == (2, 1, 1)
+    assert (stats.skipped_duplicate, stats.skipped_interest_range) == (1, 2)
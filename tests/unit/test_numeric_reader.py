@@ -0,0 +1,54 @@
+import cv2
+import numpy as np
+
+from client_discovery.numeric_reader import NumericReader, parse_digits
+from ocr.service import OcrWord
+
+
+class _DigitsOnlyOcr:
+    available = True
+
+    def __init__(self, words):
+        self.words = words
+        self.calls = []
+
+    def image_to_words(self, image, lang, psm, oem=None, variables=None):
+        self.calls.append((lang, psm, variables))
+        return self.words
+
+
+def _roi_with_anchor():
+    template = cv2.imread("assets/img/label_review.png")
+    roi = np.full((80, 300, 3), 255, np.uint8)
+    roi[20:20 + template.shape[0], 20:20 + template.shape[1]] = template
+    return roi, template.shape
+
+
+def test_parse_digits_takes_first_number_and_min_confidence():
+    words = [OcrWord("1,2", 95.0, 0, 0, 10, 10), OcrWord("34", 71.0, 12, 0, 10, 10)]
+    assert parse_digits(words) == (1234, 71.0)
+    assert parse_digits([OcrWord(",", 90.0, 0, 0, 5, 5)]) is None
+
+    # 간격이 벌어진 이웃 숫자는 이어 붙이지 않음
+    apart = [OcrWord("5,678", 60.0, 60, 0, 40, 12), OcrWord("1,234", 90.0, 0, 0, 40, 12)]
+    assert parse_digits(apart) == (1234, 90.0)
+
+
+def test_read_after_anchor_uses_digit_whitelist():
+    roi, (height, width, _) = _roi_with_anchor()
+    ocr = _DigitsOnlyOcr([OcrWord("1,234", 88.0, 0, 0, 40, 12)])
+    reader = NumericReader({"layout": {"anchor_confidence": 0.75}}, ocr)
+
+    assert reader.find_anchor(roi, "label_review") == (20, 20, width, height)
+    assert reader.read_after_anchor(roi, "label_review") == 1234
+    lang, psm, variables = ocr.calls[0]
+    assert (lang, psm) == ("eng", 7)
+    assert variables["tessedit_char_whitelist"] == "0123456789,"
+
+
+def test_low_confidence_falls_back():
+    roi, _ = _roi_with_anchor()
+    ocr = _DigitsOnlyOcr([OcrWord("1234", 30.0, 0, 0, 40, 12)])
+    reader = NumericReader({"ocr": {"numeric_min_confidence": 60}}, ocr)
+
+    assert reader.read_after_anchor(roi, "label_review") is None
@@ -0,0 +1,68 @@
+import cv2
+import numpy as np
+from PIL import Image
+
+from client_discovery import ocr_cache
+from client_discovery.models import RunStats
+from client_discovery.ocr_cache import OcrResultCache, roi_hash
+
+
+def _label(text):
+    image = np.full((40, 220, 3), 255, np.uint8)
+    cv2.putText(image, text, (5, 28), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
+    return image
+
+
+def _config(tmp_path, **extra):
+    return {"ocr": {"cache_path": str(tmp_path / "ocr_cache.json"), **extra}}
+
+
+def test_hash_is_format_independent_and_content_sensitive():
+    bgr = _label("review 1,234")
+    pil = Image.fromarray(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB))
+    assert roi_hash(bgr) == roi_hash(pil)
+    assert roi_hash(bgr) != roi_hash(_label("review 1,235"))
+    assert roi_hash(None) is None
+
+
+def test_hits_misses_and_persistence(tmp_path):
+    stats = RunStats()
+    cache = OcrResultCache(_config(tmp_path), stats)
+    calls = []
+
+    def read():
+        calls.append(1)
+        return 1234
+
+    assert cache.get_or_compute("list_review", _label("review 1,234"), read) == 1234
+    assert cache.get_or_compute("list_review", _label("review 1,234"), read) == 1234
+    # 종류가 다르면 다른 키
+    assert cache.get("detail_interest", _label("review 1,234")) is None
+    assert len(calls) == 1
+    assert (stats.ocr_cache_hits, stats.ocr_cache_misses) == (1, 2)
+    assert "적중률 33.3%" in stats.ocr_cache_summary()
+
+    cache.save()
+    reloaded = OcrResultCache(_config(tmp_path))
+    assert reloaded.get("list_review", _label("review 1,234")) == 1234
+
+
+def test_lru_eviction_and_failed_reads_not_cached(tmp_path):
+    cache = OcrResultCache(_config(tmp_path, cache_max_entries=2))
+    cache.store("list_name", _label("alpha"), "alpha")
+    cache.store("list_name", _label("beta"), "beta")
+    assert cache.get("list_name", _label("alpha")) == "alpha"
+    cache.store("list_name", _label("gamma"), "gamma")
+
+    assert cache.get("list_name", _label("beta")) is None
+    assert cache.get("list_name", _label("alpha")) == "alpha"
+    assert cache.get_or_compute("list_name", _label("delta"), lambda: None) is None
+    assert len(cache) == 2
+
+
+def test_default_cache_is_disabled(monkeypatch):
+    monkeypatch.setattr(ocr_cache, "_default_cache", None)
+    cache = ocr_cache.get_ocr_cache()
+    assert not cache.enabled
+    assert cache.get_or_compute("list_name", _label("alpha"), lambda: "alpha") == "alpha"
+    assert len(cache) == 0
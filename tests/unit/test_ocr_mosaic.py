@@ -0,0 +1,42 @@
+import numpy as np
+
+from ocr.mosaic import build_mosaic, split_results, words_to_text
+from ocr.service import OcrWord
+
+
+def test_build_mosaic_places_tiles_with_gaps():
+    tiles = [np.zeros((20, 50, 3), np.uint8), None, np.zeros((30, 40), np.uint8)]
+    mosaic, boxes = build_mosaic(tiles, gap=10, margin=5)
+
+    assert boxes[1] is None
+    assert boxes[0] == (5, 5, 50, 20)
+    assert boxes[2] == (5, 35, 40, 30)
+    assert mosaic.shape == (5 + 20 + 10 + 30 + 5, 60)
+    assert mosaic[5:25, 5:55].max() == 0
+    assert mosaic[25:35].min() == 255
+
+
+def test_split_results_maps_words_back_to_tiles():
+    tiles = [np.zeros((20, 80), np.uint8), np.zeros((20, 80), np.uint8)]
+    _, boxes = build_mosaic(tiles, gap=10, margin=5)
+    words = [
+        OcrWord("리뷰", 90.0, 10, 40, 20, 12),
+        OcrWord("1,234", 70.0, 35, 41, 30, 12),
+        OcrWord("스토어", 80.0, 8, 8, 30, 12),
+    ]
+
+    results = split_results(words, boxes)
+
+    assert results[0].text == "스토어"
+    assert results[1].text == "리뷰 1,234"
+    assert results[1].confidence == 80.0
+    assert results[1].words[0].top == 40 - boxes[1][1]
+
+
+def test_words_to_text_groups_lines():
+    words = [
+        OcrWord("b", 90, 30, 0, 10, 10),
+        OcrWord("a", 90, 0, 1, 10, 10),
+        OcrWord("c", 90, 0, 20, 10, 10),
+    ]
+    assert words_to_text(words) == "a b\nc"
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+from client_discovery import io_backend, ocr_cache, ocr_pipeline
+from client_discovery.m3_detail_reader import DetailReader, InterestReading
+from client_discovery.ocr_pipeline import DeferredFuture, DetailOcrJob, OcrPipeline, completed
+from tests.unit.test_io_backend import FakeDesktop
+
+
+def test_deferred_future_runs_on_first_result_and_honours_cancel():
+    calls = []
+    future = DeferredFuture(lambda value: calls.append(value) or value * 2, 21)
+    assert calls == [] and not future.done()
+    assert future.result() == 42
+    assert future.result() == 42
+    assert calls == [21]
+
+    cancelled = DeferredFuture(calls.append, 1)
+    assert cancelled.cancel()
+    assert calls == [21]
+
+
+def test_inline_pipeline_uses_local_callable():
+    pipeline = OcrPipeline({"pipeline": {"ocr_workers": 0}})
+    future = pipeline.submit(sum, [1, 2], local=lambda values: "local")
+    assert not pipeline.parallel
+    assert future.result() == "local"
+
+
+def test_process_pool_runs_jobs_in_workers():
+    pipeline = OcrPipeline({"pipeline": {"ocr_workers": 2}})
+    try:
+        futures = [pipeline.submit(sum, [i, i]) for i in range(4)]
+        assert [future.result(timeout=60) for future in futures] == [0, 2, 4, 6]
+    finally:
+        pipeline.close()
+
+
+def test_detail_job_reports_each_result_once_and_survives_errors():
+    seen = []
+
+    def broken():
+        raise RuntimeError("ocr crashed")
+
+    job = DetailOcrJob(completed("스토어"), DeferredFuture(broken), on_result=lambda kind, value: seen.append((kind, value)) or value)
+    assert job.store_name() == "스토어"
+    assert job.store_name() == "스토어"
+    assert job.interest_count() is None
+    assert seen == [("store_name", "스토어"), ("interest_count", None)]
+
+
+def test_detail_reader_captures_before_leaving_and_recognizes_later(monkeypatch):
+    desktop = FakeDesktop()
+    monkeypatch.setattr(io_backend, "_backend", desktop)
+    monkeypatch.setattr(ocr_cache, "_default_cache", None)
+    monkeypatch.setattr(ocr_pipeline, "_default_pipeline", None)
+
+    config = {"layout": {"detail_name_region": {"x": 0, "y": 0, "width": 32, "height": 10}}}
+    reader = DetailReader(config)
+    reader.ocr = SimpleNamespace(available=True)
+    recognized = []
+    reader.recognizer.store_name = lambda image: recognized.append("name") or f"shade{image[0, 0, 2]}"
+    reader.recognizer.interest_reading = lambda capture: recognized.append("interest") or InterestReading(1)
+
+    job = reader.submit_detail_ocr()
+    desktop.click(10, 10)  # 목록으로 이동해 화면이 바뀌어도 캡처한 영역으로 인식
+    assert recognized == []
+    assert job.store_name() == "shade0"
+
+    # 중복 스토어면 관심고객 인식은 실행하지 않음
+    job.cancel()
+    assert recognized == ["name"]
@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from ocr import service
+from ocr.service import OcrService, get_ocr_service
+
+
+def test_changed_tesseract_cmd_rebuilds_process_service(monkeypatch):
+    monkeypatch.setattr(service, "_service", None)
+    monkeypatch.setattr(OcrService, "_detect_backend", lambda self: "pytesseract")
+
+    first = get_ocr_service("/opt/a/tesseract")
+    assert get_ocr_service() is first and get_ocr_service("/opt/a/tesseract") is first
+
+    second = get_ocr_service("/opt/b/tesseract")
+    assert second is not first and second.tesseract_cmd == "/opt/b/tesseract"
+
+    # C API 엔진은 실행 파일 경로를 쓰지 않으므로 그대로 재사용
+    second.backend = "tesserocr"
+    assert get_ocr_service("/opt/c/tesseract") is second
+    second.close()
+
+
+def test_backend_prefers_resident_libtesseract_over_pytesseract(monkeypatch):
+    monkeypatch.setattr(service, "_load_capi", lambda cmd: object())
+    assert OcrService(tesseract_cmd="/opt/a/tesseract").backend in ("tesserocr", "capi")
+
+    monkeypatch.setattr(service, "_load_capi", lambda cmd: None)
+    assert OcrService(tesseract_cmd="/opt/a/tesseract").backend in ("tesserocr", "pytesseract")
+
+
+def test_engines_are_created_outside_the_service_lock(monkeypatch):
+    monkeypatch.setattr(OcrService, "_detect_backend", lambda self: "pytesseract")
+    ocr = OcrService(tesseract_cmd="/opt/a/tesseract", pool_size=1)
+    created = []
+
+    class Engine:
+        def recognize(self, image):
+            return "ok"
+
+        def close(self):
+            pass
+
+    def create(key):
+        assert not ocr._lock.locked()
+        created.append(key)
+        return Engine()
+
+    ocr._create_engine = create
+    image = np.zeros((4, 4), np.uint8)
+    assert ocr.image_to_string(image) == "ok" and ocr.image_to_string(image) == "ok"
+    assert len(created) == 1
+    ocr.close()
+
+
+class _FakeCapi:
+    """TessBaseAPI 호출을 흉내 내는 C API (단어 두 개)"""
+
+    def __init__(self):
+        self.words = [("알파", 91.0, (0, 0, 20, 10)), ("123", 80.0, (30, 0, 50, 10))]
+        self.position = 0
+        self.deleted = []
+        self.lib = SimpleNamespace(
+            TessBaseAPICreate=lambda: 1,
+            TessBaseAPIInit2=lambda api, datapath, lang, oem: 0,
+            TessBaseAPISetPageSegMode=lambda api, psm: None,
+            TessBaseAPISetVariable=lambda api, name, value: 1,
+            TessBaseAPISetImage=lambda api, data, width, height, bpp, bpl: None,
+            TessBaseAPIRecognize=lambda api, monitor: 0,
+            TessBaseAPIGetUTF8Text=lambda api: "알파 123\n",
+            TessBaseAPIGetIterator=lambda api: 2,
+            TessResultIteratorGetPageIterator=lambda it: 3,
+            TessResultIteratorGetUTF8Text=lambda it, level: self.words[self.position][0],
+            TessResultIteratorConfidence=lambda it, level: self.words[self.position][1],
+            TessPageIteratorBoundingBox=self._box,
+            TessResultIteratorNext=self._next,
+            TessResultIteratorDelete=lambda it: self.deleted.append(it),
+            TessBaseAPIEnd=lambda api: None,
+            TessBaseAPIDelete=lambda api: self.deleted.append(api),
+        )
+
+    def take_text(self, pointer):
+        return pointer or ""
+
+    def _box(self, page, level, *refs):
+        for ref, value in zip(refs, self.words[self.position][2]):
+            ref._obj.value = value
+        return 1
+
+    def _next(self, it, level):
+        self.position += 1
+        return self.position < len(self.words)
+
+
+def test_capi_engine_reads_text_and_words():
+    capi = _FakeCapi()
+    engine = service._CapiEngine(service.EngineKey("kor", psm=7), capi)
+    image = service._to_pil(np.zeros((10, 60, 3), np.uint8))
+
+    assert engine.recognize(image) == "알파 123\n"
+    words = engine.recognize_words(image)
+    assert [(w.text, w.confidence, w.left, w.width) for w in words] == [("알파", 91.0, 0, 20), ("123", 80.0, 30, 20)]
+    engine.close()
+    assert capi.deleted == [2, 1]
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from client_discovery import parallel_crawler
+from client_discovery.dom_backend import LIST_STATE_JS
+from client_discovery.m4_filter import FilterManager
+from client_discovery.models import StoreCard, StoreDetail
+from client_discovery.parallel_crawler import ParallelKeywordCrawler, RateLimiter
+
+
+async def test_rate_limiter_spaces_requests_across_workers():
+    limiter = RateLimiter(requests_per_sec=50)
+    stamps = []
+
+    async def worker():
+        for _ in range(3):
+            await limiter.wait()
+            stamps.append(time.monotonic())
+
+    await asyncio.gather(worker(), worker())
+    stamps.sort()
+    assert stamps[-1] - stamps[0] >= 5 * 0.02 * 0.9
+
+
+async def test_claim_is_exclusive_between_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr(FilterManager, "_get_output_file", lambda self: tmp_path / "targets.csv")
+    config = {"search": {"review_min": 0, "review_max": 1000}, "blocklist": ["쿠팡"],
+              "output": {"csv_file": "targets.csv", "log_file": "run.log"}}
+    crawler = ParallelKeywordCrawler(config, FilterManager(config), storage=object())
+    crawler._filter_lock = asyncio.Lock()
+
+    card = StoreCard(0, 0, 0, 0, "감마샵", 220, url="http://127.0.0.1/store_gamma.html")
+    claims = await asyncio.gather(*(crawler._claim(card) for _ in range(3)))
+
+    assert claims.count(True) == 1
+    assert crawler.stats.skipped_duplicate == 2
+    assert await crawler._claim(StoreCard(0, 0, 0, 0, "쿠팡", 220, url="http://x/c")) is False
+
+
+class LazyListPage:
+    """스크롤 직후가 아니라 잠시 뒤에 카드가 늘어나는 목록 페이지"""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.cards = self.batches.pop(0)
+        self.url = "https://search.shopping.naver.com/search/all?query=x"
+        self.mouse = SimpleNamespace(wheel=self._wheel)
+
+    async def _wheel(self, dx, dy):
+        pass
+
+    async def goto(self, url, wait_until=None):
+        pass
+
+    async def wait_for_selector(self, selector):
+        pass
+
+    async def content(self):
+        return self.cards
+
+    async def evaluate(self, script, arg=None):
+        assert script == LIST_STATE_JS
+        return [self.cards, 0]
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        await asyncio.sleep(0)
+        if not self.batches:
+            raise TimeoutError("no more cards")
+        self.cards += self.batches.pop(0)
+
+
+async def test_crawl_keyword_waits_for_lazy_cards_before_ending(monkeypatch):
+    config = {"search": {"review_min": 0, "review_max": 1000},
+              "output": {"csv_file": "targets.csv", "log_file": "run.log"}}
+    crawler = ParallelKeywordCrawler(config, filter_manager=object(), storage=object())
+    crawler._limiter = RateLimiter(0)
+    monkeypatch.setattr(parallel_crawler, "parse_list_html", lambda count, selectors, url: [
+        StoreCard(0, 0, 0, 0, f"샵{i}", 200, url=f"http://x/{i}") for i in range(count)])
+    processed = []
+
+    async def process(card, keyword, detail_page):
+        processed.append(card.store_name)
+        return True
+
+    crawler._process_card = process
+    await crawler._crawl_keyword("텀블러", LazyListPage([3, 2, 4]), detail_page=None)
+    assert processed == [f"샵{i}" for i in range(9)]
+
+
+async def test_crawl_keyword_records_keyword_yield(monkeypatch):
+    config = {"search": {"review_min": 0, "review_max": 1000},
+              "output": {"csv_file": "targets.csv", "log_file": "run.log"}}
+    crawler = ParallelKeywordCrawler(config, filter_manager=object(), storage=object())
+    crawler._limiter = RateLimiter(0)
+    monkeypatch.setattr(parallel_crawler, "parse_list_html", lambda count, selectors, url: [
+        StoreCard(0, 0, 0, 0, f"샵{i}", 200, url=f"http://x/{i}") for i in range(count)])
+
+    async def process(card, keyword, detail_page):
+        if card.store_name in ("샵0", "샵2"):
+            crawler.saved_details.append(StoreDetail(card.store_name, card.url, 200, 40, datetime.now(), keyword))
+        # 같은 시각 다른 워커가 저장한 건은 이 키워드 성과에 섞이지 않아야 한다
+        crawler.saved_details.append(StoreDetail("다른샵", "http://y", 200, 40, datetime.now(), "머그컵"))
+        return True
+
+    crawler._process_card = process
+    await crawler._crawl_keyword("텀블러", LazyListPage([3]), detail_page=None)
+    visited, saved, seconds = crawler.stats.keyword_yields["텀블러"]
+    assert (visited, saved) == (3, 2) and seconds >= 0
@@ -0,0 +1,57 @@
+import numpy as np
+
+from client_discovery import readiness
+from client_discovery.models import RunStats
+from client_discovery.readiness import ReadinessWaiter
+
+FAST = {"timing": {"readiness": {"politeness_min": 0, "politeness_max": 0, "poll_interval": 0.01}}}
+
+
+def _frames(values):
+    frames = iter(values)
+    last = [None]
+
+    def grab():
+        last[0] = next(frames, last[0])
+        return np.full((90, 160, 3), last[0], np.uint8)
+
+    return grab
+
+
+def test_returns_once_frames_stop_changing(monkeypatch):
+    monkeypatch.setattr(readiness, "grab_screen", _frames([0, 80, 160, 200, 200, 200]))
+    stats = RunStats(total_visited=1)
+
+    elapsed = ReadinessWaiter(FAST, stats).wait(2.0, label="detail_open", min_sec=1.2)
+
+    assert elapsed < 0.5
+    assert len(stats.timings["wait_detail_open"]) == 1
+    assert stats.wait_saved_seconds > 1.0
+    assert "wait_detail_open: <0.25s 1" in stats.wait_histogram()
+
+
+def test_changing_screen_waits_until_max(monkeypatch):
+    monkeypatch.setattr(readiness, "grab_screen", _frames(list(range(0, 250, 5))))
+    elapsed = ReadinessWaiter(FAST).wait(0.2, label="scroll")
+    assert 0.2 <= elapsed < 0.4
+
+
+def test_stable_pre_action_screen_is_not_ready(monkeypatch):
+    # 클릭 직후 몇 프레임은 이전 페이지 그대로 → 바뀐 뒤 안정된 화면에서만 반환
+    monkeypatch.setattr(readiness, "grab_screen", _frames([40, 40, 40, 40, 40, 40, 200, 200, 200]))
+    waiter = ReadinessWaiter(FAST)
+    before = waiter.snapshot()
+    seen = []
+    grab = readiness.grab_screen
+    monkeypatch.setattr(readiness, "grab_screen", lambda: seen.append(1) or grab())
+
+    waiter.wait(2.0, label="detail_open", before=before)
+    assert len(seen) >= 8
+
+
+def test_unchanged_screen_after_action_waits_until_max(monkeypatch):
+    monkeypatch.setattr(readiness, "grab_screen", _frames([40]))
+    waiter = ReadinessWaiter(FAST)
+    before = waiter.snapshot()
+    elapsed = waiter.wait(0.2, label="back_to_list", before=before)
+    assert 0.2 <= elapsed < 0.4
@@ -0,0 +1,93 @@
+import csv
+from datetime import datetime
+
+from client_discovery.keyword_scheduler import KeywordScheduler
+from client_discovery.m5_storage import StorageManager
+from client_discovery.models import Checkpoint, RunStats, StoreDetail
+from client_discovery.result_store import ResultStore
+
+
+def _detail(name, url, keyword="텀블러", when=datetime(2026, 10, 1, 10)):
+    return StoreDetail(name, url, 250, 300, when, keyword)
+
+
+def _storage(tmp_path, **storage_cfg):
+    config = {
+        "output": {"csv_file": "targets_{date}.csv", "log_file": "run.log", "flush_interval_sec": 0},
+        "storage": {"backend": "sqlite", **storage_cfg},
+    }
+    storage = StorageManager(config)
+    storage.output_dir = tmp_path
+    return storage
+
+
+def test_stores_are_unique_by_canonical_url_and_exportable(tmp_path):
+    store = ResultStore(tmp_path / "discovery.sqlite3")
+    assert store.add_store(_detail("알파샵", "https://smartstore.naver.com/alpha"))
+    assert not store.add_store(_detail("알파샵", "https://m.smartstore.naver.com/Alpha/products/1"))
+    assert store.add_store(_detail("베타몰", "", when=datetime(2026, 10, 2, 9)))
+    assert store.add_store(_detail("감마샵", ""))
+
+    assert store.has_store("smartstore.naver.com/alpha") and store.has_store(None, "베타 몰")
+    assert not store.has_store("https://smartstore.naver.com/delta", "델타")
+    assert store.count_stores(datetime(2026, 10, 1)) == 2
+
+    assert store.export_csv(tmp_path / "out.csv", datetime(2026, 10, 1)) == 2
+    with open(tmp_path / "out.csv", 'r', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == StoreDetail.csv_headers()
+    assert [row[1] for row in rows[1:]] == ["알파샵", "감마샵"]
+    store.close()
+
+
+def test_checkpoint_and_run_records(tmp_path):
+    store = ResultStore(tmp_path / "discovery.sqlite3")
+    assert store.load_checkpoint() is None
+    store.save_checkpoint(Checkpoint(3, "https://a", {"https://a"}, 42, 7))
+    loaded = store.load_checkpoint()
+    assert (loaded.last_scroll_position, loaded.visited_count, loaded.saved_count) == (3, 42, 7)
+    assert loaded.processed_urls == set()
+
+    run_id = store.start_run()
+    store.record_visit(run_id, "텀블러", "알파샵", "https://a")
+    store.record_skip(run_id, "텀블러", "쿠팡", "blocklist")
+    store.record_skip(run_id, "텀블러", "베타", "blocklist")
+    store.record_skip(run_id, "머그컵", "감마", "review_range")
+    assert store.skip_counts(run_id) == {"blocklist": 2, "review_range": 1}
+
+    stats = RunStats()
+    stats.record_keyword("텀블러", 40, 4, 600)
+    store.finish_run(run_id, stats, "정상 완료")
+    stats = RunStats()
+    stats.record_keyword("텀블러", 10, 1, 120)
+    store.finish_run(None, stats, "정상 완료")
+    assert store.keyword_yields() == {"텀블러": (50, 5, 720.0)}
+    store.close()
+
+
+def test_storage_manager_sqlite_backend(tmp_path):
+    # 기존 checkpoint.json과 run.log를 새 DB로 이어받음
+    Checkpoint(0, "", set(), 12, 3).save(str(tmp_path / "checkpoint.json"))
+    stats = RunStats()
+    stats.record_keyword("머그컵", 30, 3, 300)
+    (tmp_path / "run.log").write_text(stats.summary(), encoding="utf-8")
+
+    storage = _storage(tmp_path)
+    checkpoint = storage.load_checkpoint()
+    assert checkpoint.visited_count == 12
+    assert storage.checkpoint_interval == 1
+
+    storage.start_run()
+    assert storage.append_csv(_detail("알파샵", "https://smartstore.naver.com/alpha", when=datetime.now()))
+    assert not storage.append_csv(_detail("알파샵", "https://smartstore.naver.com/alpha", when=datetime.now()))
+    assert storage.get_existing_store_count() == 1
+    checkpoint.visited_count = 13
+    storage.save_checkpoint(checkpoint)
+    storage.close()
+    assert len(list(tmp_path.glob("targets_*.csv"))) == 1
+
+    reopened = _storage(tmp_path, export_csv=False)
+    assert reopened.load_checkpoint().visited_count == 13
+    history = KeywordScheduler(reopened.config, tmp_path, reopened.results).load_history()
+    assert (history["머그컵"].visited, history["머그컵"].saved, history["머그컵"].minutes) == (30, 3, 5.0)
+    reopened.close()
@@ -0,0 +1,120 @@
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from client_discovery import io_backend, ocr_cache, roi_calibration
+from client_discovery.anchor_engine import AnchorEngine
+from client_discovery.m3_detail_reader import DetailCapture, DetailReader
+from client_discovery.models import RunStats
+from client_discovery.roi_calibration import RoiCalibrator, ink_box
+
+ANCHOR = "assets/img/label_interest.png"
+
+
+def _config(tmp_path, **extra):
+    return {
+        "anchors": {"label_interest": ANCHOR},
+        "roi_calibration": {"path": str(tmp_path / "roi_calibration.json"), "min_samples": 1, **extra},
+    }
+
+
+def _detail_frame(anchor_xy=(100, 300)):
+    template = cv2.imread(ANCHOR)
+    rng = np.random.default_rng(1)
+    frame = rng.integers(220, 256, (600, 800, 3), dtype=np.uint8)
+    x, y = anchor_xy
+    height, width = template.shape[:2]
+    frame[y:y + height, x:x + width] = template
+    cv2.putText(frame, "1234", (x + width + 12, y + height - 3), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1)
+    return frame
+
+
+class FrameDesktop:
+    def __init__(self, frame):
+        self.image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+    def screenshot(self, region=None):
+        if not region:
+            return self.image
+        x, y, width, height = region
+        return self.image.crop((x, y, x + width, y + height))
+
+    def size(self):
+        return self.image.size
+
+    def close(self):
+        pass
+
+
+def test_ink_box_finds_dark_text_on_light_background():
+    image = np.full((30, 100, 3), 240, np.uint8)
+    image[10:20, 30:55] = 0
+    assert ink_box(image) == (30, 10, 25, 10)
+    assert ink_box(np.full((10, 10), 255, np.uint8)) is None
+
+
+def test_record_predict_and_persist(tmp_path):
+    calibrator = RoiCalibrator(_config(tmp_path, min_samples=2))
+    layout = "1920x1080"
+    calibrator.record(layout, (100, 300, 80, 20), (190, 302, 30, 14))
+    assert calibrator.predict_anchor_region(layout) is None
+
+    calibrator.record(layout, (104, 300, 80, 20), (194, 302, 30, 14))
+    assert calibrator.predict_anchor_region(layout) == (86, 284, 112, 52)
+    assert calibrator.predict_number_box(layout, (110, 400, 80, 20)) == (194, 396, 42, 26)
+    assert calibrator.predict_anchor_region("1280x720") is None
+
+    calibrator.save()
+    assert RoiCalibrator(_config(tmp_path, min_samples=2)).predict_anchor_region(layout) == (86, 284, 112, 52)
+
+
+def test_detail_reader_learns_tight_number_box(tmp_path, monkeypatch):
+    monkeypatch.setattr(io_backend, "_backend", FrameDesktop(_detail_frame()))
+    monkeypatch.setattr(ocr_cache, "_default_cache", None)
+    monkeypatch.setattr(roi_calibration, "_default_calibrator", None)
+    stats = RunStats()
+    roi_calibration.configure_roi_calibration(_config(tmp_path), stats)
+
+    reader = DetailReader(_config(tmp_path))
+    reader.anchors = AnchorEngine()
+    reader.ocr = SimpleNamespace(available=True)
+    spans = []
+    reader.recognizer.numeric.read_span = lambda roi: spans.append(roi.shape[:2]) or 1234
+
+    # 첫 페이지: 모델이 없어 앵커 옆 기본 숫자 구간으로 읽고 위치를 학습
+    first = reader.capture_detail()
+    assert first.tight_roi is None and first.anchor_box[:2] == (100, 300)
+    assert reader.read_interest_count() == 1234
+
+    # 두 번째 페이지: 학습한 숫자 박스만 OCR
+    second = reader.capture_detail()
+    assert second.tight_roi is not None
+    assert second.tight_roi.size < second.span_roi.size
+    assert reader.read_interest_count() == 1234
+    assert spans[-1] == second.tight_roi.shape[:2]
+
+    assert (stats.interest_ocr_reads, stats.interest_roi_predicted, stats.interest_roi_misses) == (2, 1, 0)
+    assert "미스율 0.0%" in stats.roi_calibration_summary()
+
+
+def test_clipped_predicted_box_falls_back_to_span(tmp_path):
+    reader = DetailReader(_config(tmp_path))
+    recognizer = reader.recognizer
+    recognizer.numeric.read_span = lambda roi: 125 if roi.shape[1] == 40 else 1250
+
+    # 숫자가 기록보다 길어 예측 박스 오른쪽 끝까지 글자가 찬 경우
+    clipped = np.full((20, 40), 255, np.uint8)
+    clipped[5:15, 6:40] = 0
+    span = np.full((20, 120), 255, np.uint8)
+    span[5:15, 10:70] = 0
+    capture = DetailCapture(tight_roi=clipped, tight_origin=(200, 300), span_roi=span, span_origin=(190, 300))
+    reading = recognizer.interest_reading(capture)
+    assert (reading.count, reading.stage, reading.area) == (1250, "span", 20 * 120)
+    assert reading.number_box == (200, 305, 60, 10)
+
+    fits = np.full((20, 40), 255, np.uint8)
+    fits[5:15, 6:30] = 0
+    capture.tight_roi = fits
+    assert recognizer.interest_reading(capture).stage == "predicted"
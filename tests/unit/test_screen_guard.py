@@ -0,0 +1,78 @@
+import numpy as np
+
+from client_discovery.models import RunStats
+from client_discovery.screen_guard import ScreenGuard
+
+
+class _DialogOcr:
+    available = True
+
+    def __init__(self, text=""):
+        self.text = text
+        self.shapes = []
+
+    def image_to_string(self, image, lang):
+        self.shapes.append(image.shape)
+        return self.text
+
+
+class _NoAnchors:
+    def locate(self, *args, **kwargs):
+        return None
+
+
+def _page(value):
+    frame = np.full((400, 600, 3), 255, np.uint8)
+    frame[:60] = value
+    return frame
+
+
+def _guard(ocr, stats, **cfg):
+    return ScreenGuard({"screen_guard": cfg}, stats, ocr=ocr, anchors=_NoAnchors())
+
+
+def test_unchanged_layout_skips_ocr_and_counts_hits():
+    stats = RunStats()
+    ocr = _DialogOcr("상품 목록")
+    guard = _guard(ocr, stats, full_check_every=100)
+
+    assert not any(guard.check(_page(40)) for _ in range(5))
+    assert len(ocr.shapes) == 1
+    assert ocr.shapes[0][:2] == (200, 300)  # 중앙 대화상자 영역만 OCR
+    assert (stats.screen_checks, stats.screen_escalations) == (5, 1)
+    assert len(stats.timings["screen_check"]) == 5
+
+
+def test_layout_change_escalates_and_detects_block_page():
+    stats = RunStats()
+    ocr = _DialogOcr("")
+    guard = _guard(ocr, stats)
+    assert guard.check(_page(40)) is False
+
+    ocr.text = "보안 인증 - 자동입력 방지"
+    captcha = _page(40)
+    captcha[100:300, 150:450] = 0
+    assert guard.check(captcha) is True
+    assert stats.screen_suspicious == 1
+    assert "감지 1회" in stats.summary()
+
+
+def test_full_check_forced_periodically():
+    ocr = _DialogOcr("")
+    guard = _guard(ocr, None, full_check_every=3)
+    for _ in range(7):
+        guard.check(_page(40))
+    assert len(ocr.shapes) == 3
+
+
+def test_reset_drops_previous_keyword_fingerprint():
+    ocr = _DialogOcr("")
+    guard = _guard(ocr, None, full_check_every=100)
+    guard.check(_page(40))
+    guard.check(_page(40))
+    assert len(ocr.shapes) == 1
+
+    # 새 키워드에서는 이전 화면 지문을 믿지 않고 다시 정밀 검사
+    guard.reset()
+    guard.check(_page(40))
+    assert len(ocr.shapes) == 2
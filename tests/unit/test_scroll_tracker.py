@@ -0,0 +1,77 @@
+import cv2
+import numpy as np
+
+from client_discovery import m2_list_scanner
+from client_discovery.m2_list_scanner import ListScanner
+from client_discovery.scroll_tracker import ScrollTracker, estimate_scroll
+
+CONFIG = {"search": {"review_min": 0, "review_max": 10000}, "layout": {"dedupe_threshold_px": 40},
+          "ocr": {"batch_mode": True}}
+
+
+def _page(height=4000, width=1200):
+    rng = np.random.default_rng(7)
+    noise = cv2.GaussianBlur((rng.random((height, width)) * 255).astype(np.uint8), (9, 9), 0)
+    return cv2.cvtColor(noise, cv2.COLOR_GRAY2BGR)
+
+
+PAGE = _page()
+
+
+def _view(top):
+    return PAGE[top:top + 1080].copy()
+
+
+def test_estimate_scroll_recovers_offset():
+    for delta in (0, 120, 400, -250):
+        estimated, response = estimate_scroll(_view(1000), _view(1000 + delta))
+        assert abs(estimated - delta) <= 6
+        assert response > 0.12
+
+
+def test_tracker_accumulates_offset_and_detects_list_end():
+    tracker = ScrollTracker(CONFIG)
+    tracker.observe(_view(0))
+    tracker.expect_scroll()
+    assert abs(tracker.observe(_view(400)) - 400) <= 6
+    assert not tracker.at_list_end
+
+    tracker.expect_scroll()
+    tracker.observe(_view(400))
+    assert tracker.at_list_end
+    assert abs(tracker.offset - 400) <= 12
+
+    # 스크롤하지 않은 재스캔은 목록 끝이 아님
+    tracker.observe(_view(400))
+    assert not tracker.at_list_end
+
+
+def test_scanner_reuses_ocr_for_cards_still_on_screen(monkeypatch):
+    frames = iter([_view(0), _view(400)])
+    monkeypatch.setattr(m2_list_scanner, "grab_screen", lambda: next(frames))
+
+    scanner = ListScanner(CONFIG)
+    # 카드는 페이지 기준 y = 100, 500, 900, 1300 에 고정 (화면 좌표 = 페이지 좌표 - 스크롤)
+    page_rows = [100, 500, 900, 1300]
+    scroll = {"top": 0}
+    monkeypatch.setattr(scanner, "_detect_card_areas", lambda frame: [
+        (200, y - scroll["top"], 320, 300) for y in page_rows if 0 <= y - scroll["top"] <= 1080 - 300
+    ])
+    read = []
+
+    def fake_batch(cards, frame):
+        read.extend(card.y + scroll["top"] for card in cards)
+        return [(f"스토어{card.y + scroll['top']}", 100) for card in cards]
+
+    monkeypatch.setattr(scanner, "_read_cards_batch", fake_batch)
+
+    first = scanner.scan_visible_cards()
+    assert [card.store_name for card in first] == ["스토어100", "스토어500"]
+
+    scanner.expect_scroll()
+    scroll["top"] = 400
+    second = scanner.scan_visible_cards()
+    assert [card.store_name for card in second] == ["스토어500", "스토어900"]
+    # 화면에 남아 있던 카드(페이지 y=500)는 재사용하고 새로 드러난 카드만 OCR
+    assert read == [100, 500, 900]
+    assert not scanner.at_list_end
@@ -0,0 +1,91 @@
+from client_discovery import tab_prefetch
+from client_discovery.models import StoreCard
+from client_discovery.tab_prefetch import TabPrefetcher, same_store
+
+CONFIG = {"pipeline": {"prefetch_tabs": 2, "tab_switch_wait": 0}, "timing": {"load_wait_max": 0}}
+
+
+class FakeBrowser:
+    """Ctrl+클릭/Ctrl+숫자/Ctrl+W를 Chromium 탭 규칙대로 흉내내는 가짜 입출력 백엔드"""
+
+    def __init__(self):
+        self.tabs = ["목록"]
+        self.active = 0
+        self.insert_at = 1
+        self.ctrl = False
+        self.titles = {}
+
+    def key_down(self, key):
+        self.ctrl = True
+
+    def key_up(self, key):
+        self.ctrl = False
+
+    def click(self, x, y):
+        assert self.ctrl and self.active == 0
+        self.tabs.insert(self.insert_at, self.titles[(x, y)])
+        self.insert_at += 1
+
+    def hotkey(self, *keys):
+        if keys[1] == 'w':
+            del self.tabs[self.active]
+            self.active = min(self.active, len(self.tabs) - 1)
+        else:
+            self.active = int(keys[1]) - 1
+        self.insert_at = 1
+
+    def active_window_title(self):
+        return f"{self.tabs[self.active]} : 네이버 스마트스토어 - Chrome"
+
+
+def _card(browser, name, y):
+    browser.titles[(50, y + 10)] = name
+    return StoreCard(x=0, y=y, width=100, height=20, store_name=name, review_count=100)
+
+
+def _setup(monkeypatch):
+    browser = FakeBrowser()
+    monkeypatch.setattr(tab_prefetch, "get_io_backend", lambda: browser)
+    monkeypatch.setattr(tab_prefetch, "active_window_title", browser.active_window_title)
+    monkeypatch.setattr(tab_prefetch, "wait_for_load", lambda *args, **kwargs: 0.0)
+    return browser
+
+
+def test_prefetched_tabs_are_processed_in_open_order(monkeypatch):
+    browser = _setup(monkeypatch)
+    cards = [_card(browser, name, i * 100) for i, name in enumerate(["알파", "베타", "감마", "델타"])]
+    prefetcher = TabPrefetcher(CONFIG)
+
+    seen = []
+    for index, card in enumerate(cards):
+        if not prefetcher.is_open(card):
+            assert prefetcher.open(card)
+        prefetcher.fill(cards[index + 1:], lambda upcoming: upcoming.store_name != "감마")
+        assert len(prefetcher) <= 2
+        if card.store_name == "감마":
+            prefetcher.discard(card)
+            continue
+        assert prefetcher.activate(card)
+        seen.append(browser.tabs[browser.active])
+        prefetcher.close_current()
+        assert browser.active == 0
+
+    assert seen == ["알파", "베타", "델타"]
+    assert browser.tabs == ["목록"]
+    assert len(prefetcher) == 0
+
+
+def test_discard_all_closes_leftover_tabs(monkeypatch):
+    browser = _setup(monkeypatch)
+    prefetcher = TabPrefetcher(CONFIG)
+    prefetcher.fill([_card(browser, "알파", 0), _card(browser, "베타", 100)], lambda card: True)
+    assert browser.tabs == ["목록", "알파", "베타"]
+
+    prefetcher.discard_all()
+    assert browser.tabs == ["목록"] and browser.active == 0
+
+
+def test_disabled_outside_rpa_mode():
+    assert not TabPrefetcher({"pipeline": {"prefetch_tabs": 3}, "backend": {"mode": "playwright"}}).enabled
+    assert not TabPrefetcher({}).enabled
+    assert same_store("알파 상회", "알파상회") and not same_store("알파", "베타")
@@ -0,0 +1,43 @@
+import random
+
+from client_discovery.m4_filter import FilterManager
+from client_discovery.text_matcher import TextMatcher
+
+
+def test_matcher_reports_overlapping_patterns_per_rule():
+    matcher = TextMatcher({"blocklist": ["he", "she", "hers", "HIS", ""], "separator": ["/"]})
+    assert matcher.pattern_count == 5
+    assert matcher.matches("uShers/x") == {"blocklist": ["she", "he", "hers"], "separator": ["/"]}
+    assert matcher.matches("this") == {"blocklist": ["HIS"]}
+    assert matcher.matches("") == {}
+
+
+def test_matcher_agrees_with_substring_loop():
+    rng = random.Random(3)
+    alphabet = "가나다ab"
+    patterns = sorted({"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(60)})
+    matcher = TextMatcher({"blocklist": patterns})
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        expected = {p for p in patterns if p in text}
+        assert set(matcher.matches(text).get("blocklist", [])) == expected
+
+
+def test_filter_rules_rebuilt_on_config_update(tmp_path, monkeypatch):
+    monkeypatch.setattr(FilterManager, "_get_output_file", lambda self: tmp_path / "targets.csv")
+    config = {"output": {"csv_file": "targets_{date}.csv"}, "filters": {}, "blocklist": ["쿠팡"]}
+    manager = FilterManager(config)
+    assert manager.is_blocklisted("쿠팡 공식몰")
+    assert not manager.is_blocklisted("알파샵")
+    assert manager.is_multi_store("알파샵 가격비교")
+
+    config["blocklist"] = ["알파"]
+    config["filters"] = {"multi_store_keywords": ["공동"]}
+    manager.config = config
+    assert manager.is_blocklisted("알파샵")
+    assert not manager.is_blocklisted("쿠팡 공식몰")
+    assert not manager.is_multi_store("알파샵 가격비교")
+    assert manager.match_name_rules("알파 공동구매/특가") == {
+        "blocklist": ["알파"], "multi_store": ["공동"], "separator": ["/"],
+    }
+    manager.close()
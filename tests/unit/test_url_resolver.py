@@ -0,0 +1,50 @@
+from client_discovery import url_resolver
+from client_discovery.models import RunStats
+from client_discovery.url_resolver import UrlResolver, store_name_from_title
+
+
+def test_store_name_from_title_strips_browser_suffix():
+    assert store_name_from_title("알파상회 : 네이버 스마트스토어 - Chrome") == "알파상회"
+    assert store_name_from_title("베타몰 - Microsoft\u200b Edge") == "베타몰"
+    assert store_name_from_title("") is None
+
+
+def test_title_source_uses_known_urls_and_records_timing(monkeypatch, tmp_path):
+    csv_path = tmp_path / "result.csv"
+    csv_path.write_text("store_name,store_url\n알파상회,https://smartstore.naver.com/alpha\n", encoding="utf-8")
+    monkeypatch.setattr(url_resolver, "active_window_title", lambda: "알파상회 : 네이버 스마트스토어 - Chrome")
+
+    stats = RunStats()
+    resolver = UrlResolver({"url_resolver": {"sources": ["title", "clipboard"]}}, stats)
+    assert resolver.load_known_urls(csv_path) == 1
+
+    assert resolver.resolve() == "https://smartstore.naver.com/alpha"
+    assert len(stats.timings["url_title"]) == 1
+    assert "url_clipboard" not in stats.timings
+
+
+def test_falls_back_in_order_and_skips_dead_cdp(monkeypatch):
+    monkeypatch.setattr(url_resolver, "active_window_title", lambda: None)
+    stats = RunStats()
+    resolver = UrlResolver({"url_resolver": {"cdp_endpoint": "http://127.0.0.1:9/json", "cdp_timeout": 0.1}}, stats)
+    clipboard_calls = []
+    resolver._handlers["clipboard"] = lambda name: clipboard_calls.append(name) or "https://smartstore.naver.com/beta"
+
+    assert resolver.resolve("베타몰") == "https://smartstore.naver.com/beta"
+    assert resolver.resolve("베타몰") == "https://smartstore.naver.com/beta"
+    assert clipboard_calls == ["베타몰", "베타몰"]
+    assert not resolver._cdp_available
+    assert len(stats.timings["url_cdp_miss"]) == 2
+    assert len(stats.timings["url_title_miss"]) == 2
+
+
+def test_title_source_ignores_list_name_and_placeholders(monkeypatch):
+    monkeypatch.setattr(url_resolver, "active_window_title", lambda: "베타샵 : 네이버 스마트스토어 - Chrome")
+    resolver = UrlResolver({"url_resolver": {"sources": ["title"]}})
+    resolver.remember("상점_1", "https://smartstore.naver.com/alpha")
+    resolver.remember("알파상회", "https://smartstore.naver.com/alpha")
+    assert "상점_1" not in resolver.known_urls
+
+    # 목록 OCR 이름이 매핑에 있어도 창 제목(베타샵)과 다르면 찾지 않음
+    assert resolver.resolve("알파상회") is None
+    assert resolver.resolve("상점_1") is None
@@ -37,6 +37,8 @@ sys.path.append(str(Path(__file__).parent))
 from core.config import load_config, load_config_data
 from llm.gemini_client import GeminiClient
 from compose.composer import compose_final_email
+from client_discovery.anchor_engine import get_anchor_engine
+from client_discovery.readiness import get_readiness_waiter
 
 
 def _file_organizer_config(config_path: str) -> dict:
@@ -720,7 +722,7 @@ class UltimateAutomationSystem:
 
             # pyautogui 설정
             pyautogui.FAILSAFE = True
-            pyautogui.PAUSE = 1  # 각 동작 사이에 1초 대기
+            pyautogui.PAUSE = 0.1  # 페이지 로딩은 화면 준비 감지로 대기
 
             processed = 0
             failed = 0
@@ -780,11 +782,10 @@ class UltimateAutomationSystem:
 
                         # 현재 탭 닫기
                         pyautogui.hotkey('ctrl', 'w')
-                        time.sleep(2)
 
-                        # 다음 제품 페이지 로딩 대기
+                        # 다음 제품 페이지 로딩 대기 (화면이 안정되면 바로 진행, 최대 5초)
                         self.main_log("⏳ 다음 페이지 로딩 대기...")
-                        time.sleep(3)  # 페이지 로딩 시간
+                        get_readiness_waiter().wait(5.0, label="next_product")
 
                 except Exception as e:
                     failed += 1
@@ -799,7 +800,7 @@ class UltimateAutomationSystem:
                     if i < self.total_products:
                         try:
                             pyautogui.hotkey('ctrl', 'w')
-                            time.sleep(2)
+                            get_readiness_waiter().wait(2.0, label="close_tab")
                         except:
                             pass
                     continue
@@ -875,7 +876,7 @@ class UltimateAutomationSystem:
                     center = pyautogui.center(location)
                     pyautogui.click(center)
                     self.main_log(f"✅ 상세정보 펼쳐보기 완료 (스크롤 {scroll_count + 1}회)")
-                    time.sleep(2)  # 페이지 로딩 대기
+                    get_readiness_waiter().wait(2.0, label="detail_expand")  # 페이지 로딩 대기
                     return True
             except pyautogui.ImageNotFoundException:
                 pass
@@ -927,7 +928,7 @@ class UltimateAutomationSystem:
 
             # 1단계: 크롤링툴 실행
             pyautogui.hotkey('ctrl', 'shift', 'a')
-            time.sleep(3)
+            get_readiness_waiter().wait(3.0, label="crawling_tool")
 
             # 다시 한번 팝업 차단
             self.close_unwanted_popups()
@@ -959,23 +960,21 @@ class UltimateAutomationSystem:
             if not self.automation_running:
                 return False
 
-            try:
-                # 1차: 이미지 인식 시도
-                location = pyautogui.locateOnScreen(button_image, confidence=0.8)
-                if location:
-                    center = pyautogui.center(location)
-                    pyautogui.click(center)
-                    self.main_log(f"✅ 이미지 인식 성공: {Path(button_image).name}")
-                    return True
-
-            except (pyautogui.ImageNotFoundException, FileNotFoundError):
-                # 2차: 절대 좌표 백업 시도 (지시서 요구사항)
-                coord_key = self._get_coord_key_from_image(button_image)
-                if coord_key and coord_key in self.coords:
-                    x, y = self.coords[coord_key]
-                    pyautogui.click(x, y)
-                    self.main_log(f"⚠️ 절대 좌표 사용: {coord_key} ({x}, {y})")
-                    return True
+            # 1차: 이미지 인식 시도 (템플릿 캐시 + 직전 위치 우선 탐색)
+            location = get_anchor_engine().locate(button_image, confidence=0.8)
+            if location:
+                center = pyautogui.center(location)
+                pyautogui.click(center)
+                self.main_log(f"✅ 이미지 인식 성공: {Path(button_image).name}")
+                return True
+
+            # 2차: 절대 좌표 백업 시도 (지시서 요구사항)
+            coord_key = self._get_coord_key_from_image(button_image)
+            if coord_key and coord_key in self.coords:
+                x, y = self.coords[coord_key]
+                pyautogui.click(x, y)
+                self.main_log(f"⚠️ 절대 좌표 사용: {coord_key} ({x}, {y})")
+                return True
 
             time.sleep(1)
 